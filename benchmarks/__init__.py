@@ -0,0 +1,7 @@
+"""
+Performance benchmarks for datatrees.
+
+The benchmarks are plain scripts that can be run with the package importable, e.g.:
+
+    PYTHONPATH=src python -m benchmarks.bench_pickle
+"""
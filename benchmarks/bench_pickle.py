@@ -0,0 +1,91 @@
+"""
+Benchmarks the payload size and pickle round trip time of a deep datatree.
+
+A compact_pickle=True datatree is compared against a tree of plain dataclasses
+holding the same evaluated values, which is what a full object graph pickle of
+the evaluated tree costs. The compact round trip includes re-evaluating the tree
+on the receiving side.
+
+    PYTHONPATH=src python -m benchmarks.bench_pickle --depth 6 --width 3
+"""
+
+import argparse
+from dataclasses import dataclass
+import pickle
+import timeit
+
+from datatrees import datatree, dtfield, Node
+
+
+def make_part(depth: int = 0, width: int = 2, size: float = 1.0, label: str = "part"):
+    return Part(depth=depth, width=width, size=size, label=label)
+
+
+@datatree(compact_pickle=True)
+class Part:
+    """A part containing width sub-parts down to the given depth."""
+
+    depth: int = 0
+    width: int = 2
+    size: float = 1.0
+    label: str = "part"
+    child: Node[make_part] = Node(make_part, "width", "size", "label")
+    children: tuple = dtfield(
+        self_default=lambda self: tuple(
+            self.child(depth=self.depth - 1, size=self.size / 2) for _ in range(self.width)
+        )
+        if self.depth
+        else ()
+    )
+
+
+@dataclass
+class PlainPart:
+    """The evaluated equivalent of Part."""
+
+    depth: int
+    width: int
+    size: float
+    label: str
+    children: tuple
+
+
+def to_plain(part: Part) -> PlainPart:
+    return PlainPart(
+        part.depth, part.width, part.size, part.label, tuple(to_plain(c) for c in part.children)
+    )
+
+
+def count_parts(part: Part) -> int:
+    return 1 + sum(count_parts(c) for c in part.children)
+
+
+def _dumps_time(obj: object, number: int) -> float:
+    return timeit.timeit(lambda: pickle.dumps(obj), number=number) / number
+
+
+def _round_trip_time(obj: object, number: int) -> float:
+    return timeit.timeit(lambda: pickle.loads(pickle.dumps(obj)), number=number) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--width", type=int, default=3)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    part = Part(depth=args.depth, width=args.width)
+    plain = to_plain(part)
+
+    print(f"tree: depth={args.depth} width={args.width} parts={count_parts(part)}")
+    print(f"{'variant':<22}{'payload bytes':>16}{'dumps ms':>12}{'round trip ms':>16}")
+    for name, obj in (("compact datatree", part), ("evaluated dataclasses", plain)):
+        size = len(pickle.dumps(obj))
+        dumps = _dumps_time(obj, args.number)
+        round_trip = _round_trip_time(obj, args.number)
+        print(f"{name:<22}{size:>16}{dumps * 1e3:>12.3f}{round_trip * 1e3:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmarks sending an evaluated datatree to worker processes, pickled with every job
+or as a snapshot in shared memory attached by name.
+
+Each job reads the size of every part. The pickle variant sends the evaluated tree
+(as plain dataclasses, see bench_pickle) with each job, the shared variant sends the
+shared memory block name and reads the snapshot's size column in place.
+
+    PYTHONPATH=src python -m benchmarks.bench_shared --depth 7 --width 3
+"""
+
+import argparse
+import multiprocessing
+import pickle
+import time
+import timeit
+
+from datatrees import Snapshot, snapshot
+
+from .bench_pickle import Part, PlainPart, count_parts, to_plain
+
+
+def _plain_sizes(part: PlainPart) -> float:
+    total, stack = 0.0, [part]
+    while stack:
+        part = stack.pop()
+        total += part.size
+        stack.extend(part.children)
+    return total
+
+
+def pickled_job(part: PlainPart) -> float:
+    return _plain_sizes(part)
+
+
+def shared_job(name: str) -> float:
+    with Snapshot.attach(name) as snap:
+        return sum(snap.tables[f"{Part.__module__}.Part"].column("size"))
+
+
+def _jobs_time(pool, job, arg, jobs: int) -> float:
+    start = time.perf_counter()
+    pool.map(job, [arg] * jobs, chunksize=1)
+    return (time.perf_counter() - start) / jobs
+
+
+def transfer_times(part: Part, jobs: int, processes: int, number: int) -> dict[str, dict[str, float]]:
+    """Returns the payload bytes, per job seconds and in process load seconds of each
+    variant."""
+    plain = to_plain(part)
+    snap = snapshot(part, materialize=False)
+    shm = snap.to_shared_memory()
+    try:
+        data = pickle.dumps(plain)
+        with multiprocessing.Pool(processes) as pool:
+            pool.map(pickled_job, [PlainPart(0, 0, 0.0, "", ())] * processes)  # Warm up.
+            results = {
+                "pickle": {
+                    "bytes": len(data),
+                    "job_s": _jobs_time(pool, pickled_job, plain, jobs),
+                    "load_s": timeit.timeit(lambda: pickle.loads(data), number=number) / number,
+                },
+                "shared": {
+                    "bytes": snap.nbytes,
+                    "job_s": _jobs_time(pool, shared_job, shm.name, jobs),
+                    "load_s": timeit.timeit(lambda: Snapshot.attach(shm.name).close(), number=number)
+                    / number,
+                },
+            }
+    finally:
+        shm.close()
+        shm.unlink()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--depth", type=int, default=7)
+    parser.add_argument("--width", type=int, default=3)
+    parser.add_argument("--jobs", type=int, default=40)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    part = Part(depth=args.depth, width=args.width)
+    results = transfer_times(part, args.jobs, args.processes, args.number)
+
+    print(f"tree: depth={args.depth} width={args.width} parts={count_parts(part)}")
+    print(f"{'variant':<10}{'payload bytes':>16}{'ms per job':>12}{'load ms':>12}")
+    for name, result in results.items():
+        print(
+            f"{name:<10}{result['bytes']:>16}{result['job_s'] * 1e3:>12.3f}"
+            f"{result['load_s'] * 1e3:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
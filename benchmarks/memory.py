@@ -0,0 +1,153 @@
+"""
+Memory per instance of representative datatrees and their dataclass equivalents.
+
+    PYTHONPATH=src python -m benchmarks.memory
+
+Prints the datatrees.sizeof() breakdown of each tree and the bytes retained by
+decorating the synthetic class hierarchies (class level metadata: fields, injected
+field templates, Nodes and generated functions). The same numbers (bytes per tree
+instance and per decorated class) are tracked by the benchmark suite (benchmarks.suite).
+"""
+
+from dataclasses import dataclass, field, replace
+import gc
+import tracemalloc
+from typing import Any, Callable
+
+from datatrees import datatree, dtfield, Node, sizeof
+
+from .synthetic import TreeSpec, class_count, make_plain_tree, make_tree
+
+
+@datatree
+class Hole:
+    radius: float = 1.5
+    depth: float = 4
+
+
+@datatree
+class Plate:
+    """A small part with a few parameters and Node built children, the common case."""
+
+    width: float = 40
+    height: float = 30
+    thickness: float = 3
+    hole: Node[Hole] = Node(Hole, prefix="hole_")
+    holes: list = dtfield(self_default=lambda self: [self.hole() for _ in range(4)])
+
+
+@dataclass
+class PlainHole:
+    radius: float = 1.5
+    depth: float = 4
+
+
+@dataclass
+class PlainPlate:
+    width: float = 40
+    height: float = 30
+    thickness: float = 3
+    hole_radius: float = 1.5
+    hole_depth: float = 4
+    holes: list = field(init=False)
+
+    def __post_init__(self):
+        self.holes = [PlainHole(self.hole_radius, self.hole_depth) for _ in range(4)]
+
+
+@datatree
+class Bracket:
+    """Children receive the parent's BoundNode, i.e. they hold chained BoundNodes."""
+
+    thickness: float = 2
+    plate: Node[Plate] = dtfield(Node(Plate), init=True)
+
+
+@datatree
+class Rack:
+    thickness: float = 2
+    plate: Node[Plate] = Node(Plate)
+    brackets: list = dtfield(
+        self_default=lambda self: [Bracket(plate=self.plate) for _ in range(4)]
+    )
+
+
+def representative_trees(
+    spec: TreeSpec,
+) -> dict[str, tuple[Callable[[], Any], Callable[[], Any] | None]]:
+    """Returns name -> (datatree factory, plain dataclass equivalent or None)."""
+    return {
+        "plate": (Plate, PlainPlate),
+        "rack": (Rack, None),
+        "tree": (make_tree(spec), make_plain_tree(spec)),
+    }
+
+
+def _warm_instance(factory: Callable[[], Any]) -> Any:
+    """Returns an instance created after a few others. CPython's instance __dict__
+    sizes differ for the first instances of a class (before keys are shared)."""
+    for _ in range(3):
+        factory()
+    return factory()
+
+
+def class_bytes_per_class(spec: TreeSpec) -> float:
+    """Returns the bytes retained per class by decorating make_tree(spec)."""
+    make_tree(spec)  # Warms up module level state (e.g. interned strings).
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        clz = make_tree(spec)
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del clz
+    return (after - before) / class_count(spec)
+
+
+def class_specs(spec: TreeSpec) -> dict[str, TreeSpec]:
+    """The synthetic hierarchies measured by class_bytes_per_class()."""
+    return {
+        "tree": spec,
+        # All Nodes map the injected fields with a prefix (or suffix) so every level
+        # injects the fields of all the levels below it.
+        "deep_injection_tree": replace(spec, prefix_density=1.0),
+    }
+
+
+def memory_metrics(spec: TreeSpec) -> list[tuple[str, float, str | None]]:
+    """Returns (name, bytes per tree instance, baseline name) of the representative trees."""
+    result: list[tuple[str, float, str | None]] = []
+    for name, (factory, plain_factory) in representative_trees(spec).items():
+        baseline = None
+        if plain_factory is not None:
+            plain = sizeof(_warm_instance(plain_factory))
+            baseline = f"dataclass_{name}_bytes_per_instance"
+            result.append((baseline, plain.total / plain.instances, None))
+        footprint = sizeof(_warm_instance(factory))
+        result.append(
+            (f"{name}_bytes_per_instance", footprint.total / footprint.instances, baseline)
+        )
+        bookkeeping = footprint.bookkeeping / footprint.instances
+        result.append((f"{name}_bookkeeping_bytes_per_instance", bookkeeping, None))
+    for name, class_spec in class_specs(spec).items():
+        result.append((f"{name}_bytes_per_class", class_bytes_per_class(class_spec), None))
+    return result
+
+
+def main():
+    for name, (factory, plain_factory) in representative_trees(TreeSpec()).items():
+        print(f"== {name}")
+        print(sizeof(_warm_instance(factory)).table())
+        if plain_factory is not None:
+            print(f"-- {name} (dataclass)")
+            print(sizeof(_warm_instance(plain_factory)).table())
+        print()
+    for name, class_spec in class_specs(TreeSpec()).items():
+        print(f"{name}: {class_bytes_per_class(class_spec):.0f} bytes per decorated class")
+
+
+if __name__ == "__main__":
+    main()
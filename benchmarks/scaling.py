@@ -0,0 +1,238 @@
+"""
+Scaling curves of datatree decoration and construction.
+
+Generates synthetic hierarchies (see benchmarks.synthetic) varying one dimension of
+a base TreeSpec at a time and reports, for each point, the decoration time (and the
+time spent in _apply_node_fields and _get_post_init_parameter_map), the peak memory
+allocated while decorating, the construction time and the memory retained by a
+constructed tree.
+
+    PYTHONPATH=src python -m benchmarks.scaling -o scaling.csv
+    PYTHONPATH=src python -m benchmarks.scaling --axis width --axis prefix_density
+    PYTHONPATH=src python -m benchmarks.scaling --plot scaling.png  # Needs matplotlib.
+
+The growth exponent printed for each axis is the slope of log(time) against
+log(value), i.e. about 1 for linear and 2 for quadratic growth along the axis.
+"""
+
+import argparse
+from contextlib import contextmanager
+import csv
+from dataclasses import asdict, dataclass, fields, replace
+import math
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator, Sequence
+
+from datatrees import datatrees as _core
+
+from .synthetic import TreeSpec, class_count, make_tree, node_count
+
+
+# The values of each dimension of TreeSpec.
+AXES: dict[str, tuple[Any, ...]] = {
+    "depth": (1, 2, 3, 4, 5, 6),
+    "width": (1, 2, 3, 4, 6, 8),
+    "fields_per_level": (1, 2, 4, 8, 16, 32, 64),
+    "prefix_density": (0.0, 0.25, 0.5, 0.75, 1.0),
+    "inheritance_depth": (0, 1, 2, 4, 8, 16),
+    "chain_post_init": (False, True),
+}
+
+# Prefix mapping with a wide tree grows as width**depth, keep the base small enough.
+BASE_SPEC = TreeSpec(depth=3, width=4, fields_per_level=8, prefix_density=0.5)
+
+
+@dataclass(frozen=True)
+class ScalingPoint:
+    """The measurements of a single synthetic hierarchy."""
+
+    axis: str
+    value: Any
+    classes: int
+    instances: int
+    root_fields: int
+    decorate_s: float
+    apply_node_fields_s: float
+    post_init_parameter_map_s: float
+    decorate_peak_bytes: int
+    construct_s: float
+    instance_bytes: int
+
+
+@dataclass
+class _PhaseTimes:
+    times: dict[str, float]
+
+
+@contextmanager
+def _phase_timers(names: Sequence[str]) -> Iterator[_PhaseTimes]:
+    """Temporarily wraps the named datatrees module functions to accumulate their time."""
+    result = _PhaseTimes({name: 0.0 for name in names})
+    originals = {name: getattr(_core, name) for name in names}
+
+    def timed(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwds: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwds)
+            finally:
+                result.times[name] += time.perf_counter() - start
+
+        return wrapper
+
+    for name, func in originals.items():
+        setattr(_core, name, timed(name, func))
+    try:
+        yield result
+    finally:
+        for name, func in originals.items():
+            setattr(_core, name, func)
+
+
+def _best(func: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(spec: TreeSpec, axis: str = "", repeat: int = 3) -> ScalingPoint:
+    """Measures decoration and construction of make_tree(spec)."""
+    phases = ("_apply_node_fields", "_get_post_init_parameter_map")
+    decorate_s = float("inf")
+    phase_times: dict[str, float] = {}
+    for _ in range(repeat):
+        with _phase_timers(phases) as timers:
+            start = time.perf_counter()
+            make_tree(spec)
+            elapsed = time.perf_counter() - start
+        if elapsed < decorate_s:
+            decorate_s = elapsed
+            phase_times = timers.times
+
+    tracemalloc.start()
+    try:
+        clz = make_tree(spec)
+        _, decorate_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        instance = clz()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del instance
+
+    return ScalingPoint(
+        axis=axis,
+        value=getattr(spec, axis) if axis else None,
+        classes=class_count(spec),
+        instances=node_count(spec),
+        root_fields=len(clz.__dataclass_fields__),  # type: ignore
+        decorate_s=decorate_s,
+        apply_node_fields_s=phase_times[phases[0]],
+        post_init_parameter_map_s=phase_times[phases[1]],
+        decorate_peak_bytes=decorate_peak,
+        construct_s=_best(clz, repeat),
+        instance_bytes=after - before,
+    )
+
+
+def scaling_curves(
+    base: TreeSpec = BASE_SPEC,
+    axes: Sequence[str] | None = None,
+    repeat: int = 3,
+    values: dict[str, Sequence[Any]] | None = None,
+) -> list[ScalingPoint]:
+    """Measures the points of each axis, varying one TreeSpec field of base at a time."""
+    values = values or AXES
+    result = []
+    for axis in axes or tuple(values.keys()):
+        for value in values[axis]:
+            result.append(measure(replace(base, **{axis: value}), axis, repeat))
+    return result
+
+
+def growth_exponent(points: Sequence[ScalingPoint], metric: str = "decorate_s") -> float:
+    """Returns the least squares slope of log(metric) against log(value) of the points
+    (those with a positive numeric value) or NaN if there are too few of them."""
+    xy = [
+        (math.log(p.value), math.log(getattr(p, metric)))
+        for p in points
+        if not isinstance(p.value, bool) and p.value > 0 and getattr(p, metric) > 0
+    ]
+    if len(xy) < 2:
+        return math.nan
+    mean_x = sum(x for x, _ in xy) / len(xy)
+    mean_y = sum(y for _, y in xy) / len(xy)
+    var = sum((x - mean_x) ** 2 for x, _ in xy)
+    if var == 0:
+        return math.nan
+    return sum((x - mean_x) * (y - mean_y) for x, y in xy) / var
+
+
+def write_csv(points: Sequence[ScalingPoint], out: Any):
+    writer = csv.DictWriter(out, [f.name for f in fields(ScalingPoint)])
+    writer.writeheader()
+    for point in points:
+        writer.writerow(asdict(point))
+
+
+def plot(points: Sequence[ScalingPoint], path: str):
+    """Plots the decoration and construction times of each axis to an image file."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    axes = list(dict.fromkeys(p.axis for p in points))
+    figure, subplots = plt.subplots(1, len(axes), figsize=(4 * len(axes), 3.5), squeeze=False)
+    for subplot, axis in zip(subplots[0], axes):
+        axis_points = [p for p in points if p.axis == axis]
+        xs = [float(p.value) for p in axis_points]
+        for metric in ("decorate_s", "apply_node_fields_s", "construct_s"):
+            subplot.plot(xs, [getattr(p, metric) * 1e3 for p in axis_points], "o-", label=metric)
+        subplot.set_xlabel(axis)
+        subplot.set_ylabel("ms")
+    subplots[0][0].legend()
+    figure.tight_layout()
+    figure.savefig(path)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="datatrees scaling curves.")
+    parser.add_argument("-o", "--output", help="Write the CSV to this file (default stdout).")
+    parser.add_argument("--axis", action="append", choices=tuple(AXES), dest="axes")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--plot", metavar="IMAGE", help="Also plot the curves (matplotlib).")
+    args = parser.parse_args(argv)
+
+    points = scaling_curves(BASE_SPEC, args.axes, args.repeat)
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            write_csv(points, f)
+    else:
+        write_csv(points, sys.stdout)
+
+    for axis in dict.fromkeys(p.axis for p in points):
+        axis_points = [p for p in points if p.axis == axis]
+        exponents = ", ".join(
+            f"{metric}={growth_exponent(axis_points, metric):.2f}"
+            for metric in ("decorate_s", "apply_node_fields_s", "construct_s")
+        )
+        print(f"# {axis}: {exponents}", file=sys.stderr)
+
+    if args.plot:
+        try:
+            plot(points, args.plot)
+        except ImportError:
+            print("matplotlib is required for --plot", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""
+The datatrees benchmark suite.
+
+Measures the hot paths of datatrees on synthetic trees (see benchmarks.synthetic)
+with plain dataclass baselines and writes the results as JSON. The compare command
+fails (exit status 1) when a tracked metric regressed by more than a threshold.
+
+    PYTHONPATH=src python -m benchmarks.suite run -o current.json
+    PYTHONPATH=src python -m benchmarks.suite compare baseline.json current.json -t 0.15
+
+Time metrics are the best time per operation in seconds over a number of repeats.
+Memory metrics (unit "bytes") are the bytes per tree instance given by
+datatrees.sizeof() for the synthetic tree, its BoundNode bookkeeping and a few
+representative trees (see benchmarks.memory). Baseline metrics (names starting with
+"dataclass_") are not tracked. With --relative, tracked metrics having a baseline are
+compared as a ratio to it which makes results from different machines comparable.
+"""
+
+import argparse
+from dataclasses import asdict, dataclass, make_dataclass
+import json
+import platform
+import sys
+import time
+import timeit
+from typing import Any, Callable
+
+import datatrees
+from datatrees import datatree, dtfield, Node
+from datatrees.datatrees import _get_injected_fields
+
+from .memory import memory_metrics
+from .synthetic import TreeSpec, class_count, make_plain_tree, make_tree
+
+
+@dataclass(frozen=True)
+class Metric:
+    """A measured operation. baseline names the metric it is relative to."""
+
+    name: str
+    value: float
+    baseline: str | None = None
+    tracked: bool = True
+    unit: str = "s"
+
+
+def _best_time(func: Callable[[], Any], min_time: float, repeat: int) -> float:
+    """Returns the best time per call of func over repeat runs of at least min_time."""
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        best = min(best, timer.timeit(number) / number)
+    return best
+
+
+def _decoration_time(spec: TreeSpec, repeat: int) -> float:
+    """Returns the best time to decorate the classes of a synthetic tree, per class."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        make_tree(spec)
+        best = min(best, time.perf_counter() - start)
+    return best / class_count(spec)
+
+
+@datatree
+class _Leaf:
+    a: float = 1
+    b: float = 2
+    c: float = 3
+    d: float = 4
+
+
+@datatree
+class _Parent:
+    a: float = 10
+    leaf: Node[_Leaf] = Node(_Leaf)
+
+
+@datatree
+class _SelfDefaults:
+    a: float = 1
+    b: float = dtfield(self_default=lambda self: self.a * 2)
+    c: float = dtfield(self_default=lambda self: self.b * 2)
+    d: float = dtfield(self_default=lambda self: self.c * 2)
+
+
+@datatree(backend=datatrees.slotted)
+class _SlottedSelfDefaults:
+    a: float = 1
+    b: float = dtfield(self_default=lambda self: self.a * 2)
+    c: float = dtfield(self_default=lambda self: self.b * 2)
+    d: float = dtfield(self_default=lambda self: self.c * 2)
+
+
+@dataclass
+class _PlainSelfDefaults:
+    a: float = 1
+
+    def __post_init__(self):
+        self.b = self.a * 2
+        self.c = self.b * 2
+        self.d = self.c * 2
+
+
+def run_suite(spec: TreeSpec, min_time: float = 0.05, repeat: int = 5) -> list[Metric]:
+    """Runs all the benchmarks and returns the metrics."""
+    metrics: list[Metric] = []
+
+    def measure(name: str, func: Callable[[], Any], baseline: str | None = None):
+        tracked = not name.startswith("dataclass_")
+        metrics.append(Metric(name, _best_time(func, min_time, repeat), baseline, tracked))
+
+    metrics.append(Metric("decorate_per_class", _decoration_time(spec, repeat)))
+
+    tree = make_tree(spec)
+    plain_tree = make_plain_tree(spec)
+    measure("dataclass_tree_construct", plain_tree)
+    measure("tree_construct", tree, "dataclass_tree_construct")
+    slotted_tree = make_tree(spec, "Slotted", backend=datatrees.slotted)
+    measure("slotted_tree_construct", slotted_tree, "dataclass_tree_construct")
+
+    plain_flat = make_dataclass("PlainFlat", [("a", float, 1.0), ("b", float, 2.0)])
+    flat = datatree(make_dataclass("Flat", [("a", float, 1.0), ("b", float, 2.0)]))
+    measure("dataclass_construct", plain_flat)
+    measure("construct", flat, "dataclass_construct")
+    slotted_flat = datatree(
+        make_dataclass("SlottedFlat", [("a", float, 1.0), ("b", float, 2.0)]),
+        backend=datatrees.slotted,
+    )
+    measure("slotted_construct", slotted_flat, "dataclass_construct")
+
+    parent = _Parent()
+    measure("dataclass_leaf_construct", lambda: _Leaf(a=10, b=2, c=3, d=4))
+    measure("bound_node_call", parent.leaf, "dataclass_leaf_construct")
+    measure("bound_node_call_with_args", lambda: parent.leaf(b=5), "dataclass_leaf_construct")
+
+    measure("dataclass_post_init_defaults", _PlainSelfDefaults)
+    measure("self_default_construct", _SelfDefaults, "dataclass_post_init_defaults")
+    measure("slotted_self_default_construct", _SlottedSelfDefaults, "dataclass_post_init_defaults")
+
+    frozen_tree = make_tree(spec, "Frozen", frozen=True)
+    cached_tree = make_tree(spec, "CachedHash", frozen=True, cache_hash=True)
+    frozen_cache = {frozen_tree(): 1}
+    cached_cache = {cached_tree(): 1}
+    frozen_key = frozen_tree()
+    cached_key = cached_tree()
+    measure("dict_lookup", lambda: frozen_cache[frozen_key])
+    measure("cached_hash_dict_lookup", lambda: cached_cache[cached_key], "dict_lookup")
+
+    measure("get_injected_fields", lambda: _get_injected_fields(tree))
+    injected = datatrees.get_injected_fields(tree)
+    measure("generate_html_page", lambda: injected.generate_html_page(str))
+
+    instance = tree()
+    data = datatrees.to_dict(instance)
+    measure("dataclass_asdict", lambda: asdict(plain_tree()))
+    measure("to_dict", lambda: datatrees.to_dict(instance))
+    measure("from_dict", lambda: datatrees.from_dict(tree, data), "tree_construct")
+
+    for name, value, baseline in memory_metrics(spec):
+        tracked = not name.startswith("dataclass_")
+        metrics.append(Metric(name, value, baseline, tracked, "bytes"))
+    return metrics
+
+
+def results_json(spec: TreeSpec, metrics: list[Metric]) -> dict[str, Any]:
+    return {
+        "meta": {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "spec": asdict(spec),
+        },
+        "metrics": {m.name: asdict(m) for m in metrics},
+    }
+
+
+@dataclass(frozen=True)
+class Regression:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1
+
+
+def _metric_value(metrics: dict[str, Any], name: str, relative: bool) -> float | None:
+    metric = metrics.get(name, None)
+    if metric is None:
+        return None
+    value = metric["value"]
+    if relative and metric.get("baseline"):
+        baseline = metrics.get(metric["baseline"], None)
+        if baseline is None or baseline["value"] <= 0:
+            return None
+        value /= baseline["value"]
+    return value
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float,
+    relative: bool = False,
+    overrides: dict[str, float] | None = None,
+) -> tuple[list[Regression], list[Regression]]:
+    """Compares the tracked metrics of two results_json() dicts.
+
+    Args:
+      threshold: The allowed fractional increase, e.g. 0.1 allows a 10% slowdown.
+      relative: Compare metrics as a ratio to their baseline metric.
+      overrides: Per metric thresholds.
+    Returns:
+      The (regressions, all compared metrics).
+    """
+    overrides = overrides or {}
+    base_metrics = baseline["metrics"]
+    current_metrics = current["metrics"]
+    compared = []
+    regressions = []
+    for name, metric in current_metrics.items():
+        if not metric.get("tracked", True):
+            continue
+        base_value = _metric_value(base_metrics, name, relative)
+        value = _metric_value(current_metrics, name, relative)
+        if base_value is None or value is None or base_value <= 0:
+            continue
+        entry = Regression(name, base_value, value)
+        compared.append(entry)
+        if entry.change > overrides.get(name, threshold):
+            regressions.append(entry)
+    return regressions, compared
+
+
+def _parse_overrides(values: list[str]) -> dict[str, float]:
+    result = {}
+    for value in values:
+        name, _, threshold = value.partition("=")
+        result[name] = float(threshold)
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="The datatrees benchmark suite.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmarks.")
+    run.add_argument("-o", "--output", help="Write the results JSON to this file.")
+    run.add_argument("--depth", type=int, default=TreeSpec.depth)
+    run.add_argument("--width", type=int, default=TreeSpec.width)
+    run.add_argument("--fields", type=int, default=TreeSpec.fields_per_level)
+    run.add_argument("--min-time", type=float, default=0.05)
+    run.add_argument("--repeat", type=int, default=5)
+
+    compare = commands.add_parser("compare", help="Compare two results files.")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("-t", "--threshold", type=float, default=0.1)
+    compare.add_argument("--relative", action="store_true")
+    compare.add_argument(
+        "--metric-threshold", action="append", default=[], metavar="NAME=THRESHOLD"
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        spec = TreeSpec(args.depth, args.width, args.fields)
+        metrics = run_suite(spec, args.min_time, args.repeat)
+        for m in metrics:
+            if m.unit == "s":
+                print(f"{m.name:<32}{m.value * 1e6:>14.3f} us")
+            else:
+                print(f"{m.name:<32}{m.value:>14.1f} {m.unit}")
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(results_json(spec, metrics), f, indent=2)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    regressions, compared = compare_results(
+        baseline,
+        current,
+        args.threshold,
+        args.relative,
+        _parse_overrides(args.metric_threshold),
+    )
+    for entry in compared:
+        flag = "REGRESSED" if entry in regressions else ""
+        print(f"{entry.name:<32}{entry.change * 100:>+9.1f}%  {flag}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Generation of synthetic datatree class hierarchies for benchmarks.
+
+make_tree() creates a hierarchy of datatree classes of the given depth where each
+non leaf class has width Node fields of the class one level down and every class has
+fields_per_level fields of its own. A "children" self_default builds the whole tree
+on construction. make_plain_tree() creates the equivalent plain dataclass hierarchy
+where each class constructs its children in __post_init__ from explicitly declared
+fields, the hand written version of the same composition.
+"""
+
+from dataclasses import dataclass, field, make_dataclass
+from typing import Any
+
+from datatrees import datatree, dtfield, Node
+
+
+@dataclass(frozen=True)
+class TreeSpec:
+    """The shape of a synthetic tree.
+
+    depth: The number of levels below the root.
+    width: The number of Node fields of each non leaf class.
+    fields_per_level: The number of fields declared by each class.
+    prefix_density: The fraction of the Node fields of each class that map the
+        injected field names with a prefix (or alternately a suffix). Mapped names are
+        distinct so the number of injected fields grows with the number of mapped
+        Nodes. With 1.0 it grows with width**depth.
+    self_defaults: The number of self_default fields of each class.
+    inheritance_depth: The number of datatree base classes each class of the tree
+        derives from (as a single inheritance chain). Each base declares
+        fields_per_level fields of its own.
+    chain_post_init: If True every class (including the bases) has a __post_init__
+        and is decorated with chain_post_init=True.
+    """
+
+    depth: int = 3
+    width: int = 2
+    fields_per_level: int = 4
+    prefix_density: float = 0.0
+    self_defaults: int = 1
+    inheritance_depth: int = 0
+    chain_post_init: bool = False
+
+
+def _level_fields(level: int, spec: TreeSpec) -> list[str]:
+    return [f"f{level}_{i}" for i in range(spec.fields_per_level)]
+
+
+def _self_default(name: str):
+    return lambda self: getattr(self, name) * 2
+
+
+def _build_children(width: int):
+    names = [f"node{i}" for i in range(width)]
+    return lambda self: [getattr(self, name)() for name in names]
+
+
+def _post_init(self):
+    pass
+
+
+def _node(child: type, index: int, spec: TreeSpec) -> Node:
+    if index >= round(spec.prefix_density * spec.width):
+        return Node(child)
+    if index % 2:
+        return Node(child, suffix=f"_n{index}")
+    return Node(child, prefix=f"n{index}_")
+
+
+def _make_bases(
+    level: int, spec: TreeSpec, name: str, datatree_kwds: dict[str, Any]
+) -> tuple[type, ...]:
+    """Returns the bases (a chain of inheritance_depth datatrees) of a tree class."""
+    base = None
+    for k in range(spec.inheritance_depth):
+        namespace: dict[str, Any] = {"__annotations__": {}}
+        for i in range(spec.fields_per_level):
+            namespace["__annotations__"][f"f{level}_b{k}_{i}"] = float
+            namespace[f"f{level}_b{k}_{i}"] = float(level)
+        if spec.chain_post_init:
+            namespace["__post_init__"] = _post_init
+        bases = () if base is None else (base,)
+        base = datatree(
+            type(f"{name}{level}Base{k}", bases, namespace),
+            chain_post_init=spec.chain_post_init,
+            **datatree_kwds,
+        )
+    return () if base is None else (base,)
+
+
+def make_tree(spec: TreeSpec, name: str = "Synthetic", **datatree_kwds: Any) -> type:
+    """Returns the root class of a newly decorated synthetic datatree hierarchy.
+    datatree_kwds are passed to the datatree decorator of every class."""
+    child = None
+    for level in range(spec.depth, -1, -1):
+        fields = _level_fields(level, spec)
+        namespace: dict[str, Any] = {"__annotations__": {}}
+        for field_name in fields:
+            namespace["__annotations__"][field_name] = float
+            namespace[field_name] = float(level)
+        if child is not None:
+            for i in range(spec.width):
+                namespace["__annotations__"][f"node{i}"] = Node[child]
+                namespace[f"node{i}"] = _node(child, i, spec)
+        for i in range(spec.self_defaults):
+            namespace["__annotations__"][f"sd{i}"] = float
+            namespace[f"sd{i}"] = dtfield(self_default=_self_default(fields[i % len(fields)]))
+        if child is not None:
+            namespace["__annotations__"]["children"] = list
+            # Derived from the other fields, not compared (or hashed).
+            namespace["children"] = dtfield(
+                self_default=_build_children(spec.width), compare=False
+            )
+        if spec.chain_post_init:
+            namespace["__post_init__"] = _post_init
+        child = datatree(
+            type(f"{name}{level}", _make_bases(level, spec, name, datatree_kwds), namespace),
+            chain_post_init=spec.chain_post_init,
+            **datatree_kwds,
+        )
+    return child  # type: ignore
+
+
+def _plain_post_init(child: type | None, child_fields: list[str], sources: list[str], width: int):
+    sd_items = [(f"sd{i}", source) for i, source in enumerate(sources)]
+
+    def __post_init__(self):
+        for sd_name, source in sd_items:
+            setattr(self, sd_name, getattr(self, source) * 2)
+        if child is not None:
+            self.children = [
+                child(**{f: getattr(self, f) for f in child_fields}) for _ in range(width)
+            ]
+
+    return __post_init__
+
+
+def make_plain_tree(spec: TreeSpec, name: str = "Plain") -> type:
+    """Returns the root class of the plain dataclass equivalent of make_tree(spec).
+    Only specs without prefix mapping, inheritance or post-init chaining are supported."""
+    if spec.prefix_density or spec.inheritance_depth or spec.chain_post_init:
+        raise ValueError(f"No plain dataclass equivalent for {spec}")
+    child = None
+    all_fields: list[str] = []
+    defaults: dict[str, float] = {}
+    for level in range(spec.depth, -1, -1):
+        fields = _level_fields(level, spec)
+        defaults.update((f, float(level)) for f in fields)
+        child_fields = list(all_fields)
+        all_fields = fields + [f for f in all_fields if f not in fields]
+        sources = [fields[i % len(fields)] for i in range(spec.self_defaults)]
+        child = make_dataclass(
+            f"{name}{level}",
+            [(f, float, field(default=defaults[f])) for f in all_fields],
+            namespace={
+                "__post_init__": _plain_post_init(child, child_fields, sources, spec.width)
+            },
+        )
+    return child  # type: ignore
+
+
+def class_count(spec: TreeSpec) -> int:
+    """The number of classes decorated by make_tree(spec)."""
+    return (spec.depth + 1) * (spec.inheritance_depth + 1)
+
+
+def node_count(spec: TreeSpec) -> int:
+    """The number of tree class instances created by constructing the root."""
+    return sum(spec.width**level for level in range(spec.depth + 1))
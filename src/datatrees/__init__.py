@@ -16,6 +16,9 @@
     field_docs,
     BindingDefault,
     get_injected_fields,
+    aresolve,
+    rebuild,
+    replace,
     _field_assign,
     _PostInitParameter,
     _get_post_init_parameter_map,
@@ -24,6 +27,18 @@
     _apply_node_fields,
     _process_datatree,
 )
+from .diskcache import DiskCache
+from .tracing import trace, Tracer
+from .serialization import to_dict, from_dict
+from .sweep import sweep, SweepResult
+from .footprint import sizeof, Footprint
+from .backends import SlottedBackend, slotted
+from .fingerprints import fingerprint, fingerprint_value
+from .walk import walk
+from .nodegraph import node_graph, NodeGraph, NodeGraphCycle
+from .fanout import NodeArray, NodeMap, BoundNodeArray, BoundNodeMap
+from .snapshot import snapshot, Snapshot
+from .diff import diff, DatatreeDiff, FieldChange, NodeChange
 
 __version__ = "0.1.0"
 __all__ = [
@@ -36,6 +51,36 @@
     "field_docs",
     "BindingDefault",
     "get_injected_fields",
+    "aresolve",
+    "rebuild",
+    "replace",
+    "DiskCache",
+    "trace",
+    "Tracer",
+    "to_dict",
+    "from_dict",
+    "sweep",
+    "SweepResult",
+    "sizeof",
+    "Footprint",
+    "SlottedBackend",
+    "slotted",
+    "fingerprint",
+    "fingerprint_value",
+    "walk",
+    "node_graph",
+    "NodeGraph",
+    "NodeGraphCycle",
+    "NodeArray",
+    "NodeMap",
+    "BoundNodeArray",
+    "BoundNodeMap",
+    "snapshot",
+    "Snapshot",
+    "diff",
+    "DatatreeDiff",
+    "FieldChange",
+    "NodeChange",
     "_PostInitParameter",
     "_field_assign",
     "_get_post_init_parameter_map",
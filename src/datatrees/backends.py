@@ -0,0 +1,198 @@
+"""
+Dataclass backends for the datatree decorator.
+
+A backend is the function creating the dataclass from the class prepared by
+datatree (with the Node injected fields added and the __post_init__ replaced). It is
+called like dataclasses.dataclass, which is the default backend:
+
+    backend(clz, init=..., repr=..., eq=..., order=..., unsafe_hash=..., frozen=...,
+            **{match_args, kw_only, slots, weakref_slot if they differ from the defaults})
+
+and must return a class with the dataclass __dataclass_fields__ and, unless the
+backend sets binds_nodes, an __init__ calling __post_init__ (with the InitVar values)
+like the dataclass generated one. Optional backend attributes:
+
+    slots: True if the backend always creates slotted classes.
+    binds_nodes: True if the generated __init__ binds the Node fields and evaluates the
+        self_default fields itself (see SlottedBackend). The class then also has a
+        __datatree_post_init_chain__ function (or None) calling the user post-init
+        functions, which __init__ is expected to call last.
+
+    @datatree(backend=datatrees.slotted, frozen=True)
+    class Part:
+        ...
+"""
+
+from dataclasses import _FIELD, _FIELD_INITVAR, MISSING, dataclass
+from typing import Any, Callable
+
+from .datatrees import (
+    BindingDefault,
+    DATATREE_SENTIENEL_NAME,
+    Node,
+    POST_INIT_CHAIN_NAME,
+    _bind_node_field,
+    _create_fn,
+    _evaluate_self_defaults,
+)
+
+
+# Marker default of parameters of fields with a default_factory.
+class _HasFactoryType:
+    def __repr__(self) -> str:
+        return "<factory>"
+
+
+_HAS_FACTORY = _HasFactoryType()
+
+
+def _create_init(clz: type, frozen: bool) -> Callable[..., None]:
+    """Generates an __init__ assigning the fields, binding the Node fields, evaluating
+    the self_default fields and calling the post-init chain of a datatree class."""
+    fields = [
+        f
+        for f in clz.__dataclass_fields__.values()  # type: ignore
+        if f._field_type is _FIELD or f._field_type is _FIELD_INITVAR
+    ]
+    local_vars: dict[str, Any] = {
+        "_setattr": object.__setattr__,
+        "_HAS_FACTORY": _HAS_FACTORY,
+        "_bind_node_field": _bind_node_field,
+        "_evaluate_self_defaults": _evaluate_self_defaults,
+    }
+
+    def assign(name: str, value: str) -> str:
+        if frozen:
+            return f"    _setattr(self, {name!r}, {value})"
+        return f"    self.{name} = {value}"
+
+    params: list[str] = []
+    kw_params: list[str] = []
+    body: list[str] = []
+    seen_default = False
+    for f in fields:
+        default_name = f"_dflt_{f.name}"
+        if f.init:
+            if f.default_factory is not MISSING:
+                local_vars[default_name] = f.default_factory
+                param = f"{f.name}=_HAS_FACTORY"
+                value = f"{default_name}() if {f.name} is _HAS_FACTORY else {f.name}"
+            elif f.default is not MISSING:
+                local_vars[default_name] = f.default
+                param = f"{f.name}={default_name}"
+                value = f.name
+            else:
+                param = f.name
+                value = f.name
+            if getattr(f, "kw_only", False):
+                kw_params.append(param)
+            else:
+                if param == f.name and seen_default:
+                    raise TypeError(f"non-default argument {f.name!r} follows default argument")
+                seen_default = seen_default or param != f.name
+                params.append(param)
+        elif f.default_factory is not MISSING:
+            local_vars[default_name] = f.default_factory
+            value = f"{default_name}()"
+        elif f.default is not MISSING:
+            local_vars[default_name] = f.default
+            value = default_name
+        else:
+            continue
+        if f._field_type is _FIELD:
+            body.append(assign(f.name, value))
+
+    # Bind the Node fields. Fields holding their class default Node (the common case)
+    # are bound directly, others are bound like _initialize_node_instances() does.
+    fields_by_name = {f.name: f for f in fields}
+    binding_lines: list[str] = []
+    has_bindings = False
+    nodes = getattr(clz, DATATREE_SENTIENEL_NAME, {})
+    for i, (name, node) in enumerate(nodes.items()):
+        node_name = f"_node_{i}"
+        local_vars[node_name] = node
+        f = fields_by_name.get(name, None)
+        is_default = f is not None and not f.init and f.default is node
+        if is_default and isinstance(node, Node):
+            bound_name = f"_bound_{i}"
+            local_vars[bound_name] = node._bound_node_type()
+            body.append(assign(name, f"{bound_name}(self, {name!r}, {node_name}, {node_name})"))
+        elif is_default and isinstance(node, BindingDefault):
+            binding_lines.append(f"    _bindings.append(({name!r}, {node_name}))")
+            has_bindings = True
+        else:
+            binding_lines.append(f"    _value = self.{name}")
+            binding_lines.append(f"    if _bind_node_field(self, {name!r}, {node_name}, _value):")
+            binding_lines.append(f"        _bindings.append(({name!r}, _value))")
+            has_bindings = True
+
+    if has_bindings:
+        body.append("    _bindings = []")
+        body.extend(binding_lines)
+        body.append("    if _bindings:")
+        body.append("        _evaluate_self_defaults(self, _bindings)")
+
+    chain = clz.__dict__.get(POST_INIT_CHAIN_NAME, None)
+    if chain is not None:
+        local_vars["_chain"] = chain
+        initvars = [f.name for f in fields if f._field_type is _FIELD_INITVAR]
+        body.append(f"    _chain(self{''.join(f', {n}={n}' for n in initvars)})")
+
+    if not body:
+        body.append("    pass")
+    if kw_params:
+        params.append("*")
+        params.extend(kw_params)
+    return _create_fn(
+        "__init__",
+        [f"def __init__({', '.join(['self'] + params)}):"],
+        body,
+        locals=local_vars,
+    )
+
+
+class SlottedBackend:
+    """Creates slotted dataclasses with a generated __init__ that binds the Node fields
+    and evaluates the self_default fields directly, without the __post_init__
+    indirection. Node fields holding their default Node are bound without any checks.
+
+    Differences to the default backend: classes are slotted (instances have no
+    __dict__, so they can't be interned or have attributes other than the fields) and
+    __post_init__ is not called by __init__, the user post-init functions are.
+    """
+
+    slots = True
+    binds_nodes = True
+
+    def __call__(
+        self,
+        clz: type,
+        *,
+        init: bool = True,
+        repr: bool = True,
+        eq: bool = True,
+        order: bool = False,
+        unsafe_hash: bool = False,
+        frozen: bool = False,
+        **kwds: Any,
+    ) -> type:
+        kwds["slots"] = True
+        result = dataclass(  # type: ignore
+            clz,
+            init=False,
+            repr=repr,
+            eq=eq,
+            order=order,
+            unsafe_hash=unsafe_hash,
+            frozen=frozen,
+            **kwds,
+        )
+        if init:
+            init_func = _create_init(result, frozen)
+            init_func.__qualname__ = f"{result.__qualname__}.__init__"
+            result.__init__ = init_func  # type: ignore
+        return result
+
+
+# The slotted backend, @datatree(backend=datatrees.slotted).
+slotted = SlottedBackend()
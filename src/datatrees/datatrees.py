@@ -127,6 +127,9 @@ class B:
 
 """
 
+import asyncio
+from concurrent.futures import Executor, wait as _wait_futures
+import contextvars
 import copy
 from dataclasses import (
     dataclass,
@@ -134,10 +137,13 @@ class B:
     Field,
     InitVar,
     MISSING,
+    _FIELD,
     _FIELD_INITVAR,
 )
 from functools import wraps
 import sys
+import types
+import weakref
 from typing import (
     List,
     Dict,
@@ -152,11 +158,14 @@ class B:
     TYPE_CHECKING,
     Iterable,
     Mapping,
+    Sequence,
 )
 
 from frozendict import frozendict
 import inspect
+import keyword
 import builtins
+import dis
 import re
 from abc import ABC, abstractmethod
 
@@ -177,10 +186,15 @@ def get_type_hints(clz: type, localns: dict[str, Any] | None = None, globalns: d
 
 FIELD_FIELD_NAMES = tuple(inspect.signature(field).parameters.keys())
 DATATREE_SENTIENEL_NAME = "__datatree_nodes__"
+DATATREE_INJECTED_NAME = "__datatree_injected__"  # Names of fields added by Node mappings.
 OVERRIDE_FIELD_NAME = "override"  # Deprecated feature.
 METADATA_DOCS_NAME = "dt_docs"
 ORIGINAL_POST_INIT_NAME = "__original_post_init__"  # User provided post_init renamed to this.
+# The post-init chain without Node binding, for backends generating their own __init__.
+POST_INIT_CHAIN_NAME = "__datatree_post_init_chain__"
 DATATREE_POST_INIT_SENTIENEL_NAME = "__is_datatree_override_post_init__"
+# The self_default_executor of a datatree class.
+SELF_DEFAULT_EXECUTOR_NAME = "__datatree_self_default_executor__"
 
 _T = TypeVar("_T")  # Generic type variable for Node[T] fields.
 
@@ -217,6 +231,22 @@ class NodeHasNoClzOrFunc(Exception):
     """The Node specified has no clz_or_func parameter and the Node[T] type T is not specified."""
 
 
+class InvalidInternOptions(Exception):
+    """Interning requires frozen=True, slots=False and no InitVar fields."""
+
+
+class InvalidCacheHashOptions(Exception):
+    """Hash caching requires frozen=True, eq=True and slots=False."""
+
+
+class InvalidCompactPickleOptions(Exception):
+    """Compact pickling requires a class without InitVar fields."""
+
+
+class InvalidDiskCacheOptions(Exception):
+    """Disk cached datatree class targets with Node fields require compact_pickle=True."""
+
+
 class _OrderedSet(OrderedSet[Any]):
     def union(self, *others: Iterable[Any]) -> "_OrderedSet":
         result = _OrderedSet(self)
@@ -265,10 +295,32 @@ def _dupes_and_allset(itr: Iterable[Any]) -> tuple[_OrderedSet, _OrderedSet]:
     return dupes, seen
 
 
+# AnnotationDetails of the parameters of Node targets, see Node._shared_anno_detail.
+_ANNO_DETAILS: "weakref.WeakKeyDictionary[Any, dict[Any, dict[str, Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Signatures of Node targets, shared by all the Nodes of a target.
+_SIGNATURES: "weakref.WeakKeyDictionary[Any, inspect.Signature]" = weakref.WeakKeyDictionary()
+
+
+def _get_signature(clz_or_func: Any) -> inspect.Signature:
+    """Returns the (cached) inspect.signature() of a Node target."""
+    try:
+        signature = _SIGNATURES.get(clz_or_func, None)
+    except TypeError:  # Not weak referenceable or hashable.
+        return inspect.signature(clz_or_func)
+    if signature is None:
+        signature = _SIGNATURES[clz_or_func] = inspect.signature(clz_or_func)
+    return signature
+
+
 @dataclass
 class AnnotationDetails:
     """A dataclass/annotation pair."""
 
+    __slots__ = ("field", "anno_type")
+
     field: object
     anno_type: type
 
@@ -345,6 +397,13 @@ class BindingDefault(Generic[_T]):
     (self) as the first parameter."""
 
     self_default: Callable[[Any], _T]
+    # The names of the fields self_default reads, None to detect them from its code.
+    depends_on: frozenset[str] | None = None
+    is_async: bool = field(init=False, compare=False)
+
+    def __post_init__(self):
+        # async self_default functions are left pending until aresolve() is awaited.
+        _field_assign(self, "is_async", inspect.iscoroutinefunction(self.self_default))
 
     def __repr__(self):
         return f"{self.__class__.__name__}({_get_abbreviated_source(self.self_default)})"
@@ -373,6 +432,7 @@ def dtfield(
     self_default: Callable[[Any], Any] | None = None,
     init: bool | object = MISSING,
     default_factory: Callable[[Any], Any] | None = MISSING,  # type: ignore
+    depends_on: Iterable[str] | None = None,
     **kwargs: Any,
 ) -> Any:
     """Like dataclasses.field but also supports doc parameter.
@@ -380,6 +440,8 @@ def dtfield(
       default: The default value for the field.
       doc: A docstring associated with the field.
       self_default: A default factory taking a self parameter.
+      depends_on: The names of the fields (including Node and other self_default
+        fields) self_default reads. If None these are detected from its code.
       Includes all fields allowed by dataclasses.field().
     """
     metadata = kwargs.pop("metadata", {})
@@ -392,7 +454,11 @@ def dtfield(
             raise SpecifiedMultipleDefaults(
                 "Can only specify one of default, default_factory or self_default."
             )
-        default = BindingDefault(self_default)
+        default = BindingDefault(
+            self_default, None if depends_on is None else frozenset(depends_on)
+        )
+    elif depends_on is not None:
+        raise ValueError("depends_on can only be specified with self_default.")
 
     if init is MISSING:
         # Don't make self_default and Node fields init by self_default.
@@ -444,6 +510,7 @@ class Node(Generic[_T]):
     expose_rev_map: dict[str, Any] = field(default_factory=dict, repr=False)
     node_doc: str | None = dtfield(None, doc="Field documentation.")
     default_if_missing: Any = field(default=MISSING_PARAM)
+    disk_cache: Any = field(default=None, repr=False, compare=False)
     expose_spec: list[str | dict[str, str]] = field(default_factory=list, repr=False)
     anno_getter: 'AnnotationsAccessor' = field(default_factory=lambda: AnnotationsAccessor(), repr=False)
 
@@ -469,6 +536,7 @@ def __init__(
         exclude: set[str] = set(),
         node_doc: str | None = None,
         default_if_missing: Any = MISSING_PARAM,
+        disk_cache: Any = None,
     ):
         """Initialize a Node instance for parameter binding.
 
@@ -495,6 +563,9 @@ def __init__(
                 no default value. Defaults to MISSING_PARAM. Usually set this to None to
                 as a generic not set value cut some other application specific value can
                 be used. TODO Maybe add type specific default_if_missing values.
+            disk_cache (DiskCache, optional): A persistent store (see datatrees.DiskCache)
+                for the results of calling the bound node. A datatree class with Node
+                fields must be compact_pickle=True to be stored. Defaults to None.
         """
         if preserve is None:
             preserve = self.DEFAULT_PRESERVE_SET
@@ -524,7 +595,8 @@ def __init__(
         _field_assign(self, "expose_if_avail", expose_if_avail)
         _field_assign(self, "exclude", exclude)
         _field_assign(self, "default_if_missing", default_if_missing)
-        _field_assign(self, "anno_getter", AnnotationsAccessor())
+        _field_assign(self, "disk_cache", disk_cache)
+        _field_assign(self, "anno_getter", _SHARED_ANNOTATIONS)
         if clz_or_func:
             self._initialize_node(self.anno_getter, clz_or_func)
 
@@ -545,7 +617,22 @@ def _initialize_node(
         if self.init_signature is not None:
             return
 
-        _field_assign(self, "init_signature", inspect.signature(clz_or_func))
+        _field_assign(self, "init_signature", _get_signature(clz_or_func))
+
+        # The BoundNode fields of results can only be pickled by compact pickling.
+        if (
+            self.disk_cache is not None
+            and isinstance(clz_or_func, type)
+            and any(
+                isinstance(n, Node)
+                for n in getattr(clz_or_func, DATATREE_SENTIENEL_NAME, {}).values()
+            )
+            and getattr(clz_or_func, "__reduce__", None) is not _reduce_datatree
+        ):
+            raise InvalidDiskCacheOptions(
+                f"Class {clz_or_func.__name__} has Node fields, it requires "
+                "compact_pickle=True to be disk cached"
+            )
 
         _field_assign(self, "clz_or_func", _ClzOrFuncWrapper(clz_or_func))
         fields_specified = tuple(f for f in self.expose_spec if isinstance(f, str))
@@ -582,18 +669,14 @@ def _initialize_node(
                 if from_id in self.preserve:
                     to_id = from_id
                 else:
-                    to_id = self.prefix + from_id + self.suffix
+                    to_id = sys.intern(self.prefix + from_id + self.suffix)
                 if from_id not in init_fields:
                     raise MappedFieldNameNotFound(
                         f'Field name "{from_id}" is not an '
                         f"{clz_or_func.__name__}.__init__ parameter name"
                     )
                 _update_name_map(clz_or_func, expose_dict, from_id, to_id, "Field name")
-                anno_detail = self.make_anno_detail(
-                    from_id,
-                    clz_or_func.__dataclass_fields__[from_id],
-                    anno_getter.get_annotations(clz_or_func),
-                )
+                anno_detail = self._shared_anno_detail(anno_getter, clz_or_func, from_id)
                 _update_name_multi_map(clz_or_func, expose_rev_dict, to_id, anno_detail)
 
             for map_specified in maps_specified:
@@ -605,22 +688,18 @@ def _initialize_node(
                             f"is not an {clz_or_func.__name__}.__init__ parameter name"
                         )
                     _update_name_map(clz_or_func, expose_dict, from_id, to_id, "Field name")
-                    anno_detail = self.make_anno_detail(
-                        from_id,
-                        clz_or_func.__dataclass_fields__[from_id],
-                        anno_getter.get_annotations(clz_or_func),
-                    )
+                    anno_detail = self._shared_anno_detail(anno_getter, clz_or_func, from_id)
                     _update_name_multi_map(clz_or_func, expose_rev_dict, to_id, anno_detail)
         else:  # Not a dataclass type, can be a function.
             for from_id in fields_specified:
-                to_id = self.prefix + from_id + self.suffix
+                to_id = sys.intern(self.prefix + from_id + self.suffix)
                 if from_id not in init_fields:
                     raise MappedFieldNameNotFound(
                         f'Field name "{from_id}" is not an '
                         f"{clz_or_func.__name__}.__init__ parameter name"
                     )
                 _update_name_map(clz_or_func, expose_dict, from_id, to_id, "Field name")
-                anno_detail = AnnotationDetails.from_init_param(from_id, params)
+                anno_detail = self._shared_anno_detail(anno_getter, clz_or_func, from_id)
                 _update_name_multi_map(clz_or_func, expose_rev_dict, to_id, anno_detail)
 
             for map_specified in maps_specified:
@@ -632,12 +711,38 @@ def _initialize_node(
                             f"is not an {clz_or_func.__name__}.__init__ parameter name"
                         )
                     _update_name_map(clz_or_func, expose_dict, from_id, to_id, "Field name")
-                    anno_detail = AnnotationDetails.from_init_param(from_id, params)
+                    anno_detail = self._shared_anno_detail(anno_getter, clz_or_func, from_id)
                     _update_name_multi_map(clz_or_func, expose_rev_dict, to_id, anno_detail)
 
         _field_assign(self, "expose_map", frozendict(expose_dict))
         _field_assign(self, "expose_rev_map", frozendict(expose_rev_dict))
 
+    def _shared_anno_detail(
+        self, anno_getter: 'AnnotationsAccessor', clz_or_func: Any, from_id: str
+    ) -> AnnotationDetails:
+        """Returns the AnnotationDetails of a parameter of clz_or_func, shared by the
+        Nodes of the same type and default_if_missing targeting clz_or_func."""
+        try:
+            by_node_type = _ANNO_DETAILS.get(clz_or_func, None)
+            if by_node_type is None:
+                by_node_type = _ANNO_DETAILS[clz_or_func] = {}
+            details = by_node_type.setdefault((type(self), self.default_if_missing), {})
+            result = details.get(from_id, None)
+        except TypeError:  # Not weak referenceable or hashable.
+            details = result = None
+        if result is None:
+            if hasattr(clz_or_func, "__dataclass_fields__"):
+                result = self.make_anno_detail(
+                    from_id,
+                    clz_or_func.__dataclass_fields__[from_id],
+                    anno_getter.get_annotations(clz_or_func),
+                )
+            else:
+                result = AnnotationDetails.from_init_param(from_id, self.init_signature.parameters)
+            if details is not None:
+                details[from_id] = result
+        return result
+
     def make_anno_detail(self, from_id: str, dataclass_field: Field, annotations: dict[str, Any]):
         if self.default_if_missing is not MISSING_PARAM:
             if dataclass_field.default is MISSING and dataclass_field.default_factory is MISSING:
@@ -671,12 +776,54 @@ def get_rev_map(self) -> dict[str, Any]:
     def get_map(self) -> dict[str, Any]:
         return self.expose_map
 
+    def _bound_node_type(self) -> type["BoundNode[_T]"]:
+        """The BoundNode class that fields with this Node are bound to."""
+        return BoundNode
+
+    def _depends_on(self) -> frozenset[str]:
+        """The names of the parent fields the results of the bound node depend on."""
+        return frozenset(self.expose_map.values())
+
+    def _get_binder(self) -> Callable[[Any], dict[str, Any]]:
+        """Returns the function resolving the arguments of a call without arguments
+        from the parent's field values. It's generated on first use."""
+        binder = self.__dict__.get("_binder", None)
+        if binder is None:
+            binder = _create_binder(self.expose_map)
+            _field_assign(self, "_binder", binder)
+        return binder
+
     def __call__(self, *args: Any, **kwargs: Any) -> _T:
         # This is a type specifier, not a callable.
         # These entries are transformed into BoundNode instances at initialization.
         assert False, "Node.__call__ should not be called, this is a type specifier."
 
 
+# Interned field metadata objects and metadata dicts shared by the injected fields.
+_INTERNED_METADATA: dict[Any, Any] = {}
+
+
+def _intern_metadata(metadata: _T) -> _T:
+    """Returns the interned equal (hashable) metadata object."""
+    try:
+        return _INTERNED_METADATA.setdefault(metadata, metadata)
+    except TypeError:
+        return metadata
+
+
+def _intern_metadata_dict(metadata: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Returns a shared dict equal to metadata if its values are hashable. The
+    dataclass Field wraps it in a read-only mappingproxy."""
+    try:
+        key = ("dict",) + tuple(metadata.items())
+        result = _INTERNED_METADATA.get(key, None)
+        if result is None:
+            result = _INTERNED_METADATA[key] = dict(metadata)
+        return result
+    except TypeError:
+        return metadata
+
+
 def _make_dataclass_field(
     field_obj: Field[_T], use_default: bool, node_doc: str | None
 ) -> tuple[Field[_T], Node[_T] | None]:
@@ -689,13 +836,20 @@ def _make_dataclass_field(
     """
     value_map = dict((name, getattr(field_obj, name)) for name in FIELD_FIELD_NAMES)
 
-    # Fix docs in the metadata.
+    # Fix docs in the metadata. Without a node_doc the docs are unchanged.
     metadata = value_map.get("metadata", None)
     metadata_docs = None if metadata is None else metadata.get(METADATA_DOCS_NAME, None)
-    if metadata_docs:
-        new_metadata = {METADATA_DOCS_NAME: NodeFieldMetadata(node_doc, metadata_docs)}
+    if metadata_docs and node_doc is not None:
+        new_metadata = {
+            METADATA_DOCS_NAME: _intern_metadata(NodeFieldMetadata(node_doc, metadata_docs))
+        }
         new_metadata.update((k, v) for k, v in metadata.items() if k != METADATA_DOCS_NAME)
-        value_map["metadata"] = new_metadata
+        value_map["metadata"] = _intern_metadata_dict(new_metadata)
+    elif metadata:
+        value_map["metadata"] = _intern_metadata_dict(metadata)
+    else:
+        # Rather than wrapping the empty mappingproxy in another one.
+        value_map["metadata"] = None
 
     default_val = value_map["default"]
     if isinstance(default_val, Node):
@@ -954,6 +1108,7 @@ def _apply_node_fields(anno_getter: 'AnnotationsAccessor', clz: type) -> type:
     # Here we maintain the same order of the original with the new exposed/injected fields
     # interspersed between the Node annotated fields.
     nodes = {}
+    injected = set()
     for name, anno in annotations.items():
         # Skip ClassVar fields - they should not be processed as Node fields or have injections
         if _is_classvar(anno):
@@ -1004,6 +1159,7 @@ def _apply_node_fields(anno_getter: 'AnnotationsAccessor', clz: type) -> type:
                 anno_detail = anno_detail_tuple[0]
                 if rev_map_name not in new_annos:
                     new_annos[rev_map_name] = anno_detail.anno_type
+                    injected.add(rev_map_name)
                     if not hasattr(clz, rev_map_name):
                         field_default, node_default = _make_dataclass_field(
                             anno_detail.field, anno_default.use_defaults, anno_default.node_doc
@@ -1041,13 +1197,24 @@ def _apply_node_fields(anno_getter: 'AnnotationsAccessor', clz: type) -> type:
         for name, val in bnodes.items():
             if name not in nodes:
                 nodes[name] = val
+        injected.update(bclz.__dict__.get(DATATREE_INJECTED_NAME, ()))
 
     setattr(clz, DATATREE_SENTIENEL_NAME, nodes)
+    setattr(clz, DATATREE_INJECTED_NAME, frozenset(injected))
     return clz
 
 
 _Node = Node
 
+# The active datatrees.tracing.Tracer, if any. Set by datatrees.trace().
+_TRACER: Any = None
+
+# Results of BoundNode calls keyed by the factory and its resolved arguments.
+# Set while evaluating a datatrees.sweep().
+_FACTORY_MEMO: contextvars.ContextVar[dict[Any, Any] | None] = contextvars.ContextVar(
+    "_FACTORY_MEMO", default=None
+)
+
 
 @dataclass(frozen=True, repr=False)
 class BoundNode(Generic[_T]):
@@ -1061,10 +1228,41 @@ class BoundNode(Generic[_T]):
     chained_node: object = field(default=None, repr=False, compare=False)
 
     def chain(self, new_parent, node) -> "BoundNode[_T]":
-        return BoundNode(new_parent, self.name, self.node, node, self)
+        return type(self)(new_parent, self.name, self.node, node, self)
 
     def __call__(self, *args: Any, **kwargs: Any) -> _T:
-        return self._invoke(self, self.node.clz_or_func.clz_or_func, args, kwargs)
+        parent = self.parent
+        if args or kwargs or getattr(parent, OVERRIDE_FIELD_NAME, None):
+            return self._invoke(self, self.node.clz_or_func.clz_or_func, args, kwargs)
+        # Fast path, the arguments are just the parent's field values.
+        node = self.node
+        binder = node.__dict__.get("_binder", None) or node._get_binder()
+        clz_or_func = node.clz_or_func.clz_or_func
+        if _TRACER is None and node.disk_cache is None and _FACTORY_MEMO.get() is None:
+            return clz_or_func(**binder(parent))
+        return self._call_resolved(self, clz_or_func, binder(parent))
+
+    def _materialize(self) -> Any:
+        """Returns the value a walk() with materialize=True yields for this field."""
+        return self()
+
+    def _materialize_params(self) -> Iterable[str]:
+        """The factory parameters given values when materializing."""
+        return self.node.expose_map
+
+    def _can_materialize(self) -> bool:
+        """Returns False if calling this without arguments must fail since the factory
+        has required parameters not bound to the parent's fields."""
+        factory = self.node.clz_or_func.clz_or_func
+        try:
+            signature = _get_signature(factory)
+        except (TypeError, ValueError):  # Not introspectable, assume it can be called.
+            return True
+        try:
+            signature.bind(**dict.fromkeys(self._materialize_params()))
+        except TypeError:
+            return False
+        return True
 
     def call_with(self, clz_or_func, *args, **kwds) -> _T:
         return self._invoke(self, clz_or_func, args, kwds)
@@ -1072,8 +1270,27 @@ def call_with(self, clz_or_func, *args, **kwds) -> _T:
     def call_with_alt_defaults(self, clz_or_func, *args, alt_defaults=None, **kwds) -> _T:
         return self._invoke(self, clz_or_func, args, kwds, alt_defaults)
 
+    async def acall(self, *args: Any, **kwargs: Any) -> _T:
+        """Like calling the BoundNode but awaits the result of async factories and
+        resolves any pending async self_default fields of the resulting instance."""
+        result = self(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        if _pending_self_defaults(result):
+            await aresolve(result)
+        return result
+
     @classmethod
     def _invoke(cls, node, clz_or_func, args, kwds, alt_defaults=None) -> _T:
+        clz_or_func, ovrde_bind = cls._resolve(node, clz_or_func, args, kwds, alt_defaults)
+        return cls._call_resolved(node, clz_or_func, ovrde_bind)
+
+    @staticmethod
+    def _resolve(node, clz_or_func, args, kwds, alt_defaults=None) -> tuple[Any, dict[str, Any]]:
+        """Returns the factory to call (which an override may replace) and its arguments."""
+        if not args and not kwds and alt_defaults is None:
+            if not getattr(node.parent, OVERRIDE_FIELD_NAME, None):
+                return clz_or_func, node.node._get_binder()(node.parent)
         # Resolve parameter values.
         # Priority order:
         # 1. Override (if any)
@@ -1113,11 +1330,89 @@ def _invoke(cls, node, clz_or_func, args, kwds, alt_defaults=None) -> _T:
                     val = getattr(alt_defaults, to)
                 ovrde_bind[fr] = val
 
+        return clz_or_func, ovrde_bind
+
+    @classmethod
+    def _call_resolved(cls, node, clz_or_func, ovrde_bind) -> _T:
+        tracer = _TRACER
+        if tracer is not None:
+            tracer.enter(type(node.parent), node.name, len(ovrde_bind))
+            try:
+                return cls._call_factory(node, clz_or_func, ovrde_bind)
+            finally:
+                tracer.exit(clz_or_func)
+        return cls._call_factory(node, clz_or_func, ovrde_bind)
+
+    @staticmethod
+    def _call_factory(node, clz_or_func, ovrde_bind) -> _T:
+        memo = _FACTORY_MEMO.get()
+        if memo is not None:
+            try:
+                # Equal values of different types (1, 1.0, True) may give different results.
+                key = (clz_or_func, frozenset((k, type(v), v) for k, v in ovrde_bind.items()))
+                return memo[key]
+            except KeyError:
+                result = memo[key] = BoundNode._call_factory_uncached(
+                    node, clz_or_func, ovrde_bind
+                )
+                return result
+            except TypeError:
+                pass  # Unhashable arguments are not memoized.
+        return BoundNode._call_factory_uncached(node, clz_or_func, ovrde_bind)
+
+    @staticmethod
+    def _call_factory_uncached(node, clz_or_func, ovrde_bind) -> _T:
+        disk_cache = node.node.disk_cache
+        if disk_cache is not None:
+            return disk_cache.call(clz_or_func, ovrde_bind)
         return clz_or_func(**ovrde_bind)
 
     def __repr__(self) -> str:
         return f"BoundNode(node={repr(self.node)})"
 
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # A BoundNode of a compact pickled parent is recreated by the parent's
+        # constructor so only the reference to the parent field is needed.
+        if getattr(type(self.parent), "__reduce__", None) is _reduce_datatree:
+            return _rebuild_bound_node, (self.parent, self.name)
+        return super().__reduce_ex__(protocol)
+
+
+def _rebuild_bound_node(parent: object, name: str) -> BoundNode[Any]:
+    """Unpickles a BoundNode by fetching it from its (reconstructed) parent."""
+    return getattr(parent, name)
+
+
+def _init_field_values(obj: object) -> dict[str, Any]:
+    """Returns the init field values of a datatree instance, sufficient to
+    reconstruct it by calling its class. BoundNode values are unwrapped to the
+    value originally passed to the constructor so that reconstruction binds them
+    to the new instance instead of chaining them."""
+    values: dict[str, Any] = {}
+    for f in obj.__dataclass_fields__.values():  # type: ignore
+        if not f.init or f._field_type is not _FIELD:
+            continue
+        value = getattr(obj, f.name)
+        if isinstance(value, BoundNode):
+            if value.chained_node is not None:
+                value = value.chained_node
+            elif value.instance_node is f.default:
+                continue
+            else:
+                value = value.instance_node
+        values[f.name] = value
+    return values
+
+
+def _rebuild_datatree(clz: type[_T], kwds: dict[str, Any]) -> _T:
+    """Unpickles a compact pickled datatree instance."""
+    return clz(**kwds)
+
+
+def _reduce_datatree(self: object) -> tuple[Any, ...]:
+    """The __reduce__ method for datatree classes with compact_pickle=True."""
+    return _rebuild_datatree, (self.__class__, _init_field_values(self))
+
 
 @dataclass
 class Exposures:
@@ -1151,35 +1446,560 @@ def dtargs(*arg: Any, clazz: type | None = None, **kwds: Any) -> Args:
     return Args(arg, kwds, clazz=clazz)
 
 
+def _create_binder(expose_map: Mapping[str, str]) -> Callable[[Any], dict[str, Any]]:
+    """Generates a function returning {parameter: parent field value} for expose_map."""
+    items = []
+    for fr, to in expose_map.items():
+        if to.isidentifier() and not keyword.iskeyword(to):
+            value = f"parent.{to}"
+        else:
+            value = f"_getattr(parent, {to!r})"
+        items.append(f"{fr!r}: {value}")
+    return _create_fn(
+        "_bind",
+        ["def _bind(parent):"],
+        [f"    return {{{', '.join(items)}}}"],
+        locals={"_getattr": getattr},
+    )
+
+
+def _bind_node_field(instance: object, name: str, node: Any, cur_value: Any) -> bool:
+    """Binds the value of a Node field of instance. Returns True if the value is a
+    BindingDefault to be evaluated once all the Node fields are bound."""
+    # The cur-value may contain args specifically for this node.
+    if isinstance(cur_value, BoundNode):
+        if cur_value.node is node:
+            # A BoundNode of another instance of this class (e.g. from replace()).
+            # Rebind it rather than growing a chain of BoundNodes.
+            field_value = node._bound_node_type()(
+                instance, name, node, cur_value.instance_node, cur_value.chained_node
+            )
+        else:
+            field_value = cur_value.chain(instance, node)
+    elif isinstance(cur_value, Node):
+        field_value = node._bound_node_type()(instance, name, node, cur_value)
+    elif isinstance(cur_value, BindingDefault):
+        return True
+    else:
+        # Parent node has passed something other than a Node or a chained BoundNode.
+        # Assume they just want to have it called.
+        return False
+    _field_assign(instance, name, field_value)
+    return False
+
+
 def _initialize_node_instances(clz: type, instance: object):
     """Post dataclass initialization binding of nodes to instance."""
     nodes = getattr(clz, DATATREE_SENTIENEL_NAME)
 
     bindings: list[tuple[str, "BindingDefault[Any]"]] = []
     for name, node in nodes.items():
-        # The cur-value may contain args specifically for this node.
         cur_value = getattr(instance, name)
-        if isinstance(cur_value, BoundNode):
-            field_value = cur_value.chain(instance, node)
-        elif isinstance(cur_value, Node):
-            field_value = BoundNode(instance, name, node, cur_value)
-        elif isinstance(cur_value, BindingDefault):
+        if _bind_node_field(instance, name, node, cur_value):
             # Evaluate the default value after all BoundNode initializations.
-            bindings.append((name, cur_value))  # type: ignore
-            continue
-        else:
-            # Parent node has passed something other than a Node or a chained BoundNode.
-            # Assume they just want to have it called.
-            continue
-        _field_assign(instance, name, field_value)
+            bindings.append((name, cur_value))
+
+    if bindings:
+        _evaluate_self_defaults(instance, bindings)
+
+
+# Cache of the self_default fields left pending until aresolve() by class, or by
+# (class, names of the reused self_default fields) for rebuild().
+_DEFERRED_SELF_DEFAULTS: dict[Any, frozenset[str]] = {}
+
+
+def _deferred_self_defaults(clz: type, reused_values: dict[str, Any]) -> frozenset[str]:
+    """Returns the names of the self_default fields left pending until aresolve(), the
+    async ones and the sync ones that may read a pending field (directly or through
+    Node fields). The sync ones are evaluated by aresolve() after the async ones."""
+    key = (clz, frozenset(reused_values)) if reused_values else clz
+    result = _DEFERRED_SELF_DEFAULTS.get(key, None)
+    if result is not None:
+        return result
+    bindings = [
+        (name, node)
+        for name, node in getattr(clz, DATATREE_SENTIENEL_NAME).items()
+        if isinstance(node, BindingDefault) and name not in reused_values
+    ]
+    deferred = {name for name, binding in bindings if binding.is_async}
+    updated = bool(deferred)
+    while updated:
+        updated = False
+        for name, _ in bindings:
+            if name in deferred:
+                continue
+            reads = _self_default_reads(clz, name)
+            if reads is None or not deferred.isdisjoint(reads):
+                deferred.add(name)
+                updated = True
+    result = frozenset(deferred)
+    _DEFERRED_SELF_DEFAULTS[key] = result
+    return result
+
+
+def _evaluate_self_defaults(
+    instance: object, bindings: Sequence[tuple[str, "BindingDefault[Any]"]]
+):
+    """Evaluates and assigns the self_default fields of instance."""
+    # Values of self_default fields carried over from a previous instance by rebuild().
+    reused = _REUSED_SELF_DEFAULTS.get()
+    if reused is not None and reused[0] is type(instance):
+        _REUSED_SELF_DEFAULTS.set(None)
+        reused_values = reused[1]
+    else:
+        reused_values = {}
+
+    executor = getattr(type(instance), SELF_DEFAULT_EXECUTOR_NAME, None)
+    if (
+        executor is not None
+        and len(bindings) > 1
+        and _TRACER is None
+        and not _IN_SELF_DEFAULT_WORKER.get()
+    ):
+        _evaluate_self_default_waves(
+            instance,
+            bindings,
+            reused_values,
+            _deferred_self_defaults(type(instance), reused_values),
+            executor,
+        )
+        return
+
+    deferred = _deferred_self_defaults(type(instance), reused_values)
 
     # Evaluate any default values after all BoundNode initializations.
     # This allows binding functions to reference any Node fields as
     # long as the Node fields do not use bindings that not evaluated yet.
     for name, cur_value in bindings:
-        field_value = cur_value.self_default(instance)
+        if name in reused_values:
+            field_value = reused_values[name]
+        elif name in deferred:
+            # Left as the BindingDefault until aresolve() is awaited.
+            continue
+        elif _TRACER is None:
+            field_value = cur_value.self_default(instance)
+        else:
+            _TRACER.enter(type(instance), name, 1, True)
+            try:
+                field_value = cur_value.self_default(instance)
+            finally:
+                _TRACER.exit(type(instance))
         _field_assign(instance, name, field_value)
 
+
+# True while a self_default function runs on a self_default_executor. Instances created
+# by it evaluate their self_default fields in order, so that a bounded executor can't
+# deadlock waiting on itself.
+_IN_SELF_DEFAULT_WORKER: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "_IN_SELF_DEFAULT_WORKER", default=False
+)
+
+# Cache of the evaluation waves of the self_default fields of (class, field names).
+_SELF_DEFAULT_WAVES: dict[tuple[type, tuple[str, ...]], tuple[tuple[int, ...], ...]] = {}
+
+
+def _self_default_reads(clz: type, name: str) -> frozenset[str] | None:
+    """Returns the fields the self_default field name of clz reads, directly or through
+    the Node fields it reads (and may call), or None if these can't be determined."""
+    dependencies = _get_dependencies(clz)
+    reads = dependencies.get(name, None)
+    if reads is None:
+        return None
+    nodes = getattr(clz, DATATREE_SENTIENEL_NAME)
+    result = set(reads)
+    pending = [n for n in reads if isinstance(nodes.get(n, None), Node)]
+    while pending:
+        for n in dependencies[pending.pop()]:  # type: ignore
+            if n not in result:
+                result.add(n)
+                if isinstance(nodes.get(n, None), Node):
+                    pending.append(n)
+    return frozenset(result)
+
+
+def _self_default_waves(clz: type, names: tuple[str, ...]) -> tuple[tuple[int, ...], ...]:
+    """Returns the indexes of names grouped into waves. A field only reads fields of
+    earlier waves and, as when evaluated in order, is evaluated in a wave after any
+    earlier field in names that reads it."""
+    key = (clz, names)
+    waves = _SELF_DEFAULT_WAVES.get(key, None)
+    if waves is not None:
+        return waves
+    reads = [_self_default_reads(clz, name) for name in names]
+    levels: list[int] = []
+    for j, name in enumerate(names):
+        level = 0
+        for i in range(j):
+            if (
+                reads[i] is None
+                or reads[j] is None
+                or names[i] in reads[j]  # type: ignore
+                or name in reads[i]  # type: ignore
+            ):
+                level = max(level, levels[i] + 1)
+        levels.append(level)
+    waves = tuple(
+        tuple(i for i, level in enumerate(levels) if level == wave)
+        for wave in range(max(levels, default=-1) + 1)
+    )
+    _SELF_DEFAULT_WAVES[key] = waves
+    return waves
+
+
+def _run_self_default(self_default: Callable[[Any], Any], instance: object) -> Any:
+    _IN_SELF_DEFAULT_WORKER.set(True)
+    return self_default(instance)
+
+
+def _evaluate_self_default_waves(
+    instance: object,
+    bindings: Sequence[tuple[str, "BindingDefault[Any]"]],
+    reused_values: dict[str, Any],
+    deferred: frozenset[str],
+    executor: Executor,
+):
+    """Evaluates the self_default fields of instance in waves of fields that don't
+    depend on each other, running each wave with several fields on executor."""
+    pending: list[tuple[str, "BindingDefault[Any]"]] = []
+    for name, cur_value in bindings:
+        if name in reused_values:
+            _field_assign(instance, name, reused_values[name])
+        elif name not in deferred:
+            pending.append((name, cur_value))
+
+    waves = _self_default_waves(type(instance), tuple(name for name, _ in pending))
+    for wave in waves:
+        if len(wave) == 1:
+            name, cur_value = pending[wave[0]]
+            _field_assign(instance, name, cur_value.self_default(instance))
+            continue
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                _run_self_default,
+                pending[i][1].self_default,
+                instance,
+            )
+            for i in wave
+        ]
+        # All the fields of the wave finish before any error is raised.
+        _wait_futures(futures)
+        for i, future in zip(wave, futures):
+            _field_assign(instance, pending[i][0], future.result())
+
+
+def _pending_self_defaults(instance: object) -> list[tuple[str, BindingDefault[Any]]]:
+    """Returns the self_default fields of instance that are yet to be resolved, the
+    async ones and the sync ones deferred until they are."""
+    nodes = getattr(type(instance), DATATREE_SENTIENEL_NAME, None)
+    if not nodes:
+        return []
+    result = []
+    for name, node in nodes.items():
+        if isinstance(node, BindingDefault):
+            cur_value = getattr(instance, name, None)
+            if isinstance(cur_value, BindingDefault):
+                result.append((name, cur_value))
+    return result
+
+
+def _datatree_instances(value: Any) -> list[Any]:
+    """Returns the datatree instances held by a field value, directly or in lists,
+    tuples and dict values."""
+    if hasattr(type(value), DATATREE_SENTIENEL_NAME):
+        return [value]
+    if isinstance(value, (list, tuple)):
+        items: Iterable[Any] = value
+    elif isinstance(value, dict):
+        items = value.values()
+    else:
+        return []
+    return [v for v in items if hasattr(type(v), DATATREE_SENTIENEL_NAME)]
+
+
+async def aresolve(instance: object, limit: int | None = None) -> dict[str, Any]:
+    """Resolves the async parts of a datatree instance concurrently.
+
+    Pending async self_default fields are awaited and assigned to the instance and
+    Node fields with an async clz_or_func are called (without arguments) and awaited.
+    Sync self_default fields that may read pending fields are then evaluated in order.
+    Datatree instances held by self_default fields (sync or async, directly or in
+    lists, tuples and dict values) are resolved in the same way.
+
+    Args:
+      instance: The datatree instance to resolve.
+      limit: The maximum number of concurrently running awaits. None is unbounded.
+    Returns:
+      A dict of the field name to the resolved value for each self_default field and
+      async Node field of instance.
+    """
+    semaphore = asyncio.Semaphore(limit) if limit else None
+    # Instances being resolved, by id (the instances are kept alive by the tree).
+    visited: set[int] = set()
+
+    async def bounded(awaitable_func: Callable[[], Any]) -> Any:
+        if semaphore is None:
+            return await awaitable_func()
+        async with semaphore:
+            return await awaitable_func()
+
+    async def resolve_children(value: Any):
+        children = [c for c in _datatree_instances(value) if id(c) not in visited]
+        if children:
+            await asyncio.gather(*(resolve(c) for c in children))
+
+    async def resolve_default(instance: object, name: str, binding: BindingDefault[Any]) -> Any:
+        value = await bounded(lambda: binding.self_default(instance))
+        _field_assign(instance, name, value)
+        await resolve_children(value)
+        return value
+
+    async def resolve(instance: object) -> dict[str, Any]:
+        visited.add(id(instance))
+        names: list[str] = []
+        tasks: list[Any] = []
+        children: list[Any] = []
+        deferred: list[tuple[str, BindingDefault[Any]]] = []
+        for name, binding in _pending_self_defaults(instance):
+            if binding.is_async:
+                names.append(name)
+                tasks.append(resolve_default(instance, name, binding))
+            else:
+                deferred.append((name, binding))
+
+        nodes = getattr(type(instance), DATATREE_SENTIENEL_NAME, {})
+        for name, node in nodes.items():
+            value = getattr(instance, name, None)
+            if isinstance(node, Node) and isinstance(value, BoundNode):
+                if inspect.iscoroutinefunction(value.node.clz_or_func.clz_or_func):
+                    names.append(name)
+                    tasks.append(bounded(value.acall))
+            elif isinstance(node, BindingDefault) and not isinstance(value, BindingDefault):
+                # An evaluated (sync) self_default, its instances may have async parts.
+                children.append(resolve_children(value))
+
+        results = dict(zip(names, await asyncio.gather(*tasks, *children)))
+        # Sync self_defaults reading the async fields, in order once these are resolved.
+        for name, binding in deferred:
+            value = binding.self_default(instance)
+            _field_assign(instance, name, value)
+            await resolve_children(value)
+            results[name] = value
+        return results
+
+    return await resolve(instance)
+
+
+# The (class, {field name: value}) of self_default values to be reused by the next
+# instance of class to be initialized. Set by rebuild().
+_REUSED_SELF_DEFAULTS: contextvars.ContextVar[tuple[type, dict[str, Any]] | None] = (
+    contextvars.ContextVar("_REUSED_SELF_DEFAULTS", default=None)
+)
+
+
+def _code_attribute_names(func: Callable[..., Any]) -> frozenset[str] | None:
+    """Returns all the global and attribute names referenced by the code of func
+    including nested lambdas and comprehensions, or None if func has no code."""
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return None
+    names: set[str] = set()
+    codes = [code]
+    while codes:
+        code = codes.pop()
+        names.update(code.co_names)
+        codes.extend(c for c in code.co_consts if isinstance(c, types.CodeType))
+    return frozenset(names)
+
+
+# Opcodes loading an attribute of the value on the top of the stack.
+_ATTRIBUTE_LOADS = frozenset(("LOAD_ATTR", "LOAD_METHOD"))
+# Names through which the fields of an object may be read by name.
+_REFLECTION_NAMES = frozenset(("getattr", "vars", "__dict__", "__getattribute__"))
+_SIMPLE_CLOSURE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _has_untracked_reads(func: Callable[..., Any]) -> bool:
+    """Returns True if the code of func (or its nested code) may read fields of its
+    first argument (self) other than through self.name attribute loads. That's the
+    case when self is used as a value (e.g. passed to a call), getattr, vars or
+    __dict__ are used, a global other than a builtin is called or has an attribute
+    loaded, or a closure variable holds something other than a simple value."""
+    code = func.__code__
+    self_name = code.co_varnames[0] if code.co_argcount else None
+    func_globals = getattr(func, "__globals__", {})
+    for cell in func.__closure__ or ():
+        try:
+            value = cell.cell_contents
+        except ValueError:
+            return True
+        if not isinstance(value, _SIMPLE_CLOSURE_TYPES):
+            return True
+    codes = [code]
+    while codes:
+        code = codes.pop()
+        if not _REFLECTION_NAMES.isdisjoint(code.co_names):
+            return True
+        instructions = [i for i in dis.get_instructions(code) if i.opname != "EXTENDED_ARG"]
+        for index, instruction in enumerate(instructions):
+            following = instructions[index + 1] if index + 1 < len(instructions) else None
+            loads_attribute = following is not None and following.opname in _ATTRIBUTE_LOADS
+            opname = instruction.opname
+            if opname.startswith("LOAD_FAST") or opname == "LOAD_DEREF":
+                names = instruction.argval
+                if not isinstance(names, tuple):
+                    names = (names,)
+                if self_name in names and not (len(names) == 1 and loads_attribute):
+                    return True
+            elif opname in ("LOAD_GLOBAL", "LOAD_NAME"):
+                name = instruction.argval
+                if name in func_globals:
+                    value = func_globals[name]
+                elif hasattr(builtins, name):
+                    continue
+                else:
+                    return True  # Not defined yet, it may be anything.
+                if value is getattr(builtins, name, None):
+                    continue
+                if callable(value) or loads_attribute:
+                    return True
+        codes.extend(c for c in code.co_consts if isinstance(c, types.CodeType))
+    return False
+
+
+def _self_default_dependencies(
+    clz: type, binding: BindingDefault[Any]
+) -> frozenset[str] | None:
+    """Returns the names of the fields of clz the self_default function of binding
+    may read, or None if this can't be determined. The result over-approximates
+    since any attribute read with the name of a field is assumed to be a read of
+    that field. Calls to methods of clz and any reads _has_untracked_reads() can't
+    follow make the dependencies undeterminable."""
+    names = _code_attribute_names(binding.self_default)
+    if names is None or _has_untracked_reads(binding.self_default):
+        return None
+    fields = clz.__dataclass_fields__  # type: ignore
+    for name in names:
+        if name not in fields:
+            attr = inspect.getattr_static(clz, name, None)
+            if isinstance(attr, (types.FunctionType, property, classmethod, staticmethod)):
+                return None
+    return frozenset(name for name in names if name in fields)
+
+
+# Cache of the dependencies of the Node and self_default fields of each class.
+_DEPENDENCIES_CACHE: dict[type, dict[str, frozenset[str] | None]] = {}
+
+
+def _get_dependencies(clz: type) -> dict[str, frozenset[str] | None]:
+    """Returns the field names each Node and self_default field of clz depends on.
+    A Node depends on the fields in its expose_map and a self_default on the fields
+    its function reads. None means the field may depend on any field."""
+    result = _DEPENDENCIES_CACHE.get(clz, None)
+    if result is not None:
+        return result
+    fields = clz.__dataclass_fields__  # type: ignore
+    extra = frozenset((OVERRIDE_FIELD_NAME,)) if OVERRIDE_FIELD_NAME in fields else frozenset()
+    result = {}
+    for name, node in getattr(clz, DATATREE_SENTIENEL_NAME, {}).items():
+        if isinstance(node, Node):
+            result[name] = node._depends_on() | extra | {name}
+        elif isinstance(node, BindingDefault):
+            if node.depends_on is not None:
+                result[name] = node.depends_on
+            else:
+                result[name] = _self_default_dependencies(clz, node)
+    _DEPENDENCIES_CACHE[clz] = result
+    return result
+
+
+def _affected_fields(clz: type, changed: Iterable[str]) -> set[str]:
+    """Returns the changed field names together with the names of all the Node and
+    self_default fields that depend on them, directly or indirectly."""
+    affected = set(changed)
+    if not affected:
+        return affected
+    dependencies = _get_dependencies(clz)
+    updated = True
+    while updated:
+        updated = False
+        for name, depends_on in dependencies.items():
+            if name in affected:
+                continue
+            if depends_on is None or not affected.isdisjoint(depends_on):
+                affected.add(name)
+                updated = True
+    return affected
+
+
+def _is_same_value(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+    if type(a) is not type(b):
+        return False  # E.g. 1, 1.0 and True are equal but may give different results.
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+def rebuild(instance: _T, **changes: Any) -> _T:
+    """Creates a new instance of a datatree class like dataclasses.replace but
+    reuses the values of self_default fields that do not depend on the changed fields.
+
+    Dependencies are found using each Node's expose_map and the fields read by each
+    self_default function. The user's __post_init__ is always called.
+
+    Args:
+      instance: The datatree instance to rebuild.
+      **changes: The new values of init fields.
+    """
+    clz = type(instance)
+    fields = clz.__dataclass_fields__  # type: ignore
+    for name in changes:
+        f = fields.get(name, None)
+        if f is None:
+            raise TypeError(f"{clz.__name__} has no field named {name!r}")
+        if not f.init:
+            raise ValueError(f"field {name!r} is declared with init=False, it cannot be specified")
+
+    kwds = _init_field_values(instance)
+    changed = []
+    for name, value in changes.items():
+        if name not in kwds or not _is_same_value(kwds[name], value):
+            changed.append(name)
+        kwds[name] = value
+
+    affected = _affected_fields(clz, changed)
+    reused_values = {}
+    for name, node in getattr(clz, DATATREE_SENTIENEL_NAME, {}).items():
+        if name in affected or not isinstance(node, BindingDefault):
+            continue
+        value = getattr(instance, name)
+        if not isinstance(value, BindingDefault):
+            reused_values[name] = value
+
+    token = _REUSED_SELF_DEFAULTS.set((clz, reused_values))
+    try:
+        return clz(**kwds)
+    finally:
+        _REUSED_SELF_DEFAULTS.reset(token)
+
+
+def replace(instance: _T, /, **changes: Any) -> _T:
+    """A datatree aware version of dataclasses.replace.
+
+    BoundNode fields are bound to the new instance without chaining and the values
+    of unchanged fields, including self_default fields that do not depend on the
+    changes, are shared with the original instance (see rebuild()).
+    """
+    for f in instance.__dataclass_fields__.values():  # type: ignore
+        if f._field_type is _FIELD_INITVAR and f.name not in changes:
+            if f.default is MISSING and f.default_factory is MISSING:
+                raise ValueError(f"InitVar {f.name!r} must be specified with replace()")
+    return rebuild(instance, **changes)
+
+
 @dataclass(frozen=True)
 class Scope:
     localns: dict[str, Any] | None = None
@@ -1233,7 +2053,13 @@ def resolve_forward_reference(self, anno: str) -> Any:
         if type(globalns) is not dict:
             globalns = dict(globalns)
         return eval(anno, localsns, globalns)
-    
+
+
+# The accessor of Nodes created with a clz_or_func, the annotations of the (already
+# decorated) targets are shared by all Nodes.
+_SHARED_ANNOTATIONS = AnnotationsAccessor(cache=weakref.WeakKeyDictionary())  # type: ignore
+
+
 def get_scope(frame: int = 2) -> Scope:
     try:
         defining_frame = sys._getframe(frame)
@@ -1264,7 +2090,11 @@ def _process_datatree(
     slots: bool,
     weakref_slot: bool,
     chain_post_init: bool,
-    provide_override_field: bool
+    provide_override_field: bool,
+    compact_pickle: bool = False,
+    intern: bool = False,
+    cache_hash: bool = False,
+    self_default_executor: Executor | None = None,
 ) -> type | tuple[Any, ...]:
 
     if provide_override_field:
@@ -1277,6 +2107,25 @@ def _process_datatree(
             clz.__annotations__[OVERRIDE_FIELD_NAME] = Overrides
             setattr(clz, OVERRIDE_FIELD_NAME, field(default=None, repr=False))
 
+    # Backends may always create slotted classes.
+    slots = slots or getattr(dataclass_func, "slots", False)
+
+    if intern and (not frozen or slots):
+        raise InvalidInternOptions(
+            f"Class {clz.__name__} requires frozen=True and slots=False for intern=True"
+        )
+
+    if cache_hash and (not frozen or not eq or slots):
+        raise InvalidCacheHashOptions(
+            f"Class {clz.__name__} requires frozen=True, eq=True and slots=False "
+            "for cache_hash=True"
+        )
+
+    # Interned instances are reconstructed via the constructor so they intern when
+    # unpickled or copied.
+    if (compact_pickle or intern) and "__reduce__" not in clz.__dict__:
+        clz.__reduce__ = _reduce_datatree
+
     # Move the user defined __post_init__ to __original_post_init__
     post_init_func = clz.__dict__.get("__post_init__", None)
     if post_init_func is not None:
@@ -1296,10 +2145,31 @@ def _process_datatree(
                     if name not in init_vars:  # Avoid duplicates
                         init_vars.append(name)
 
+    # Interned instances are pickled and copied like compact pickled instances.
+    if init_vars and intern:
+        raise InvalidInternOptions(
+            f"Class {clz.__name__} with InitVar fields {', '.join(init_vars)} can't be "
+            "interned"
+        )
+
+    # InitVar values aren't stored on the instance so a compact pickled instance
+    # couldn't be reconstructed via the constructor.
+    if init_vars and getattr(clz, "__reduce__", None) is _reduce_datatree:
+        raise InvalidCompactPickleOptions(
+            f"Class {clz.__name__} with InitVar fields {', '.join(init_vars)} can't be "
+            "compact pickled"
+        )
+
     # Create the override post_init function with proper parameter handling
     clz.__post_init__ = _create_post_init_function(
-        anno_getter, clz, post_init_func, chain_post_init
+        anno_getter, clz, post_init_func, chain_post_init, use_done_flag=not slots
     )
+    if getattr(dataclass_func, "binds_nodes", False):
+        setattr(
+            clz,
+            POST_INIT_CHAIN_NAME,
+            _create_post_init_function(anno_getter, clz, None, chain_post_init, bind_nodes=False),
+        )
 
     _apply_node_fields(anno_getter, clz)
 
@@ -1313,7 +2183,7 @@ def _process_datatree(
         ((k, v) for k, v in values_post_38.items() if v != _POST_38_DEFAULTS[k])
     )
 
-    return dataclass_func(
+    result = dataclass_func(
         clz,  # type: ignore
         init=init,
         repr=repr,
@@ -1323,6 +2193,134 @@ def _process_datatree(
         frozen=frozen,
         **values_post_38_differ,
     )
+    setattr(result, SELF_DEFAULT_EXECUTOR_NAME, self_default_executor)
+    if cache_hash:
+        _apply_cached_hash(result)  # type: ignore
+    if intern:
+        _apply_interning(result)  # type: ignore
+    return result
+
+
+# Instance attribute holding the cached hash of a cache_hash=True instance. The class
+# attribute of the same name is None. It's accessed as an attribute rather than via
+# __dict__ since accessing __dict__ materializes the instance dict, which makes all
+# the attribute reads of the instance (e.g. by __eq__) slower.
+_HASH_NAME = "__datatree_hash__"
+
+
+def _apply_cached_hash(clz: type):
+    """Replaces the dataclass generated __hash__ with one storing the hash on the
+    instance and __eq__ with one comparing the cached hashes before the fields."""
+    fields_hash = clz.__hash__
+    fields_eq = clz.__eq__
+    set_attr = object.__setattr__
+
+    def __hash__(self) -> int:
+        value = self.__datatree_hash__
+        if value is None:
+            value = fields_hash(self)
+            set_attr(self, _HASH_NAME, value)
+        return value
+
+    def __eq__(self, other: Any) -> Any:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        self_hash = self.__datatree_hash__
+        if self_hash is not None:
+            other_hash = other.__datatree_hash__
+            if other_hash is not None and other_hash != self_hash:
+                return False
+        return fields_eq(self, other)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Hashes of str values differ between processes, don't pickle the cached hash.
+        state = dict(self.__dict__)
+        state.pop(_HASH_NAME, None)
+        return state
+
+    __hash__.__qualname__ = f"{clz.__qualname__}.__hash__"
+    __eq__.__qualname__ = f"{clz.__qualname__}.__eq__"
+    __getstate__.__qualname__ = f"{clz.__qualname__}.__getstate__"
+    clz.__hash__ = __hash__  # type: ignore
+    clz.__eq__ = __eq__  # type: ignore
+    setattr(clz, _HASH_NAME, None)
+    if "__getstate__" not in clz.__dict__:
+        clz.__getstate__ = __getstate__  # type: ignore
+
+
+# Instance dict entry holding the intern key of an instance under construction.
+_INTERN_KEY_NAME = "__datatree_intern_key__"
+# The value of the _INTERN_KEY_NAME entry once the instance is interned.
+_INTERNED = object()
+
+
+def _create_intern_key_function(clz: type) -> Callable[..., tuple[Any, ...]]:
+    """Creates a function with the same parameters and defaults as clz.__init__
+    (without self) that returns the tuple of its arguments."""
+    init_func = clz.__init__  # type: ignore
+    params = tuple(inspect.signature(init_func).parameters.values())[1:]
+    param_texts = []
+    for param in params:
+        if param.kind is inspect.Parameter.KEYWORD_ONLY and "*" not in param_texts:
+            param_texts.append("*")
+        param_texts.append(param.name)
+    names = "".join(f"{param.name}, " for param in params)
+
+    key_function = _create_fn(
+        "__intern_key__",
+        [f"def __intern_key__({', '.join(param_texts)}):"],
+        [f"    return ({names})"],
+    )
+    key_function.__defaults__ = init_func.__defaults__  # type: ignore
+    key_function.__kwdefaults__ = init_func.__kwdefaults__  # type: ignore
+    return key_function
+
+
+def _apply_interning(clz: type):
+    """Makes the given dataclass return existing equivalent live instances."""
+    original_init = clz.__init__  # type: ignore
+    table: weakref.WeakValueDictionary[tuple[Any, ...], Any] = weakref.WeakValueDictionary()
+
+    @wraps(original_init)
+    def __init__(self, *args: Any, **kwds: Any):
+        instance_dict = self.__dict__
+        key = instance_dict.get(_INTERN_KEY_NAME, MISSING)
+        if key is _INTERNED:
+            return  # An existing instance returned by __new__.
+        original_init(self, *args, **kwds)
+        if key is not MISSING:
+            if key is None:
+                del instance_dict[_INTERN_KEY_NAME]
+            else:
+                instance_dict[_INTERN_KEY_NAME] = _INTERNED
+                table[key] = self
+
+    intern_key = _create_intern_key_function(clz)
+
+    # Wraps __init__ so that inspect.signature() of the class reports its parameters.
+    @wraps(original_init)
+    def __new__(cls, *args: Any, **kwds: Any):
+        if cls is not clz:
+            # A subclass that was not interned.
+            return object.__new__(cls)
+        try:
+            key = intern_key(*args, **kwds)
+            existing = table.get(key, None)
+        except TypeError:
+            # Unhashable or invalid parameters, the latter are reported by __init__.
+            key = None
+            existing = None
+        if existing is not None:
+            return existing
+        instance = object.__new__(cls)
+        instance.__dict__[_INTERN_KEY_NAME] = key
+        return instance
+
+    __new__.__name__ = __new__.__qualname__ = "__new__"
+    clz.__new__ = staticmethod(__new__)  # type: ignore
+    clz.__init__ = __init__  # type: ignore
     
 def scoped_datatree(
         clz: Optional[type[_T]] = None,
@@ -1339,6 +2337,11 @@ def scoped_datatree(
         chain_post_init: bool = False,
         provide_override_field: bool = False,
         anno_getter: AnnotationsAccessor = AnnotationsAccessor(),
+        compact_pickle: bool = False,
+        intern: bool = False,
+        cache_hash: bool = False,
+        self_default_executor: Executor | None = None,
+        backend: Callable[..., type] | None = None,
     ) -> Callable[[type[_T]], type[_T]]:
     """A version of the datatree decorator (not intended to be used directly
     as a decorator) that allows for the local and global scope of the class being decorated to be
@@ -1350,7 +2353,7 @@ def scoped_datatree(
 
     return _process_datatree(
         anno_getter,
-        dataclass,
+        dataclass if backend is None else backend,
         clz,
         init,
         repr_,
@@ -1364,6 +2367,10 @@ def scoped_datatree(
         weakref_slot,
         chain_post_init,
         provide_override_field,
+        compact_pickle,
+        intern,
+        cache_hash,
+        self_default_executor,
     )
 
 
@@ -1393,7 +2400,12 @@ def datatree(
         slots: bool = False,
         weakref_slot: bool = False,
         chain_post_init: bool = False,
-        provide_override_field: bool = False
+        provide_override_field: bool = False,
+        compact_pickle: bool = False,
+        intern: bool = False,
+        cache_hash: bool = False,
+        self_default_executor: Executor | None = None,
+        backend: Callable[..., type] | None = None,
     ) -> Callable[[type[_T]], type[_T]]:
         
         anno_getter = AnnotationsAccessor(scope=get_scope(2))
@@ -1401,7 +2413,7 @@ def datatree(
         def wrap(clz):
             return _process_datatree(
                 anno_getter,
-                dataclass,
+                dataclass if backend is None else backend,
                 clz,
                 init,
                 repr_,
@@ -1414,7 +2426,11 @@ def wrap(clz):
                 slots,
                 weakref_slot,
                 chain_post_init,
-                provide_override_field
+                provide_override_field,
+                compact_pickle,
+                intern,
+                cache_hash,
+                self_default_executor,
             )
 
         # See if we're being called as @datatree or @datatree().
@@ -1442,7 +2458,12 @@ def datatree(
         slots: bool = False,
         weakref_slot: bool = False,
         chain_post_init: bool = False,
-        provide_override_field: bool = False
+        provide_override_field: bool = False,
+        compact_pickle: bool = False,
+        intern: bool = False,
+        cache_hash: bool = False,
+        self_default_executor: Executor | None = None,
+        backend: Callable[..., type] | None = None,
     ) -> Callable[[type[_T]], type[_T]]:
         """Python decorator similar to dataclasses.dataclass providing parameter injection,
         injection, binding and overrides for parameters deeper inside a tree of objects.
@@ -1462,6 +2483,21 @@ def datatree(
                 of the base classes.
             provide_override_field: If True, the class will provide an override field that can be
                 used to provide overrides for the Node fields
+            compact_pickle: If True, instances are pickled (and copied) as just their init field
+                values and are reconstructed via the constructor. BoundNode fields and
+                self_default values are recreated on the receiving side. The class can't
+                have InitVar fields.
+            intern: If True (requires frozen=True and no InitVar fields), constructing an
+                instance with the same init parameters as a live instance returns the
+                existing instance.
+            cache_hash: If True (requires frozen=True), the hash of an instance is computed once
+                and stored on the instance and __eq__ returns False early when the cached hashes
+                differ.
+            self_default_executor: An executor (e.g. a ThreadPoolExecutor) on which the
+                self_default fields of an instance that don't depend on each other are
+                evaluated concurrently. See dtfield depends_on.
+            backend: The function creating the dataclass from the prepared class, called
+                like dataclasses.dataclass (the default). See datatrees.backends.
         """
 
         anno_getter = AnnotationsAccessor(scope=get_scope(2))
@@ -1469,7 +2505,7 @@ def datatree(
         def wrap(clz):
             return _process_datatree(
                 anno_getter,
-                dataclass,
+                dataclass if backend is None else backend,
                 clz,
                 init,
                 repr_,
@@ -1483,6 +2519,10 @@ def wrap(clz):
                 weakref_slot,
                 chain_post_init,
                 provide_override_field,
+                compact_pickle,
+                intern,
+                cache_hash,
+                self_default_executor,
             )
 
         # See if we're being called as @datatree or @datatree().
@@ -1611,6 +2651,25 @@ def _get_post_init_parameter_map(
     return result
 
 
+def _no_op_post_init(self, *args, **kwds):
+    pass
+
+
+def _no_op_post_init_with_doc(self, *args, **kwds):
+    """Docstring."""
+
+
+_NO_OP_CODES = frozenset(
+    (_no_op_post_init.__code__.co_code, _no_op_post_init_with_doc.__code__.co_code)
+)
+
+
+def _is_no_op(func: Any) -> bool:
+    """Returns True if func is a plain function with an empty body."""
+    code = getattr(func, "__code__", None)
+    return isinstance(func, types.FunctionType) and code is not None and code.co_code in _NO_OP_CODES
+
+
 def _create_chain_post_init_text(
     anno_getter: 'AnnotationsAccessor',
     clz: type,
@@ -1627,8 +2686,11 @@ def _create_chain_post_init_text(
     repitition in case of diamond inheritance. If each class has a post-init function
     that calls the post-init function of the next class in the chain, then the post-init
     function of the deepest class will be called multiple times.
+
+    The post-init functions are looked up when the class is decorated and called
+    directly (as _pi_<mro index> locals) and those with an empty body are not called.
     """
-    locals = {"clz": clz}
+    locals: dict[str, Any] = {"clz": clz}
     mapping = _get_post_init_parameter_map(
         anno_getter, clz, post_init_new_name, post_init_orig_name
     )
@@ -1637,21 +2699,26 @@ def _create_chain_post_init_text(
     params_derived: list[_PostInitParameter] = mapping.get(0, ([], ""))[0]
     pnames = ("self",) + tuple(p.name for p in params_derived if not p.is_in_self)
 
+    def add_call(mro_index: int, funcname: str, names: tuple[str, ...]):
+        func = getattr(clz.__mro__[mro_index], funcname)
+        if _is_no_op(func):
+            return
+        locals[f"_pi_{mro_index}"] = func
+        body_text.append(
+            f"    _pi_{mro_index}({', '.join(names)}) # {clz.__mro__[mro_index].__name__}"
+        )
+
     header_text.append(f"def {post_init_orig_name}({', '.join(pnames)}):")
-    body_text.append("    mro = clz.__mro__")
     if chain_post_init:
         for mro_index, (params, funcname) in mapping.items():
             if mro_index == 0:
                 continue
             names = ("self",) + tuple(f"self.{p.name}" if p.is_in_self else p.name for p in params)
-            body_text.append(
-                f"    mro[{mro_index}].{funcname}({', '.join(names)})"
-                f" # {clz.__mro__[mro_index].__name__}"
-            )
+            add_call(mro_index, funcname, names)
 
     # Call the original post-init function if it exists as post_init_name.
     if post_init_new_name in clz.__dict__:
-        body_text.append(f"    mro[0].{post_init_new_name}({', '.join(pnames)})")
+        add_call(0, post_init_new_name, pnames)
     elif not chain_post_init:
         # Find the post-init function in MRO order. Here we don't call all the post-init functions.
         # We just call the first one we find which is the way the dataclass works. However,
@@ -1662,10 +2729,7 @@ def _create_chain_post_init_text(
                 names = ("self",) + tuple(
                     f"self.{p.name}" if p.is_in_self else p.name for p in params
                 )
-                body_text.append(
-                    f"    mro[{mro_index}].{funcname}({', '.join(names)})"
-                    f" # {clz.__mro__[mro_index].__name__}"
-                )
+                add_call(mro_index, funcname, names)
                 break
 
     return locals, header_text, body_text
@@ -1676,8 +2740,15 @@ def _create_post_init_function(
     clz: type,
     wrap_fn: Callable[[Any], None] | None = None,
     chain_post_init: bool = False,
-) -> Callable[[Any], None]:
-    """Creates a custom __post_init__ function with named parameters."""
+    use_done_flag: bool = True,
+    bind_nodes: bool = True,
+) -> Callable[[Any], None] | None:
+    """Creates a custom __post_init__ function with named parameters.
+
+    The Node fields are bound the first time it is called on an instance unless
+    use_done_flag is False (for slotted classes which can't hold the flag) in which
+    case they are bound on every call. If bind_nodes is False the function only calls
+    the post-init chain and None is returned if there is nothing to call."""
 
     if clz.__module__ in sys.modules:
         globals = sys.modules[clz.__module__].__dict__
@@ -1692,11 +2763,18 @@ def _create_post_init_function(
     if wrap_fn is not None:
         wrap_decorator = ["@wraps(wapped_function)"]
 
-    init_code = [
-        "    if not self.__initialize_node_instances_done__:",
-        "        _field_assign(self, '__initialize_node_instances_done__', True)",
-        "        _initialize_node_instances(clz, self)",
-    ]
+    if not bind_nodes:
+        if not body_text:
+            return None
+        init_code = []
+    elif use_done_flag:
+        init_code = [
+            "    if not self.__initialize_node_instances_done__:",
+            "        _field_assign(self, '__initialize_node_instances_done__', True)",
+            "        _initialize_node_instances(clz, self)",
+        ]
+    else:
+        init_code = ["    _initialize_node_instances(clz, self)"]
 
     header_lines = wrap_decorator + header_text
     body_lines = init_code + body_text
@@ -0,0 +1,178 @@
+"""
+Structural comparison of two datatree instances.
+
+    d = datatrees.diff(old, new)
+    d.fields       # FieldChange(path, name, old, new) of each changed field.
+    d.nodes        # NodeChange(path, name, fields, params) of each Node whose
+                   # arguments (the parent fields in its expose_map) changed.
+    d.node_paths   # (path + (name,)) of these Nodes.
+
+Init fields and evaluated init=False fields (such as self_default fields) are
+compared. Values holding datatree instances of the same class (directly or in lists,
+tuples and dict values of matching shape) are compared field by field, with paths
+like those of walk(). Other values are compared with ==. Node dependencies are
+found from each Node's expose_map (see rebuild()) so no factories are called. A
+field holding instances with changes counts as changed for the Nodes binding it.
+Instances shared by both sides (e.g. the unchanged children of rebuild() and replace()
+results) are skipped without being compared.
+"""
+
+from dataclasses import dataclass, _FIELD
+from typing import Any
+
+from .datatrees import BindingDefault, BoundNode, DATATREE_SENTIENEL_NAME, Node
+from .datatrees import _get_dependencies, _init_field_values, _is_same_value
+from .walk import Path, _is_datatree
+
+
+@dataclass(frozen=True)
+class FieldChange:
+    """A changed field of the instance at path."""
+
+    path: Path
+    name: str
+    old: Any
+    new: Any
+
+
+@dataclass(frozen=True)
+class NodeChange:
+    """A Node field of the instance at path whose resolved arguments differ.
+
+    fields: The changed parent fields the Node depends on, in field order.
+    params: The factory parameters bound to these fields.
+    """
+
+    path: Path
+    name: str
+    fields: tuple[str, ...]
+    params: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class DatatreeDiff:
+    """The changes between two datatree instances, see diff()."""
+
+    fields: tuple[FieldChange, ...]
+    nodes: tuple[NodeChange, ...]
+
+    @property
+    def node_paths(self) -> tuple[Path, ...]:
+        return tuple(c.path + (c.name,) for c in self.nodes)
+
+    def __bool__(self) -> bool:
+        return bool(self.fields or self.nodes)
+
+
+def _field_values(obj: Any) -> dict[str, Any]:
+    """Returns the init field values (as for compact pickling) and the values of the
+    evaluated init=False fields, such as self_default fields."""
+    values = _init_field_values(obj)
+    for f in obj.__dataclass_fields__.values():
+        if f.init or f._field_type is not _FIELD:
+            continue
+        value = getattr(obj, f.name, None)
+        if not isinstance(value, (BoundNode, BindingDefault)):
+            values[f.name] = value
+    return values
+
+
+def _child_pairs(path: Path, a: Any, b: Any) -> list[tuple[Path, Any, Any]] | None:
+    """Returns the pairs of datatree instances to compare field by field for the
+    values of a field or None if the values are compared as a whole."""
+    if _is_datatree(a) or _is_datatree(b):
+        return [(path, a, b)] if type(a) is type(b) else None
+    if isinstance(a, (list, tuple)) and type(a) is type(b) and len(a) == len(b):
+        items = list(zip(range(len(a)), a, b))
+    elif isinstance(a, dict) and isinstance(b, dict) and a.keys() == b.keys():
+        items = [(k, v, b[k]) for k, v in a.items()]
+    else:
+        return None
+    pairs = []
+    for key, x, y in items:
+        if _is_datatree(x) and type(x) is type(y):
+            pairs.append((path + (key,), x, y))
+        elif not _is_same_value(x, y):
+            return None
+    return pairs if pairs else None
+
+
+def diff(a: Any, b: Any) -> DatatreeDiff:
+    """Returns the changes from a to b, two instances of the same datatree class.
+
+    Raises:
+      TypeError: If a and b aren't datatree instances of the same class.
+    """
+    if not _is_datatree(a) or type(a) is not type(b):
+        raise TypeError(
+            f"Expected two instances of the same datatree class, got "
+            f"{type(a).__qualname__} and {type(b).__qualname__}"
+        )
+    field_changes: list[FieldChange] = []
+    # (path, x, y, changed field names, {field name: keys of the compared children})
+    # of each compared pair of instances in visit order.
+    frames: list[tuple[Path, Any, Any, set[str], dict[str, list[tuple[int, int]]]]] = []
+    visited: set[tuple[int, int]] = set()
+    stack: list[tuple[Path, Any, Any]] = [((), a, b)]
+    while stack:
+        path, x, y = stack.pop()
+        if x is y or (id(x), id(y)) in visited:
+            continue
+        visited.add((id(x), id(y)))
+
+        x_values = _field_values(x)
+        y_values = _field_values(y)
+        changed = set()
+        children: dict[str, list[tuple[int, int]]] = {}
+        below = []
+        for name in dict.fromkeys((*x_values, *y_values)):
+            old = x_values.get(name, None)
+            new = y_values.get(name, None)
+            if name in x_values and name in y_values:
+                if old is new:
+                    continue
+                pairs = _child_pairs(path + (name,), old, new)
+                if pairs is not None:
+                    below.extend(pairs)
+                    children[name] = [(id(cx), id(cy)) for _, cx, cy in pairs if cx is not cy]
+                    continue
+                if _is_same_value(old, new):
+                    continue
+            changed.add(name)
+            field_changes.append(FieldChange(path, name, old, new))
+        frames.append((path, x, y, changed, children))
+        stack.extend(reversed(below))
+
+    # A field holding instances that changed is changed for the Nodes binding it.
+    changed_keys = {(id(x), id(y)) for _, x, y, changed, _ in frames if changed}
+    updated = True
+    while updated:
+        updated = False
+        for _, x, y, changed, children in reversed(frames):
+            for name, keys in children.items():
+                if name not in changed and not changed_keys.isdisjoint(keys):
+                    changed.add(name)
+                    changed_keys.add((id(x), id(y)))
+                    updated = True
+
+    node_changes: list[NodeChange] = []
+    for path, x, _, changed, _ in frames:
+        if not changed:
+            continue
+        clz = type(x)
+        dependencies = _get_dependencies(clz)
+        order = list(clz.__dataclass_fields__)
+        for name, node in getattr(clz, DATATREE_SENTIENEL_NAME).items():
+            if not isinstance(node, Node):
+                continue
+            fields = changed.intersection(dependencies[name])
+            if fields:
+                node_changes.append(
+                    NodeChange(
+                        path,
+                        name,
+                        tuple(sorted(fields, key=order.index)),
+                        tuple(p for p, f in node.expose_map.items() if f in fields),
+                    )
+                )
+    return DatatreeDiff(tuple(field_changes), tuple(node_changes))
@@ -0,0 +1,275 @@
+"""
+A persistent, content addressed result cache for Node factories.
+
+    store = DiskCache("~/.cache/parts.sqlite", max_bytes=1 << 30)
+
+    @datatree
+    class Assembly:
+        mesh: Node[make_mesh] = Node(make_mesh, disk_cache=store)
+
+Results of calling the BoundNode are keyed by the qualified name of the factory,
+a fingerprint of the factory's code and the fully resolved arguments. The store is
+an SQLite database so it may be shared by concurrent processes (SQLite serializes
+writers with file locks). Least recently used entries are evicted when the total
+size of the stored results exceeds max_bytes.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import types
+import weakref
+from typing import Any, Callable
+
+from .datatrees import DATATREE_SENTIENEL_NAME, BindingDefault, Node
+from .fingerprints import fingerprint_value
+
+
+_SIMPLE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _update_code_hash(hasher: Any, code: types.CodeType):
+    hasher.update(code.co_code)
+    hasher.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _update_code_hash(hasher, const)
+        else:
+            hasher.update(repr(const).encode())
+
+
+def _update_defaults_hash(hasher: Any, func: Any):
+    defaults = tuple(getattr(func, "__defaults__", None) or ()) + tuple(
+        (getattr(func, "__kwdefaults__", None) or {}).items()
+    )
+    for default in defaults:
+        # Only values with a stable repr contribute, other defaults are opaque.
+        if isinstance(default, _SIMPLE_TYPES) or (
+            isinstance(default, tuple) and all(isinstance(d, _SIMPLE_TYPES) for d in default)
+        ):
+            hasher.update(repr(default).encode())
+        else:
+            hasher.update(type(default).__qualname__.encode())
+
+
+def _class_functions(clz: type) -> list[Any]:
+    """Returns the Python functions defined by a class and its bases."""
+    result = []
+    for base in clz.__mro__:
+        if base.__module__ == "builtins":
+            continue
+        for name in sorted(base.__dict__):
+            attr = base.__dict__[name]
+            if isinstance(attr, (staticmethod, classmethod)):
+                attr = attr.__func__
+            elif isinstance(attr, property):
+                attr = attr.fget
+            if isinstance(attr, types.FunctionType):
+                result.append(attr)
+    return result
+
+
+def _functions_of(obj: Any) -> list[Any]:
+    """Returns the Python functions whose code determines the result of calling obj.
+    For datatree classes these include the self_default functions and, recursively,
+    the functions of the Node targets."""
+    result: list[Any] = []
+    seen: set[int] = set()
+    stack = [obj]
+    while stack:
+        target = stack.pop()
+        if id(target) in seen:
+            continue
+        seen.add(id(target))
+        if not isinstance(target, type):
+            func = getattr(target, "__func__", target)
+            if isinstance(func, types.FunctionType):
+                result.append(func)
+            continue
+        result.extend(_class_functions(target))
+        nodes = getattr(target, DATATREE_SENTIENEL_NAME, None) or {}
+        dependents = []
+        for node in nodes.values():
+            if isinstance(node, BindingDefault):
+                dependents.append(node.self_default)
+            elif isinstance(node, Node) and node.clz_or_func:
+                dependents.append(node.clz_or_func.clz_or_func)
+        stack.extend(reversed(dependents))
+    return result
+
+
+_FINGERPRINTS: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+
+
+def code_fingerprint(obj: Callable[..., Any]) -> str:
+    """Returns a digest of the code of a function, or of all the functions of a class
+    and its bases (see _functions_of), including simple default values."""
+    try:
+        return _FINGERPRINTS[obj]
+    except (KeyError, TypeError):
+        pass
+    hasher = hashlib.sha256()
+    for func in _functions_of(obj):
+        hasher.update(func.__qualname__.encode())
+        _update_code_hash(hasher, func.__code__)
+        _update_defaults_hash(hasher, func)
+    result = hasher.hexdigest()
+    try:
+        _FINGERPRINTS[obj] = result
+    except TypeError:
+        pass
+    return result
+
+
+def qualified_name(obj: Any) -> str:
+    return f"{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', repr(obj))}"
+
+
+class DiskCache:
+    """An SQLite backed store of pickled Node factory results.
+
+    Args:
+      path: The SQLite database file. Parent directories are created.
+      max_bytes: The maximum total size of the stored (pickled) results.
+      timeout: Seconds to wait for another process holding the database lock.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 1 << 30, timeout: float = 60.0):
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._local = threading.local()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._transaction() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries(accessed)")
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Connections are per process and thread and are not pickled.
+        return {"path": self.path, "max_bytes": self.max_bytes, "timeout": self.timeout}
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        local = self._local
+        connection = getattr(local, "connection", None)
+        if connection is None or local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            local.connection = connection
+            local.pid = os.getpid()
+        return connection
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._connection())
+
+    def make_key(self, func: Callable[..., Any], kwds: dict[str, Any]) -> str | None:
+        """Returns the key for calling func with kwds or None if the arguments can't
+        be fingerprinted or pickled."""
+        try:
+            args = fingerprint_value(kwds).encode()
+        except TypeError:
+            # Values without a stable encoding, fall back to their pickled form.
+            try:
+                args = pickle.dumps(sorted(kwds.items()), protocol=4)
+            except Exception:
+                return None
+        hasher = hashlib.sha256()
+        hasher.update(qualified_name(func).encode())
+        hasher.update(code_fingerprint(func).encode())
+        hasher.update(args)
+        return hasher.hexdigest()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns the stored value for key or default."""
+        connection = self._connection()
+        row = connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+        return pickle.loads(row[0])
+
+    def put(self, key: str, value: Any) -> bool:
+        """Stores value for key. Returns False if the value can't be pickled or is
+        larger than max_bytes."""
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+        if len(data) > self.max_bytes:
+            return False
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, data, len(data), time.time()),
+            )
+            self._evict(connection)
+        return True
+
+    def _evict(self, connection: sqlite3.Connection):
+        (total,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = connection.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+    def call(self, func: Callable[..., Any], kwds: dict[str, Any]) -> Any:
+        """Returns the stored result of func(**kwds), calling func if not stored."""
+        key = self.make_key(func, kwds)
+        if key is None:
+            return func(**kwds)
+        result = self.get(key, _NOT_FOUND)
+        if result is _NOT_FOUND:
+            result = func(**kwds)
+            self.put(key, result)
+        return result
+
+    def total_bytes(self) -> int:
+        (total,) = self._connection().execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        return total
+
+    def clear(self):
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+_NOT_FOUND = object()
+
+
+class _Transaction:
+    """Holds the database write lock (BEGIN IMMEDIATE) for the duration of a with block."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any):
+        self.connection.execute("ROLLBACK" if exc_type else "COMMIT")
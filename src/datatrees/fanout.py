@@ -0,0 +1,148 @@
+"""
+Node fields producing a collection of children of one type.
+
+    @datatree
+    class Plate:
+        hole_radius: float = 1.5
+        positions: tuple = ((0, 0), (10, 0), (20, 0))
+        holes: NodeArray[Hole] = NodeArray(Hole, prefix="hole_", over="positions", param="position")
+
+    plate = Plate()
+    plate.holes[1]       # Hole(radius=1.5, position=(10, 0))
+    len(plate.holes)     # 3
+
+A NodeArray field is bound to a BoundNodeArray, a sequence view with a child per
+item of the parent's `over` field. The item is passed as the `param` argument of the
+child (which isn't injected into the parent) or, if param is None, items are dicts of
+arguments. The parent's field values (and any override) are resolved once, on first
+access, and each child is created when first accessed and then kept. NodeMap is the
+same for a mapping of items and is bound to a BoundNodeMap mapping view.
+
+Calling the field (plate.holes(position=(5, 5))) creates a single child like a Node.
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, TypeVar
+
+from .datatrees import BoundNode, Node, _field_assign
+
+
+_T = TypeVar("_T")
+
+# Instance dict entry of a bound view holding its resolved state.
+_STATE_NAME = "_fanout_state"
+
+
+def _node_kwds(param: str | None, kwds: dict[str, Any]) -> dict[str, Any]:
+    if param is not None:
+        kwds["exclude"] = set(kwds.get("exclude", ())) | {param}
+    return kwds
+
+
+@dataclass(frozen=True)
+class NodeArray(Node[_T]):
+    """A Node field bound to a sequence of children, one per item of the parent's
+    over field."""
+
+    over: str = ""
+    param: str | None = None
+
+    def __init__(self, *expose_spec: Any, over: str, param: str | None = None, **kwds: Any):
+        """Args:
+        over: The parent field holding the sequence of per-child items.
+        param: The child parameter each item is passed as. If None items are dicts
+            of child arguments.
+        *expose_spec, **kwds: As for Node. param is excluded from the injected fields.
+        """
+        _field_assign(self, "over", over)
+        _field_assign(self, "param", param)
+        super().__init__(*expose_spec, **_node_kwds(param, kwds))
+
+    def _bound_node_type(self) -> type[BoundNode[Any]]:
+        return BoundNodeArray
+
+    def _depends_on(self) -> frozenset[str]:
+        return super()._depends_on() | {self.over}
+
+
+class NodeMap(NodeArray[_T]):
+    """A Node field bound to a mapping of children, one per item of the parent's over
+    field (a mapping)."""
+
+    def _bound_node_type(self) -> type[BoundNode[Any]]:
+        return BoundNodeMap
+
+
+class _BoundFanOut(BoundNode[Any]):
+    def _state(self) -> tuple[Any, dict[str, Any], Any, dict[Any, Any]]:
+        """Returns (factory, resolved parent arguments, items, children created so far)."""
+        state = self.__dict__.get(_STATE_NAME, None)
+        if state is None:
+            node = self.node
+            clz_or_func, bind = self._resolve(self, node.clz_or_func.clz_or_func, (), {})
+            state = (clz_or_func, bind, getattr(self.parent, node.over), {})
+            _field_assign(self, _STATE_NAME, state)
+        return state
+
+    def _child(self, key: Any) -> Any:
+        clz_or_func, bind, items, children = self._state()
+        try:
+            return children[key]
+        except KeyError:
+            pass
+        item = items[key]
+        args = dict(bind)
+        param = self.node.param
+        if param is None:
+            args.update(item)
+        else:
+            args[param] = item
+        child = children[key] = self._call_resolved(self, clz_or_func, args)
+        return child
+
+    def __len__(self) -> int:
+        return len(self._state()[2])
+
+    def _can_materialize(self) -> bool:
+        # Items that are dicts of arguments are assumed to complete the arguments.
+        return self.node.param is None or super()._can_materialize()
+
+    def _materialize_params(self) -> Iterable[str]:
+        return (*self.node.expose_map, self.node.param)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(node={repr(self.node)})"
+
+
+class BoundNodeArray(_BoundFanOut, Sequence):
+    """The sequence of children of a NodeArray field, created on first access."""
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._child(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"{self.name} index out of range")
+        return self._child(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self._child(i)
+
+    def _materialize(self) -> list[Any]:
+        return list(self)
+
+
+class BoundNodeMap(_BoundFanOut, Mapping):
+    """The mapping of children of a NodeMap field, created on first access."""
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._child(key)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._state()[2])
+
+    def _materialize(self) -> dict[Any, Any]:
+        return dict(self.items())
@@ -0,0 +1,162 @@
+"""
+Stable content fingerprints of datatree parameter sets.
+
+    key = datatrees.fingerprint(model)  # A hex digest, e.g. for a render cache.
+
+The fingerprint is a SHA-256 digest of the init field values of an instance and of
+the field layout of its class (the qualified class name and the name, type and kind
+of each field). It is the same in every process and session, unlike hash(), so it
+can be used as a key for persistent or distributed caches, and it changes when the
+fields of the class change (e.g. fields injected by a Node).
+
+Values are encoded by content: None, bool, int, float, complex, str, bytes, lists,
+tuples, dicts, sets, enums, module level classes and functions (by qualified name), nested
+dataclass and datatree instances (recursively) and objects providing a
+__fingerprint__() method returning any of these. BoundNode fields are skipped. Other
+values raise TypeError since their repr is not guaranteed to be stable.
+
+Fingerprints of frozen instances are cached on the instance.
+"""
+
+from dataclasses import _FIELD, _FIELD_INITVAR
+import enum
+import hashlib
+import types
+from typing import Any
+
+from .datatrees import BoundNode
+
+
+# Instance dict entry holding the cached fingerprint of a frozen instance.
+_FINGERPRINT_NAME = "__datatree_fingerprint__"
+
+_LAYOUTS: dict[type, bytes] = {}
+
+
+def _qualified_name(obj: Any) -> str:
+    return f"{obj.__module__}.{obj.__qualname__}"
+
+
+def _text(tag: bytes, text: str) -> bytes:
+    data = text.encode("utf-8")
+    return tag + str(len(data)).encode() + b":" + data
+
+
+def _class_layout(clz: type) -> bytes:
+    """Returns the encoding of the field layout of a dataclass."""
+    layout = _LAYOUTS.get(clz, None)
+    if layout is None:
+        parts = [_text(b"C", _qualified_name(clz))]
+        for f in clz.__dataclass_fields__.values():  # type: ignore
+            if f._field_type is not _FIELD and f._field_type is not _FIELD_INITVAR:
+                continue
+            kind = "v" if f._field_type is _FIELD_INITVAR else ("i" if f.init else "n")
+            parts.append(_text(b"F", f"{kind}{f.name}:{f.type}"))
+        layout = hashlib.sha256(b"".join(parts)).digest()
+        _LAYOUTS[clz] = layout
+    return layout
+
+
+def _encode_instance(instance: Any, out: list[bytes]):
+    out.append(b"D")
+    out.append(_fingerprint_digest(instance))
+
+
+def _encode(value: Any, out: list[bytes]):
+    """Appends the stable encoding of value to out."""
+    value_type = type(value)
+    if value is None:
+        out.append(b"N")
+    elif value_type is bool:
+        out.append(b"T" if value else b"F")
+    elif value_type is str:
+        out.append(_text(b"s", value))
+    elif isinstance(value, enum.Enum):
+        out.append(_text(b"E", f"{_qualified_name(value_type)}.{value.name}"))
+    elif value_type is int or isinstance(value, int):
+        out.append(_text(b"i", str(int(value))))
+    elif isinstance(value, float):
+        out.append(_text(b"f", repr(float(value))))
+    elif isinstance(value, complex):
+        out.append(_text(b"c", repr(complex(value))))
+    elif isinstance(value, (bytes, bytearray)):
+        out.append(b"b" + str(len(value)).encode() + b":" + bytes(value))
+    elif isinstance(value, str):
+        out.append(_text(b"s", str(value)))
+    elif hasattr(value_type, "__dataclass_fields__"):
+        _encode_instance(value, out)
+    elif isinstance(value, (list, tuple)):
+        out.append((b"l" if isinstance(value, list) else b"t") + str(len(value)).encode() + b":")
+        for item in value:
+            _encode(item, out)
+    elif isinstance(value, dict):
+        entries = []
+        for k, v in value.items():
+            entry: list[bytes] = []
+            _encode(k, entry)
+            _encode(v, entry)
+            entries.append(b"".join(entry))
+        out.append(b"d" + str(len(entries)).encode() + b":")
+        out.extend(sorted(entries))
+    elif isinstance(value, (set, frozenset)):
+        items = []
+        for item in value:
+            entry = []
+            _encode(item, entry)
+            items.append(b"".join(entry))
+        out.append(b"S" + str(len(items)).encode() + b":")
+        out.extend(sorted(items))
+    elif isinstance(value, (type, types.FunctionType, types.BuiltinFunctionType)):
+        name = _qualified_name(value)
+        if "<" in name:
+            # Lambdas and local definitions don't have a unique name.
+            raise TypeError(f"Can't fingerprint {value!r}, it has no unique qualified name")
+        out.append(_text(b"Q", name))
+    elif hasattr(value, "__fingerprint__"):
+        out.append(_text(b"X", _qualified_name(value_type)))
+        _encode(value.__fingerprint__(), out)
+    else:
+        raise TypeError(f"Can't fingerprint value of type {value_type.__qualname__}: {value!r}")
+
+
+def _fingerprint_digest(instance: Any) -> bytes:
+    """Returns the fingerprint digest of a dataclass instance, cached if frozen."""
+    clz = type(instance)
+    instance_dict = getattr(instance, "__dict__", None)
+    cacheable = type(instance_dict) is dict and clz.__dataclass_params__.frozen  # type: ignore
+    if cacheable:
+        cached = instance_dict.get(_FINGERPRINT_NAME, None)  # type: ignore
+        if cached is not None:
+            return cached
+
+    out = [_class_layout(clz)]
+    for f in clz.__dataclass_fields__.values():  # type: ignore
+        if not f.init or f._field_type is not _FIELD:
+            continue
+        value = getattr(instance, f.name)
+        if isinstance(value, BoundNode):
+            continue
+        out.append(_text(b"n", f.name))
+        _encode(value, out)
+    digest = hashlib.sha256(b"".join(out)).digest()
+
+    if cacheable:
+        instance_dict[_FINGERPRINT_NAME] = digest  # type: ignore
+    return digest
+
+
+def fingerprint(instance: Any) -> str:
+    """Returns a stable hex digest of the init field values of a datatree (or
+    dataclass) instance and the field layout of its class.
+
+    Raises:
+      TypeError: If a field value can't be fingerprinted.
+    """
+    return _fingerprint_digest(instance).hex()
+
+
+def fingerprint_value(value: Any) -> str:
+    """Returns a stable hex digest of any value supported by fingerprint()."""
+    out: list[bytes] = []
+    _encode(value, out)
+    return hashlib.sha256(b"".join(out)).hexdigest()
@@ -0,0 +1,191 @@
+"""
+Memory footprint of datatree instances.
+
+    fp = datatrees.sizeof(model)
+    print(fp.table())
+    print(fp.bookkeeping, fp.data)
+
+The bytes of an instance are broken down into the instance object itself (the
+object and its __dict__), regular field values, injected field values (fields
+added by Node mappings), BoundNode objects, chained BoundNodes (created when a
+BoundNode is passed to a child) and self_default results.
+
+With deep=True, field values are sized recursively and datatree (or dataclass)
+instances found within them (e.g. a self_default building children) are broken
+down the same way so the totals cover the whole tree. Objects are counted once
+even if shared. Classes, functions, modules and the class level Node and
+self_default specifications are shared by all instances and never counted.
+"""
+
+from dataclasses import _FIELD, dataclass, field
+import sys
+import types
+from typing import Any
+
+from .datatrees import (
+    BindingDefault,
+    BoundNode,
+    DATATREE_INJECTED_NAME,
+    DATATREE_SENTIENEL_NAME,
+    Node,
+)
+
+
+_SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+    Node,
+    BindingDefault,
+)
+
+_CATEGORIES = (
+    "instance",
+    "fields",
+    "injected_fields",
+    "bound_nodes",
+    "chained_bound_nodes",
+    "self_default_results",
+)
+
+
+@dataclass
+class Footprint:
+    """The bytes used by an instance (and with deep=True, its descendants) by category."""
+
+    instances: int = 0
+    instance: int = 0
+    fields: int = 0
+    injected_fields: int = 0
+    bound_nodes: int = 0
+    chained_bound_nodes: int = 0
+    self_default_results: int = 0
+    per_field: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(getattr(self, name) for name in _CATEGORIES)
+
+    @property
+    def bookkeeping(self) -> int:
+        """The bytes used by BoundNode and chained BoundNode objects."""
+        return self.bound_nodes + self.chained_bound_nodes
+
+    @property
+    def data(self) -> int:
+        """The bytes used by field values, injected field values and self_default results."""
+        return self.fields + self.injected_fields + self.self_default_results
+
+    def table(self) -> str:
+        """Returns the breakdown formatted as a text table."""
+        total = self.total or 1
+        rows = [f"{'category':<24}{'bytes':>12}{'%':>8}"]
+        for name in _CATEGORIES:
+            value = getattr(self, name)
+            rows.append(f"{name:<24}{value:>12}{value * 100 / total:>8.1f}")
+        rows.append(f"{'total':<24}{self.total:>12}{100.0:>8.1f}")
+        rows.append(f"{'instances':<24}{self.instances:>12}")
+        return "\n".join(rows)
+
+
+def _object_size(obj: Any) -> int:
+    """The size of obj and its __dict__ (if any) but not of the values."""
+    size = sys.getsizeof(obj)
+    obj_dict = getattr(obj, "__dict__", None)
+    if type(obj_dict) is dict:
+        size += sys.getsizeof(obj_dict)
+    return size
+
+
+class _Sizer:
+    def __init__(self, deep: bool):
+        self.deep = deep
+        self.seen: set[int] = set()
+        self.result = Footprint()
+
+    def value_size(self, value: Any) -> int:
+        """The size of a field value, deep values are broken down by the category of
+        the datatree instances they contain."""
+        if isinstance(value, _SHARED_TYPES) or id(value) in self.seen:
+            return 0
+        self.seen.add(id(value))
+        if not self.deep:
+            return sys.getsizeof(value)
+        if hasattr(type(value), "__dataclass_fields__"):
+            self.add_instance(value)
+            return 0
+
+        size = _object_size(value)
+        if isinstance(value, (str, bytes, int, float, complex, bool)):
+            return size
+        if isinstance(value, dict):
+            items: Any = (v for kv in value.items() for v in kv)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            items = value
+        elif type(getattr(value, "__dict__", None)) is dict:
+            items = value.__dict__.values()
+        else:
+            items = ()
+        for item in items:
+            size += self.value_size(item)
+        return size
+
+    def add_instance(self, instance: Any, top_level: bool = False):
+        result = self.result
+        clz = type(instance)
+        self.seen.add(id(instance))
+        result.instances += 1
+        result.instance += _object_size(instance)
+
+        nodes = getattr(clz, DATATREE_SENTIENEL_NAME, {})
+        injected = getattr(clz, DATATREE_INJECTED_NAME, ())
+        for f in clz.__dataclass_fields__.values():
+            if f._field_type is not _FIELD:
+                continue
+            value = getattr(instance, f.name, None)
+            before = result.total
+            if isinstance(value, BoundNode):
+                # The BoundNode it chains (if any) belongs to the parent instance.
+                if id(value) not in self.seen:
+                    self.seen.add(id(value))
+                    if value.chained_node is None:
+                        result.bound_nodes += _object_size(value)
+                    else:
+                        result.chained_bound_nodes += _object_size(value)
+            else:
+                field_size = self.value_size(value)
+                if isinstance(nodes.get(f.name, None), BindingDefault):
+                    result.self_default_results += field_size
+                elif f.name in injected:
+                    result.injected_fields += field_size
+                else:
+                    result.fields += field_size
+            if top_level:
+                result.per_field[f.name] = result.total - before
+
+        # Attributes that are not fields, e.g. assigned in __post_init__.
+        instance_dict = getattr(instance, "__dict__", None)
+        if type(instance_dict) is dict:
+            for name, value in instance_dict.items():
+                if name in clz.__dataclass_fields__ or name.startswith("__"):
+                    continue
+                before = result.total
+                result.fields += self.value_size(value)
+                if top_level:
+                    result.per_field[name] = result.total - before
+
+
+def sizeof(instance: Any, deep: bool = True) -> Footprint:
+    """Returns the memory footprint of a datatree (or dataclass) instance.
+
+    Args:
+      instance: The datatree instance.
+      deep: If True field values are sized recursively including the datatree
+        instances they contain, otherwise only the value objects are sized.
+    """
+    sizer = _Sizer(deep)
+    sizer.add_instance(instance, top_level=True)
+    return sizer.result
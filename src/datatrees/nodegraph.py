@@ -0,0 +1,131 @@
+"""
+The class level graph of the Node targets of a datatree class.
+
+    graph = datatrees.node_graph(Assembly)
+    graph.build_order   # Targets with their Node targets before them, leaves first.
+    graph.depth         # The number of Node levels below Assembly.
+    graph.fan_out[Plate]
+
+The vertices are the root class and every Node target (clz_or_func) reachable from
+it. Each datatree class has an edge to the target of each of its Node fields (in
+field order). Functions and classes that are not datatrees are leaves. The graph only
+depends on the class definitions so it's computed once per root class and cached.
+Traversals are iterative so deep hierarchies don't hit the recursion limit.
+"""
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Mapping
+
+from .datatrees import DATATREE_SENTIENEL_NAME, Node
+
+
+class NodeGraphCycle(Exception):
+    """The Node targets of a datatree class form a cycle."""
+
+
+def _node_edges(target: Any) -> tuple[tuple[str, Any], ...]:
+    """Returns (field name, Node target) of the Node fields of target."""
+    nodes = getattr(target, DATATREE_SENTIENEL_NAME, None) if isinstance(target, type) else None
+    if not nodes:
+        return ()
+    return tuple(
+        (name, node.clz_or_func.clz_or_func)
+        for name, node in nodes.items()
+        if isinstance(node, Node) and node.clz_or_func
+    )
+
+
+@dataclass(frozen=True)
+class NodeGraph:
+    """The graph of Node targets reachable from root.
+
+    edges: (field name, target) of the Node fields of each vertex (leaves have none).
+    cycle: The vertices of a cycle (the first vertex repeated last) if there is one.
+    heights: The length of the longest path from each vertex to a leaf, edges closing
+        a cycle are ignored.
+    """
+
+    root: type
+    edges: Mapping[Any, tuple[tuple[str, Any], ...]]
+    cycle: tuple[Any, ...] | None
+    heights: Mapping[Any, int]
+    # Vertices in depth first post-order, used for build_order.
+    _post_order: tuple[Any, ...] = field(repr=False)
+
+    @cached_property
+    def children(self) -> Mapping[Any, tuple[Any, ...]]:
+        """The distinct Node targets of each vertex in field order."""
+        return {v: tuple(dict.fromkeys(t for _, t in e)) for v, e in self.edges.items()}
+
+    @cached_property
+    def fan_out(self) -> Mapping[Any, int]:
+        """The number of Node fields of each vertex."""
+        return {v: len(e) for v, e in self.edges.items()}
+
+    @property
+    def depth(self) -> int:
+        """The number of Node levels below the root."""
+        return self.heights[self.root]
+
+    @property
+    def build_order(self) -> tuple[Any, ...]:
+        """The vertices in topological order, each after all of its Node targets.
+
+        Raises:
+          NodeGraphCycle: If the graph has a cycle.
+        """
+        if self.cycle is not None:
+            names = " -> ".join(getattr(v, "__qualname__", repr(v)) for v in self.cycle)
+            raise NodeGraphCycle(f"Node targets form a cycle: {names}")
+        return self._post_order
+
+
+# Cache of the Node graph of each root class.
+_NODE_GRAPHS: dict[type, NodeGraph] = {}
+
+
+def _build_graph(root: type) -> NodeGraph:
+    edges: dict[Any, tuple[tuple[str, Any], ...]] = {root: _node_edges(root)}
+    heights: dict[Any, int] = {}
+    post_order: list[Any] = []
+    cycle: tuple[Any, ...] | None = None
+    # The path from the root with an iterator over the remaining targets of each vertex.
+    path: list[Any] = [root]
+    on_path: set[int] = {id(root)}
+    stack = [iter(edges[root])]
+    while stack:
+        edge = next(stack[-1], None)
+        if edge is None:
+            stack.pop()
+            vertex = path.pop()
+            on_path.discard(id(vertex))
+            heights[vertex] = max(
+                (heights[t] + 1 for _, t in edges[vertex] if t in heights), default=0
+            )
+            post_order.append(vertex)
+            continue
+        target = edge[1]
+        if id(target) in on_path:
+            if cycle is None:
+                start = next(i for i, v in enumerate(path) if v is target)
+                cycle = tuple(path[start:]) + (target,)
+            continue
+        if target in edges:
+            continue
+        edges[target] = _node_edges(target)
+        path.append(target)
+        on_path.add(id(target))
+        stack.append(iter(edges[target]))
+    return NodeGraph(root, edges, cycle, heights, tuple(post_order))
+
+
+def node_graph(clz: type) -> NodeGraph:
+    """Returns the (cached) graph of the Node targets reachable from a datatree class."""
+    graph = _NODE_GRAPHS.get(clz, None)
+    if graph is None:
+        if not hasattr(clz, DATATREE_SENTIENEL_NAME):
+            raise TypeError(f"{clz!r} is not a datatree class")
+        graph = _build_graph(clz)
+        _NODE_GRAPHS[clz] = graph
+    return graph
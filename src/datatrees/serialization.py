@@ -0,0 +1,230 @@
+"""
+Fast conversion of datatree parameters to and from plain dicts.
+
+    data = datatrees.to_dict(model)            # Only init fields.
+    model2 = datatrees.from_dict(Model, data)  # Calls Model(**...).
+    json.dumps(data)                           # If the field values are JSON types.
+
+Unlike dataclasses.asdict, BoundNode (Node) fields are never descended into, values
+are not deep copied and by default only init fields are included, i.e. self_default
+and other derived values are left out since they are recomputed by from_dict(). The
+encoders and decoders are generated per class and cached.
+"""
+
+from dataclasses import _FIELD
+from typing import Any, Callable, Union, get_args, get_origin, get_type_hints
+import types
+
+from .datatrees import (
+    BindingDefault,
+    BoundNode,
+    Node,
+    OVERRIDE_FIELD_NAME,
+    _create_fn,
+)
+
+
+_PRIMITIVES = frozenset((type(None), bool, int, float, str))
+_CONTAINERS = (list, tuple, set, frozenset)
+
+_ENCODERS: dict[tuple[type, bool], Callable[[Any], dict[str, Any]]] = {}
+_DECODERS: dict[type, Callable[[Any], Any]] = {}
+
+
+def _is_dataclass_type(typ: Any) -> bool:
+    return isinstance(typ, type) and hasattr(typ, "__dataclass_fields__")
+
+
+def _is_node_field(f: Any) -> bool:
+    return isinstance(f.default, Node) or f.name == OVERRIDE_FIELD_NAME
+
+
+def _get_types(clz: type) -> dict[str, Any]:
+    try:
+        return get_type_hints(clz)
+    except Exception:
+        return {f.name: f.type for f in clz.__dataclass_fields__.values()}  # type: ignore
+
+
+def _encode_value(value: Any, init_only: bool) -> Any:
+    """Encodes values of fields without a primitive annotation."""
+    value_type = type(value)
+    if value_type in _PRIMITIVES:
+        return value
+    if hasattr(value_type, "__dataclass_fields__"):
+        return _get_encoder(value_type, init_only)(value)
+    if value_type is list or value_type is tuple:
+        return [_encode_value(v, init_only) for v in value]
+    if value_type is dict:
+        return {k: _encode_value(v, init_only) for k, v in value.items()}
+    if value_type is set or value_type is frozenset:
+        return [_encode_value(v, init_only) for v in value]
+    if isinstance(value, (BoundNode, BindingDefault)):
+        raise TypeError(f"{value!r} can't be converted to a dict value")
+    return value
+
+
+def _get_encoder(clz: type, init_only: bool) -> Callable[[Any], dict[str, Any]]:
+    encoder = _ENCODERS.get((clz, init_only), None)
+    if encoder is None:
+        encoder = _create_encoder(clz, init_only)
+        _ENCODERS[(clz, init_only)] = encoder
+    return encoder
+
+
+def _create_encoder(clz: type, init_only: bool) -> Callable[[Any], dict[str, Any]]:
+    """Generates a function returning a dict of the (init) fields of an instance of clz."""
+    field_types = _get_types(clz)
+    entries = []
+    for f in clz.__dataclass_fields__.values():  # type: ignore
+        if f._field_type is not _FIELD or _is_node_field(f):
+            continue
+        if init_only and not f.init:
+            continue
+        if field_types.get(f.name, None) in _PRIMITIVES:
+            entries.append(f"        {f.name!r}: obj.{f.name},")
+        else:
+            entries.append(f"        {f.name!r}: _encode_value(obj.{f.name}, {init_only}),")
+
+    return _create_fn(
+        "__encode__",
+        ["def __encode__(obj):"],
+        ["    return {"] + entries + ["    }"],
+        locals={"_encode_value": _encode_value},
+    )
+
+
+def _create_value_decoder(typ: Any) -> Callable[[Any], Any] | None:
+    """Returns a function decoding values of the given annotation or None if values
+    are used as is."""
+    origin = get_origin(typ)
+    args = get_args(typ)
+    if _is_dataclass_type(typ):
+
+        def decode_datatree(value: Any) -> Any:
+            return _get_decoder(typ)(value) if type(value) is dict else value
+
+        return decode_datatree
+
+    if origin is Union or origin is types.UnionType:
+        decoders = [_create_value_decoder(a) for a in args if a is not type(None)]
+        decoders = [d for d in decoders if d is not None]
+        return decoders[0] if len(decoders) == 1 else None
+
+    if origin is dict and len(args) == 2:
+        value_decoder = _create_value_decoder(args[1])
+        if value_decoder is None:
+            return None
+
+        def decode_dict(value: Any) -> Any:
+            if type(value) is not dict:
+                return value
+            return {k: value_decoder(v) for k, v in value.items()}
+
+        return decode_dict
+
+    if typ in _CONTAINERS:
+        origin = typ
+    if origin in _CONTAINERS:
+        if origin is tuple and args and not (len(args) == 2 and args[1] is Ellipsis):
+            return _create_tuple_decoder(args)
+        item_decoder = _create_value_decoder(args[0]) if args else None
+        if item_decoder is None:
+            if origin is list:
+                return None
+
+            def decode_container(value: Any) -> Any:
+                if not isinstance(value, (list, tuple)) or type(value) is origin:
+                    return value
+                return origin(value)
+
+            return decode_container
+
+        def decode_sequence(value: Any) -> Any:
+            if not isinstance(value, (list, tuple)):
+                return value
+            return origin(item_decoder(v) for v in value)
+
+        return decode_sequence
+    return None
+
+
+def _create_tuple_decoder(args: tuple[Any, ...]) -> Callable[[Any], Any]:
+    """Returns a function decoding values of a fixed length tuple annotation."""
+    item_decoders = [_create_value_decoder(a) for a in args]
+
+    def decode_tuple(value: Any) -> Any:
+        if not isinstance(value, (list, tuple)) or len(value) != len(item_decoders):
+            return value
+        return tuple(v if d is None else d(v) for d, v in zip(item_decoders, value))
+
+    return decode_tuple
+
+
+def _get_decoder(clz: type) -> Callable[[Any], Any]:
+    decoder = _DECODERS.get(clz, None)
+    if decoder is None:
+        decoder = _create_decoder(clz)
+        _DECODERS[clz] = decoder
+    return decoder
+
+
+def _create_decoder(clz: type) -> Callable[[Any], Any]:
+    """Generates a function constructing clz from a dict of its init field values.
+    Missing keys use the field defaults and keys that are not init fields are ignored."""
+    field_types = _get_types(clz)
+    local_vars: dict[str, Any] = {"clz": clz}
+    names = []
+    values = []
+    for f in clz.__dataclass_fields__.values():  # type: ignore
+        if not f.init or f._field_type is not _FIELD or _is_node_field(f):
+            continue
+        value_decoder = _create_value_decoder(field_types.get(f.name, f.type))
+        if value_decoder is None:
+            values.append(f"data[{f.name!r}]")
+        else:
+            local_vars[f"_decode_{f.name}"] = value_decoder
+            values.append(f"_decode_{f.name}(data[{f.name!r}])")
+        names.append(f.name)
+    local_vars["_keys"] = frozenset(names)
+
+    # Fast path when all the init fields are provided, otherwise only pass the
+    # provided ones.
+    body = [
+        "    if data.keys() >= _keys:",
+        "        return clz("
+        + ", ".join(f"{name}={value}" for name, value in zip(names, values))
+        + ")",
+        "    kwds = {}",
+    ]
+    for name, value in zip(names, values):
+        body.append(f"    if {name!r} in data:")
+        body.append(f"        kwds[{name!r}] = {value}")
+    body.append("    return clz(**kwds)")
+
+    return _create_fn("__decode__", ["def __decode__(data):"], body, locals=local_vars)
+
+
+def to_dict(instance: Any, init_only: bool = True) -> dict[str, Any]:
+    """Returns a dict of the field values of a datatree (or dataclass) instance.
+
+    Node fields are excluded. Nested dataclass values are converted to dicts and
+    lists, tuples and sets to lists.
+
+    Args:
+      instance: The datatree instance.
+      init_only: If True only init fields are included, otherwise derived fields
+        like self_default fields are also included.
+    """
+    return _get_encoder(type(instance), init_only)(instance)
+
+
+def from_dict(clz: type, data: dict[str, Any]) -> Any:
+    """Constructs clz from a dict of init field values as created by to_dict().
+
+    Nested dicts are converted for fields annotated with a dataclass type (or an
+    Optional, list, set, tuple or dict values of one) and lists are converted back to
+    the tuple, set or frozenset of the annotation. Missing fields use their defaults
+    and entries that are not init fields are ignored.
+    """
+    return _get_decoder(clz)(data)
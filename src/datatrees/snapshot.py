@@ -0,0 +1,468 @@
+"""
+Compact immutable snapshots of evaluated datatree trees.
+
+    snap = datatrees.snapshot(model)          # A BoundNode free copy of the evaluated tree.
+    snap.root.width                           # Field values of the root instance.
+    snap.root.holes[2].radius                 # Child instances are records too.
+    snap.tables["mymodule.Hole"].column("radius")   # A memoryview of float64 values.
+    snap.save("model.dtsnap")
+    snap = datatrees.Snapshot.load("model.dtsnap")  # Memory mapped, nothing is copied.
+
+A snapshot holds a table per class (datatree or dataclass) with a row per instance and
+a column per field (struct of arrays). Columns of float, int and bool values are arrays
+of float64, int64 and int8. Columns of instances (or None) are int64 references to a
+table row. Other values (strings, tuples, lists and dicts including instances) are
+encoded per row as JSON. Everything is stored in a single buffer:
+
+    magic (8 bytes) | header length (uint64) | JSON header | 8 byte aligned columns
+
+and a snapshot is a read-only view of such a buffer (bytes, mmap, shared memory, ...).
+Records decode values on access. Processes share a snapshot by placing it in shared
+memory and attaching to it by name, without pickling:
+
+    shm = snap.to_shared_memory()             # In the parent, pass shm.name to workers.
+    with datatrees.Snapshot.attach(name) as snap:   # In a worker.
+        ...
+"""
+
+from array import array
+from dataclasses import _FIELD
+import json
+import mmap
+from multiprocessing import resource_tracker, shared_memory
+import os
+import struct
+import sys
+from typing import Any, Iterable, Iterator
+
+from .datatrees import BoundNode
+
+
+_MAGIC = b"DTSNAP01"
+_HEADER = struct.Struct("<8sQ")
+_ALIGN = 8
+_NONE_REF = -1
+# Row references are (table index << _ROW_BITS) | row.
+_ROW_BITS = 32
+
+# Column kinds and the memoryview format of their arrays.
+_FLOAT, _INT, _BOOL, _REF, _OBJECT = "f", "i", "b", "r", "o"
+_FORMATS = {_FLOAT: "d", _INT: "q", _BOOL: "b", _REF: "q", _OBJECT: "q"}
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+def _is_instance(value: Any) -> bool:
+    return hasattr(type(value), "__dataclass_fields__") and not isinstance(value, type)
+
+
+def _class_name(clz: type) -> str:
+    return f"{clz.__module__}.{clz.__qualname__}"
+
+
+class _Builder:
+    """Collects the instances of a tree and encodes them as tables."""
+
+    def __init__(self, materialize: bool | Iterable[str]):
+        if isinstance(materialize, bool):
+            self.materialize_all = materialize
+            self.materialize_names: frozenset[str] = frozenset()
+        else:
+            self.materialize_all = False
+            self.materialize_names = frozenset(materialize)
+        self.classes: list[type] = []
+        self.class_index: dict[type, int] = {}
+        # The rows of each table, {field name: value}.
+        self.rows: list[list[dict[str, Any]]] = []
+        # id(instance) -> reference. Instances are kept alive by self.kept.
+        self.refs: dict[int, int] = {}
+        self.kept: list[Any] = []
+
+    def field_values(self, instance: Any) -> dict[str, Any]:
+        values = {}
+        for f in type(instance).__dataclass_fields__.values():
+            if f._field_type is not _FIELD:
+                continue
+            value = getattr(instance, f.name, None)
+            if isinstance(value, BoundNode):
+                if f.name in self.materialize_names:
+                    value = value._materialize()
+                elif self.materialize_all and value._can_materialize():
+                    value = value._materialize()
+                else:
+                    continue
+            values[f.name] = value
+        return values
+
+    def add(self, instance: Any) -> int:
+        """Adds instance and every instance reachable from its field values."""
+        root = self.reference(instance)
+        pending = [instance]
+        while pending:
+            current = pending.pop()
+            table, row = self.split(self.refs[id(current)])
+            values = self.field_values(current)
+            self.rows[table][row] = values
+            # Find the instances held by the values (also within containers), rows are
+            # assigned in field and item order.
+            stack = list(reversed(values.values()))
+            while stack:
+                value = stack.pop()
+                if _is_instance(value):
+                    if id(value) not in self.refs:
+                        self.reference(value)
+                        pending.append(value)
+                elif isinstance(value, (list, tuple)):
+                    stack.extend(reversed(value))
+                elif isinstance(value, dict):
+                    for item in reversed(value.items()):
+                        stack.extend(reversed(item))
+        return root
+
+    def reference(self, instance: Any) -> int:
+        clz = type(instance)
+        table = self.class_index.get(clz, None)
+        if table is None:
+            table = self.class_index[clz] = len(self.classes)
+            self.classes.append(clz)
+            self.rows.append([])
+        rows = self.rows[table]
+        ref = (table << _ROW_BITS) | len(rows)
+        rows.append({})
+        self.refs[id(instance)] = ref
+        self.kept.append(instance)
+        return ref
+
+    @staticmethod
+    def split(ref: int) -> tuple[int, int]:
+        return ref >> _ROW_BITS, ref & ((1 << _ROW_BITS) - 1)
+
+    def encode_object(self, value: Any) -> Any:
+        """Returns the JSON compatible encoding of a value. JSON objects are markers:
+        {"r": ref}, {"t": [items]} and {"d": [[key, value], ...]}."""
+        if value is None or type(value) in (bool, int, float, str):
+            return value
+        if _is_instance(value):
+            return {"r": self.refs[id(value)]}
+        if isinstance(value, tuple):
+            return {"t": [self.encode_object(v) for v in value]}
+        if isinstance(value, list):
+            return [self.encode_object(v) for v in value]
+        if isinstance(value, dict):
+            return {"d": [[self.encode_object(k), self.encode_object(v)] for k, v in value.items()]}
+        raise TypeError(f"Can't snapshot value of type {type(value).__qualname__}: {value!r}")
+
+    def column(self, values: list[Any]) -> tuple[str, list[bytes]]:
+        """Returns the kind and the encoded arrays of a column."""
+        types = {type(v) for v in values}
+        if types == {float}:
+            return _FLOAT, [array("d", values).tobytes()]
+        if types == {bool}:
+            return _BOOL, [array("b", values).tobytes()]
+        if types == {int} and all(_INT64_MIN <= v <= _INT64_MAX for v in values):
+            return _INT, [array("q", values).tobytes()]
+        if all(v is None or _is_instance(v) for v in values) and types != {type(None)}:
+            refs = [_NONE_REF if v is None else self.refs[id(v)] for v in values]
+            return _REF, [array("q", refs).tobytes()]
+        data = bytearray()
+        offsets = array("q", [0])
+        for value in values:
+            data += json.dumps(self.encode_object(value), separators=(",", ":")).encode()
+            offsets.append(len(data))
+        return _OBJECT, [offsets.tobytes(), bytes(data)]
+
+    def build(self, root: int) -> bytes:
+        sections: list[bytes] = []
+        offset = 0
+
+        def add_section(data: bytes) -> list[int]:
+            nonlocal offset
+            sections.append(data)
+            sections.append(b"\0" * (-len(data) % _ALIGN))
+            location = [offset, len(data)]
+            offset += len(data) + (-len(data) % _ALIGN)
+            return location
+
+        tables = []
+        names: set[str] = set()
+        for clz, rows in zip(self.classes, self.rows):
+            name = _class_name(clz)
+            while name in names:  # Distinct classes with the same qualified name.
+                name += "'"
+            names.add(name)
+            columns = []
+            for f in clz.__dataclass_fields__.values():
+                if f._field_type is not _FIELD or not any(f.name in row for row in rows):
+                    continue
+                values = [row.get(f.name, None) for row in rows]
+                kind, arrays = self.column(values)
+                columns.append({"name": f.name, "kind": kind, "arrays": [add_section(a) for a in arrays]})
+            tables.append({"name": name, "rows": len(rows), "columns": columns})
+
+        header = json.dumps(
+            {"byteorder": sys.byteorder, "root": root, "tables": tables}, separators=(",", ":")
+        ).encode()
+        header += b" " * (-(len(header) + _HEADER.size) % _ALIGN)
+        return _HEADER.pack(_MAGIC, len(header)) + header + b"".join(sections)
+
+
+class Record:
+    """A read-only view of a snapshot row, the field values are attributes."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: "Table", row: int):
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_row", row)
+
+    def __getattr__(self, name: str) -> Any:
+        column = self._table._columns.get(name, None)
+        if column is None:
+            raise AttributeError(f"{self._table.name} record has no field {name!r}")
+        return column.value(self._row)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("Snapshot records are read-only")
+
+    def _asdict(self) -> dict[str, Any]:
+        """Returns the field values (child instances remain records)."""
+        return {name: column.value(self._row) for name, column in self._table._columns.items()}
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Record):
+            return NotImplemented
+        return self._table is other._table and self._row == other._row
+
+    def __hash__(self) -> int:
+        return hash((id(self._table), self._row))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in self._asdict().items())
+        return f"Record[{self._table.name}]({fields})"
+
+
+class _Column:
+    def __init__(self, snapshot: "Snapshot", kind: str, array: memoryview, data: memoryview | None):
+        self.snapshot = snapshot
+        self.kind = kind
+        self.array = array
+        self.data = data
+
+    def value(self, row: int) -> Any:
+        kind = self.kind
+        if kind == _FLOAT or kind == _INT:
+            return self.array[row]
+        if kind == _BOOL:
+            return bool(self.array[row])
+        if kind == _REF:
+            return self.snapshot._record(self.array[row])
+        encoded = self.data[self.array[row] : self.array[row + 1]]  # type: ignore
+        return self.snapshot._decode(json.loads(bytes(encoded)))
+
+
+class Table:
+    """The rows of the instances of one class in a snapshot."""
+
+    def __init__(self, name: str, rows: int, columns: dict[str, _Column]):
+        self.name = name
+        self.rows = rows
+        self._columns = columns
+
+    @property
+    def column_names(self) -> tuple[str, ...]:
+        return tuple(self._columns)
+
+    def column(self, name: str) -> Any:
+        """Returns a column: a memoryview of float64, int64 or int8 (bool) values, a
+        memoryview of int64 row references (-1 for None) or, for other values, a list."""
+        column = self._columns[name]
+        if column.kind == _OBJECT:
+            return [column.value(i) for i in range(self.rows)]
+        return column.array
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, row: int) -> Record:
+        if not 0 <= row < self.rows:
+            raise IndexError(f"{self.name} row {row} out of range")
+        return Record(self, row)
+
+    def __iter__(self) -> Iterator[Record]:
+        return (Record(self, i) for i in range(self.rows))
+
+    def __repr__(self) -> str:
+        return f"Table({self.name!r}, rows={self.rows}, columns={self.column_names})"
+
+
+class Snapshot:
+    """A read-only view of a snapshot buffer, see snapshot()."""
+
+    def __init__(self, buffer: Any, owner: Any = None):
+        """Args:
+        buffer: The snapshot buffer, viewed without copying.
+        owner: An object closed by close() (e.g. the mmap or SharedMemory of buffer).
+        """
+        view = memoryview(buffer).toreadonly()
+        # All the views of buffer, released by close().
+        self._views = [view]
+        magic, header_len = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC:
+            raise ValueError("Not a datatree snapshot buffer")
+        start = _HEADER.size + header_len
+        header = json.loads(bytes(view[_HEADER.size : start]))
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"Snapshot byte order {header['byteorder']} isn't {sys.byteorder}")
+        self._buffer = buffer
+        self._owner = owner
+        self._view = view
+        self.nbytes = view.nbytes
+        self.tables: dict[str, Table] = {}
+        self._tables: list[Table] = []
+        for table in header["tables"]:
+            columns = {}
+            for c in table["columns"]:
+                arrays = [self._slice(start + o, n) for o, n in c["arrays"]]
+                array = arrays[0].cast(_FORMATS[c["kind"]])
+                self._views.append(array)
+                columns[c["name"]] = _Column(self, c["kind"], array, arrays[1] if len(arrays) > 1 else None)
+            result = Table(table["name"], table["rows"], columns)
+            self.tables[result.name] = result
+            self._tables.append(result)
+        self.root = self._record(header["root"])
+
+    def _slice(self, offset: int, length: int) -> memoryview:
+        view = self._view[offset : offset + length]
+        self._views.append(view)
+        return view
+
+    def _record(self, ref: int) -> Record | None:
+        if ref == _NONE_REF:
+            return None
+        return Record(self._tables[ref >> _ROW_BITS], ref & ((1 << _ROW_BITS) - 1))
+
+    def _decode(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self._decode(v) for v in value]
+        if isinstance(value, dict):
+            if "r" in value:
+                return self._record(value["r"])
+            if "t" in value:
+                return tuple(self._decode(v) for v in value["t"])
+            return {self._decode(k): self._decode(v) for k, v in value["d"]}
+        return value
+
+    def to_bytes(self) -> bytes:
+        return bytes(self._view)
+
+    def write_into(self, buffer: Any):
+        """Copies the snapshot into a writable buffer of at least nbytes bytes."""
+        memoryview(buffer)[: self.nbytes] = self._view
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            f.write(self._view)
+
+    def to_shared_memory(self, name: str | None = None) -> shared_memory.SharedMemory:
+        """Returns a new shared memory block holding a copy of the snapshot.
+
+        Other processes attach to it by name with Snapshot.attach(). The caller owns
+        the block and must close() and unlink() it when it's no longer needed.
+        """
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(self.nbytes, 1))
+        _CREATED_BLOCKS.add(shm.name)
+        try:
+            self.write_into(shm.buf)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        return shm
+
+    def close(self):
+        """Releases the views of the buffer and closes the mmap or shared memory of
+        load() and attach(). Records of the snapshot can't be used afterwards."""
+        views, self._views = self._views, []
+        for view in reversed(views):
+            view.release()
+        owner, self._owner = self._owner, None
+        if owner is not None:
+            owner.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info: Any):
+        self.close()
+
+    @classmethod
+    def from_buffer(cls, buffer: Any) -> "Snapshot":
+        """Returns a snapshot viewing buffer (e.g. bytes or mmap) without copying it."""
+        return cls(buffer)
+
+    @classmethod
+    def load(cls, path: str) -> "Snapshot":
+        """Returns a snapshot of a saved file, memory mapped read-only."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, mapped)
+
+    @classmethod
+    def attach(cls, name: str) -> "Snapshot":
+        """Returns a read-only snapshot of the shared memory block of to_shared_memory().
+
+        Nothing is copied or unpickled. close() the snapshot to detach, unlinking the
+        block is left to its creator.
+        """
+        buffer, owner = _attach_shared_memory(name)
+        try:
+            return cls(buffer, owner)
+        except BaseException:
+            owner.close()
+            raise
+
+    def __repr__(self) -> str:
+        return f"Snapshot(tables={list(self.tables)}, nbytes={self.nbytes})"
+
+
+# The names of the shared memory blocks created by to_shared_memory() in this process
+# (or, for forked processes, its parent) which are tracked by the creator.
+_CREATED_BLOCKS: set[str] = set()
+
+
+def _attach_shared_memory(name: str) -> tuple[Any, Any]:
+    """Returns (buffer, owner to close) of a shared memory block."""
+    # Attached blocks must not be tracked, the resource tracker unlinks the blocks
+    # registered by a process when it exits.
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+        # Only POSIX blocks are registered. Registering a block twice has no effect
+        # so the creator's registration is kept.
+        if os.name == "posix" and shm.name not in _CREATED_BLOCKS:
+            resource_tracker.unregister(
+                name if name.startswith("/") else "/" + name, "shared_memory"
+            )
+    return shm.buf, shm
+
+
+def snapshot(instance: Any, materialize: bool | Iterable[str] = False) -> Snapshot:
+    """Evaluates a datatree (or dataclass) instance into a compact immutable Snapshot.
+
+    Args:
+      instance: The root instance.
+      materialize: False (the default) skips the BoundNode fields, the instances they
+        built are usually held by self_default fields. True calls every BoundNode
+        field that can be called without arguments (the result is stored as the
+        field's value and its instances are included) and an iterable of field names
+        calls only the BoundNode fields of these names.
+
+    Raises:
+      TypeError: If a field holds a value that can't be stored (only None, bool, int,
+        float, str, tuples, lists, dicts and dataclass instances can).
+    """
+    if not _is_instance(instance):
+        raise TypeError(f"{type(instance).__qualname__} is not a dataclass instance")
+    builder = _Builder(materialize)
+    root = builder.add(instance)
+    return Snapshot(builder.build(root))
@@ -0,0 +1,123 @@
+"""
+Parameter sweeps over a root datatree class.
+
+    results = datatrees.sweep(
+        Bracket,
+        {"material": "steel"},
+        grid={"width": [10, 20, 30], "hole_radius": [1, 2]},
+        executor=ProcessPoolExecutor(),
+        evaluate=render,
+    )
+
+Each variant is the base kwargs updated with a point of the grid (the Cartesian
+product of the grid values) or with an entry of an explicit list of variants.
+Variants are evaluated in chunks, serially or on an executor. Within a chunk:
+
+- The first variant with each set of swept names is constructed and the following
+  ones with the same names are created with rebuild() from it, so self_default
+  values of the root that don't depend on the swept fields are shared.
+- BoundNode calls are memoized by factory and resolved arguments (and their types),
+  so subtrees built from identical arguments are built once per chunk and shared
+  between variants.
+
+Because of this sharing, factories are expected to be deterministic and their
+results should not be mutated.
+"""
+
+from dataclasses import dataclass
+import itertools
+import os
+from typing import Any, Callable, Iterable, Mapping, Sequence
+
+from .datatrees import _FACTORY_MEMO, rebuild
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """The parameters of a variant and its evaluated value."""
+
+    params: dict[str, Any]
+    value: Any
+
+
+def grid_variants(grid: Mapping[str, Iterable[Any]]) -> list[dict[str, Any]]:
+    """Returns the Cartesian product of the grid values as a list of dicts."""
+    names = tuple(grid.keys())
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def _evaluate_chunk(
+    clz: type,
+    base_kwargs: dict[str, Any],
+    variants: Sequence[dict[str, Any]],
+    evaluate: Callable[[Any], Any] | None,
+) -> list[Any]:
+    """Evaluates a chunk of variants sharing a factory memo. Runs in the worker."""
+    token = _FACTORY_MEMO.set({})
+    try:
+        results = []
+        # The first instance of each set of swept names. Variants are only rebuilt from
+        # an instance with the same names, otherwise its other values would be kept.
+        firsts: dict[frozenset[str], Any] = {}
+        for variant in variants:
+            first = firsts.get(frozenset(variant), None)
+            if first is None:
+                instance = firsts[frozenset(variant)] = clz(**{**base_kwargs, **variant})
+            else:
+                instance = rebuild(first, **variant)
+            results.append(instance if evaluate is None else evaluate(instance))
+        return results
+    finally:
+        _FACTORY_MEMO.reset(token)
+
+
+def _chunks(items: Sequence[Any], size: int) -> list[Sequence[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def sweep(
+    clz: type,
+    base_kwargs: Mapping[str, Any] | None = None,
+    grid: Mapping[str, Iterable[Any]] | None = None,
+    variants: Iterable[Mapping[str, Any]] | None = None,
+    executor: Any = None,
+    evaluate: Callable[[Any], Any] | None = None,
+    chunksize: int | None = None,
+) -> list[SweepResult]:
+    """Evaluates variants of the parameters of a datatree class.
+
+    Args:
+      clz: The root datatree class.
+      base_kwargs: The init parameters common to all variants.
+      grid: A mapping of field name to values. The variants are its Cartesian product.
+      variants: An explicit list of parameter dicts (instead of grid).
+      executor: A concurrent.futures executor. None evaluates in this process. For a
+        process pool, clz, the parameters, evaluate and its results must be picklable.
+      evaluate: Called with each instance, its result is the value of the SweepResult.
+        If None the value is the instance.
+      chunksize: The number of variants evaluated together (sharing memoized results).
+    Returns:
+      A SweepResult for each variant in order.
+    """
+    if (grid is None) == (variants is None):
+        raise ValueError("Exactly one of grid or variants must be specified.")
+    base = dict(base_kwargs or {})
+    if grid is not None:
+        points = grid_variants(grid)
+    else:
+        points = [dict(v) for v in variants]  # type: ignore
+    if not points:
+        return []
+
+    if executor is None:
+        values = _evaluate_chunk(clz, base, points, evaluate)
+    else:
+        if chunksize is None:
+            chunksize = max(1, -(-len(points) // (4 * (os.cpu_count() or 1))))
+        futures = [
+            executor.submit(_evaluate_chunk, clz, base, chunk, evaluate)
+            for chunk in _chunks(points, chunksize)
+        ]
+        values = [value for future in futures for value in future.result()]
+
+    return [SweepResult({**base, **point}, value) for point, value in zip(points, values)]
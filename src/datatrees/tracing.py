@@ -0,0 +1,151 @@
+"""
+Tracing of datatree evaluation.
+
+    with datatrees.trace() as t:
+        model = Assembly()
+        model.build()
+
+    print(t.summary_table())
+    t.write_folded("assembly.folded")  # For flamegraph.pl or speedscope.
+
+Every BoundNode call and self_default evaluation made while the trace is active is
+recorded with its node path (the chain of "Class.node_name" entries from the outermost
+traced call), its wall time and the number of resolved arguments. When no trace is
+active the only overhead is a check of a module global.
+"""
+
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Any
+
+from . import datatrees as _core
+
+
+@dataclass(frozen=True)
+class TraceRecord:
+    """A single BoundNode call or self_default evaluation."""
+
+    path: tuple[str, ...]
+    target: str
+    is_self_default: bool
+    wall_time: float
+    self_time: float
+    arg_count: int
+
+
+@dataclass
+class ClassSummary:
+    """The totals of the records of a target class or function."""
+
+    target: str
+    calls: int = 0
+    wall_time: float = 0.0
+    self_time: float = 0.0
+
+
+@dataclass
+class _Frame:
+    path: tuple[str, ...]
+    arg_count: int
+    is_self_default: bool
+    start: float
+    child_time: float = 0.0
+
+
+def _target_name(target: Any) -> str:
+    return getattr(target, "__qualname__", None) or repr(target)
+
+
+@dataclass
+class Tracer:
+    """Collects TraceRecords while installed by trace()."""
+
+    records: list[TraceRecord] = field(default_factory=list)
+    _local: threading.local = field(default_factory=threading.local, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def _stack(self) -> list[_Frame]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    def enter(self, parent_clz: type, name: str, arg_count: int, is_self_default: bool = False):
+        stack = self._stack()
+        entry = f"{parent_clz.__name__}.{name}"
+        path = stack[-1].path + (entry,) if stack else (entry,)
+        stack.append(_Frame(path, arg_count, is_self_default, time.perf_counter()))
+
+    def exit(self, target: Any):
+        end = time.perf_counter()
+        stack = self._stack()
+        frame = stack.pop()
+        wall_time = end - frame.start
+        if stack:
+            stack[-1].child_time += wall_time
+        record = TraceRecord(
+            frame.path,
+            _target_name(target),
+            frame.is_self_default,
+            wall_time,
+            wall_time - frame.child_time,
+            frame.arg_count,
+        )
+        with self._lock:
+            self.records.append(record)
+
+    def folded(self, unit: float = 1e-6) -> str:
+        """Returns the records in the folded stack format used by flamegraph tools.
+        Values are self times in the given unit (default microseconds)."""
+        totals: dict[tuple[str, ...], float] = {}
+        for record in self.records:
+            totals[record.path] = totals.get(record.path, 0.0) + record.self_time
+        return "\n".join(
+            f"{';'.join(path)} {round(total / unit)}" for path, total in totals.items()
+        )
+
+    def write_folded(self, path: str, unit: float = 1e-6):
+        with open(path, "w") as f:
+            f.write(self.folded(unit))
+            f.write("\n")
+
+    def summary(self) -> list[ClassSummary]:
+        """Returns the totals per target class or function, largest self time first."""
+        summaries: dict[str, ClassSummary] = {}
+        for record in self.records:
+            summary = summaries.get(record.target, None)
+            if summary is None:
+                summary = ClassSummary(record.target)
+                summaries[record.target] = summary
+            summary.calls += 1
+            summary.wall_time += record.wall_time
+            summary.self_time += record.self_time
+        return sorted(summaries.values(), key=lambda s: s.self_time, reverse=True)
+
+    def summary_table(self) -> str:
+        """Returns summary() formatted as a text table with times in milliseconds."""
+        rows = [f"{'target':<40}{'calls':>10}{'total ms':>12}{'self ms':>12}{'mean ms':>12}"]
+        for s in self.summary():
+            rows.append(
+                f"{s.target:<40}{s.calls:>10}{s.wall_time * 1e3:>12.3f}"
+                f"{s.self_time * 1e3:>12.3f}{s.wall_time * 1e3 / s.calls:>12.4f}"
+            )
+        return "\n".join(rows)
+
+
+class trace:
+    """Context manager installing a Tracer for the duration of the with block."""
+
+    def __init__(self, tracer: Tracer | None = None):
+        self.tracer = Tracer() if tracer is None else tracer
+        self._previous: Any = None
+
+    def __enter__(self) -> Tracer:
+        self._previous = _core._TRACER
+        _core._TRACER = self.tracer
+        return self.tracer
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any):
+        _core._TRACER = self._previous
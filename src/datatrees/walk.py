@@ -0,0 +1,143 @@
+"""
+Non-recursive traversal of instantiated datatree trees.
+
+    for path, name, value in datatrees.walk(model, order="bfs", materialize=True):
+        ...
+
+walk() yields an entry for each Node and self_default field (the fields listed in
+__datatree_nodes__) of the root instance and, below them, of every datatree
+instance found in these field values (directly or in lists, tuples and dict values).
+path is the sequence of keys (field names and list indexes or dict keys) from the
+root to the instance holding the field. Materialized NodeArray and NodeMap fields
+yield the list or dict of their children.
+
+Traversal uses an explicit stack (or queue) of generators, so arbitrarily deep trees
+don't hit the recursion limit and nothing is collected ahead of the consumer.
+"""
+
+from collections import deque
+from typing import Any, Callable, Iterator
+
+from .datatrees import BoundNode, DATATREE_SENTIENEL_NAME
+
+
+Path = tuple[Any, ...]
+WalkEntry = tuple[Path, str, Any]
+
+
+def _is_datatree(value: Any) -> bool:
+    return hasattr(type(value), DATATREE_SENTIENEL_NAME)
+
+
+def _child_instances(path: Path, value: Any) -> Iterator[tuple[Path, Any]]:
+    """Yields (path, instance) of the datatree instances held by a field value."""
+    if _is_datatree(value):
+        yield path, value
+    elif isinstance(value, (list, tuple)):
+        for i, item in enumerate(value):
+            if _is_datatree(item):
+                yield path + (i,), item
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if _is_datatree(item):
+                yield path + (key,), item
+
+
+class _Walker:
+    def __init__(
+        self,
+        materialize: bool,
+        prune: Callable[[Path, str, Any], bool] | None,
+    ):
+        self.materialize = materialize
+        self.prune = prune
+        # Visited instances by id. The instances are kept so that ids of materialized
+        # (otherwise unreferenced) instances are not reused.
+        self.visited: dict[int, Any] = {}
+
+    def entries(self, instances: Iterator[tuple[Path, Any]]) -> Iterator[tuple[WalkEntry, Any]]:
+        """Yields (entry, value to descend into or None) of the fields of instances."""
+        prune = self.prune
+        for path, instance in instances:
+            if id(instance) in self.visited:
+                continue
+            self.visited[id(instance)] = instance
+            for name in getattr(type(instance), DATATREE_SENTIENEL_NAME):
+                value = getattr(instance, name, None)
+                if prune is not None and prune(path, name, value):
+                    continue
+                if (
+                    self.materialize
+                    and isinstance(value, BoundNode)
+                    and value._can_materialize()
+                ):
+                    value = value._materialize()
+                yield (path, name, value), value
+
+    def children(self, entry: WalkEntry, value: Any) -> Iterator[tuple[WalkEntry, Any]] | None:
+        """Returns the entries below entry or None if there are no datatree instances."""
+        path, name, _ = entry
+        if isinstance(value, BoundNode) or value is None:
+            return None
+        instances = _child_instances(path + (name,), value)
+        first = next(instances, None)
+        if first is None:
+            return None
+        return self.entries(_chain_first(first, instances))
+
+
+def _chain_first(first: Any, rest: Iterator[Any]) -> Iterator[Any]:
+    yield first
+    yield from rest
+
+
+def walk(
+    instance: Any,
+    order: str = "dfs",
+    materialize: bool = False,
+    prune: Callable[[Path, str, Any], bool] | None = None,
+) -> Iterator[WalkEntry]:
+    """Yields (path, node_name, value) for the Node and self_default fields of a
+    datatree instance and of the datatree instances below it.
+
+    Args:
+      instance: The root datatree instance.
+      order: "dfs" yields each field followed by the fields below it (pre-order),
+        "bfs" yields the fields level by level.
+      materialize: If True BoundNode fields are called (when they are reached) and
+        the result is yielded and walked instead of the BoundNode. BoundNodes whose
+        factory has required parameters not bound to the parent's fields can't be
+        called without arguments and are yielded as is.
+      prune: Called with (path, node_name, value) before a field is yielded, with
+        value not yet materialized. If it returns True the field and everything below
+        it are skipped.
+
+    Instances reachable through several fields are walked once, at the first path.
+    """
+    if order not in ("dfs", "bfs"):
+        raise ValueError(f"order must be 'dfs' or 'bfs', not {order!r}")
+    if not _is_datatree(instance):
+        raise TypeError(f"{type(instance).__qualname__} is not a datatree")
+
+    walker = _Walker(materialize, prune)
+    root = walker.entries(iter((((), instance),)))
+    if order == "dfs":
+        stack = [root]
+        while stack:
+            item = next(stack[-1], None)
+            if item is None:
+                stack.pop()
+                continue
+            entry, value = item
+            yield entry
+            below = walker.children(entry, value)
+            if below is not None:
+                stack.append(below)
+    else:
+        queue = deque((root,))
+        while queue:
+            for entry, value in queue.popleft():
+                yield entry
+                below = walker.children(entry, value)
+                if below is not None:
+                    queue.append(below)
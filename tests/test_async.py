@@ -0,0 +1,130 @@
+"""
+Tests for async Node factories and async self_default fields.
+"""
+
+import asyncio
+import unittest
+
+from datatrees import datatree, dtfield, Node, BindingDefault, aresolve
+
+
+@datatree
+class Asset:
+    name: str = "bolt"
+    size: int = 1
+
+
+async def fetch_asset(name: str = "bolt", size: int = 1) -> Asset:
+    await asyncio.sleep(0)
+    return Asset(name, size)
+
+
+@datatree
+class Assembly:
+    name: str = "nut"
+    size: int = 3
+    asset: Node[fetch_asset] = Node(fetch_asset)
+    sync_asset: Node[Asset] = Node(Asset)
+
+    async def _double(self) -> int:
+        await asyncio.sleep(0)
+        return self.size * 2
+
+    doubled: int = dtfield(self_default=_double)
+    label: str = dtfield(self_default=lambda self: f"{self.name}-{self.size}")
+
+
+@datatree
+class Outer:
+    size: int = 5
+    inner: Node[Assembly] = Node(Assembly, "size")
+
+
+@datatree
+class Holder:
+    size: int = 2
+    inner: Node[Assembly] = Node(Assembly, "size")
+    made: Assembly = dtfield(self_default=lambda self: self.inner())
+    many: list = dtfield(self_default=lambda self: [self.inner(size=7)])
+
+
+async def fetch_value(self) -> int:
+    await asyncio.sleep(0)
+    return self.size * 10
+
+
+@datatree
+class Dependent:
+    size: int = 2
+    v: int = dtfield(self_default=fetch_value)
+    w: int = dtfield(self_default=lambda self: self.v)
+    x: int = dtfield(self_default=lambda self: self.w + 1)
+    y: int = dtfield(self_default=lambda self: self.size + 1)
+
+
+class TestAsync(unittest.TestCase):
+    def test_async_self_default_pending(self):
+        assembly = Assembly()
+        self.assertIsInstance(assembly.doubled, BindingDefault)
+        self.assertEqual(assembly.label, "nut-3")
+
+    def test_aresolve(self):
+        assembly = Assembly(size=4)
+        results = asyncio.run(aresolve(assembly))
+        self.assertEqual(assembly.doubled, 8)
+        self.assertEqual(results["doubled"], 8)
+        self.assertEqual(results["asset"], Asset("nut", 4))
+        self.assertNotIn("sync_asset", results)
+
+    def test_aresolve_sync_self_default_children(self):
+        holder = Holder()
+        self.assertIsInstance(holder.made.doubled, BindingDefault)
+        results = asyncio.run(aresolve(holder))
+        self.assertEqual(results, {})
+        self.assertEqual(holder.made.doubled, 4)
+        self.assertEqual(holder.many[0].doubled, 14)
+
+    def test_sync_self_default_reading_async_deferred(self):
+        dependent = Dependent()
+        self.assertIsInstance(dependent.w, BindingDefault)
+        self.assertIsInstance(dependent.x, BindingDefault)
+        self.assertEqual(dependent.y, 3)
+        results = asyncio.run(aresolve(dependent))
+        self.assertEqual(results, {"v": 20, "w": 20, "x": 21})
+        self.assertEqual((dependent.v, dependent.w, dependent.x), (20, 20, 21))
+
+    def test_acall(self):
+        assembly = Assembly(name="washer")
+        self.assertEqual(asyncio.run(assembly.asset.acall(size=9)), Asset("washer", 9))
+        self.assertEqual(asyncio.run(assembly.sync_asset.acall()), Asset("washer", 3))
+
+    def test_acall_resolves_nested(self):
+        inner = asyncio.run(Outer(size=6).inner.acall())
+        self.assertEqual(inner.doubled, 12)
+
+    def test_bounded_concurrency(self):
+        running = 0
+        peak = 0
+
+        async def slow(index: int = 0) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return index
+
+        @datatree
+        class Many:
+            index: int = 1
+            a: Node[slow] = Node(slow)
+            b: Node[slow] = Node(slow)
+            c: Node[slow] = Node(slow)
+
+        results = asyncio.run(aresolve(Many(), limit=2))
+        self.assertEqual(results, {"a": 1, "b": 1, "c": 1})
+        self.assertEqual(peak, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Tests for dataclass backends (datatree(backend=...)) and slots=True.
+"""
+
+from dataclasses import InitVar, dataclass, field
+import pickle
+import unittest
+
+import datatrees
+from datatrees import datatree, dtfield, Node, BoundNode, InvalidInternOptions
+
+
+@datatree
+class Leaf:
+    a: int = 1
+    b: int = 2
+
+
+@datatree(backend=datatrees.slotted)
+class SlottedBranch:
+    a: int = 10
+    leaf: Node[Leaf] = Node(Leaf)
+    made: Leaf = dtfield(self_default=lambda self: self.leaf())
+    tags: list = field(default_factory=list)
+
+
+@datatree(backend=datatrees.slotted, frozen=True, compact_pickle=True)
+class FrozenSlotted:
+    a: int = 10
+    leaf: Node[Leaf] = Node(Leaf)
+    twice: int = dtfield(self_default=lambda self: self.a * 2)
+
+
+@datatree(backend=datatrees.slotted)
+class PassedIn:
+    leaf: Node[Leaf] = dtfield(Node(Leaf), init=True)
+
+
+@datatree(chain_post_init=True)
+class Base:
+    x: int = 1
+    log: list = field(default_factory=list)
+
+    def __post_init__(self):
+        self.log.append("base")
+
+
+@datatree(backend=datatrees.slotted, chain_post_init=True)
+class Derived(Base):
+    y: int = 2
+    scale: InitVar[int] = 3
+
+    def __post_init__(self, scale):
+        self.log.append(("derived", scale, self.y))
+
+
+@datatree(slots=True)
+class StdSlotted:
+    a: int = 4
+    leaf: Node[Leaf] = Node(Leaf)
+    made: Leaf = dtfield(self_default=lambda self: self.leaf())
+
+
+class TestSlottedBackend(unittest.TestCase):
+    def test_nodes_and_self_defaults(self):
+        branch = SlottedBranch(b=5)
+        self.assertFalse(hasattr(branch, "__dict__"))
+        self.assertIsInstance(branch.leaf, BoundNode)
+        self.assertEqual(branch.made, Leaf(10, 5))
+        self.assertEqual(branch.leaf(a=3), Leaf(3, 5))
+        self.assertEqual(branch.tags, [])
+        self.assertIsNot(branch.tags, SlottedBranch().tags)
+
+    def test_frozen(self):
+        frozen = FrozenSlotted(a=4)
+        self.assertEqual(frozen.twice, 8)
+        self.assertEqual(frozen.leaf(), Leaf(4, 2))
+        self.assertEqual(frozen, FrozenSlotted(a=4))
+
+    def test_chained_bound_node(self):
+        branch = SlottedBranch(a=7, b=8)
+        passed = PassedIn(leaf=branch.leaf)
+        self.assertIs(passed.leaf.chained_node, branch.leaf)
+        self.assertIs(passed.leaf.parent, passed)
+        self.assertIsNone(PassedIn().leaf.chained_node)
+
+    def test_post_init_chain_and_initvar(self):
+        derived = Derived(y=5, scale=7)
+        self.assertEqual(derived.log, ["base", ("derived", 7, 5)])
+
+    def test_rebuild_and_pickle(self):
+        branch = SlottedBranch(a=3)
+        rebuilt = datatrees.rebuild(branch, a=4)
+        self.assertEqual(rebuilt.made, Leaf(4, 2))
+        restored = pickle.loads(pickle.dumps(FrozenSlotted(a=6)))
+        self.assertEqual(restored.twice, 12)
+        self.assertEqual(restored.leaf(), Leaf(6, 2))
+
+    def test_intern_not_allowed(self):
+        with self.assertRaises(InvalidInternOptions):
+
+            @datatree(backend=datatrees.slotted, frozen=True, intern=True)
+            class Interned:
+                a: int = 1
+
+    def test_non_default_after_default(self):
+        with self.assertRaises(TypeError):
+
+            @datatree(backend=datatrees.slotted)
+            class Bad:
+                a: int = 1
+                b: int  # type: ignore
+
+
+class TestBackend(unittest.TestCase):
+    def test_custom_backend_is_used(self):
+        calls = []
+
+        def backend(clz, **kwds):
+            calls.append((clz.__name__, kwds["frozen"]))
+            return dataclass(clz, **kwds)
+
+        @datatree(backend=backend, frozen=True)
+        class Custom:
+            a: int = 1
+            leaf: Node[Leaf] = Node(Leaf)
+
+        self.assertEqual(calls, [("Custom", True)])
+        self.assertEqual(Custom(b=3).leaf(), Leaf(1, 3))
+
+    def test_stdlib_slots(self):
+        slotted = StdSlotted(b=6)
+        self.assertFalse(hasattr(slotted, "__dict__"))
+        self.assertEqual(slotted.made, Leaf(4, 6))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Tests for the benchmark suite (not the performance itself).
+"""
+
+import math
+import unittest
+
+from benchmarks.bench_pickle import Part
+from benchmarks.bench_shared import transfer_times
+from benchmarks.scaling import growth_exponent, scaling_curves
+from benchmarks.suite import compare_results, run_suite
+from benchmarks.synthetic import TreeSpec, make_plain_tree, make_tree
+
+
+def _results(**seconds):
+    metrics = {}
+    for name, value in seconds.items():
+        baseline = "dataclass_construct" if name == "construct" else None
+        metrics[name] = {
+            "name": name,
+            "value": value,
+            "baseline": baseline,
+            "tracked": not name.startswith("dataclass_"),
+        }
+    return {"meta": {}, "metrics": metrics}
+
+
+class TestSynthetic(unittest.TestCase):
+    def test_tree_matches_plain_tree(self):
+        spec = TreeSpec(depth=2, width=2)
+        tree = make_tree(spec)()
+        plain = make_plain_tree(spec)()
+        self.assertEqual(len(tree.children), len(plain.children))
+        self.assertEqual(tree.children[0].f2_0, plain.children[0].f2_0)
+        self.assertEqual(tree.sd0, plain.sd0)
+
+    def test_tree_dimensions(self):
+        spec = TreeSpec(
+            depth=1, width=2, prefix_density=1.0, inheritance_depth=2, chain_post_init=True
+        )
+        root = make_tree(spec)
+        fields = root.__dataclass_fields__
+        self.assertIn("n0_f1_0", fields)
+        self.assertIn("f1_0_n1", fields)
+        self.assertIn("n0_f1_b1_0", fields)
+        self.assertIn("f0_b0_0", fields)
+        self.assertEqual(len(root().children), 2)
+        with self.assertRaises(ValueError):
+            make_plain_tree(spec)
+
+
+class TestScaling(unittest.TestCase):
+    def test_scaling_curves(self):
+        points = scaling_curves(
+            TreeSpec(depth=1, width=1), values={"width": (1, 2)}, repeat=1
+        )
+        self.assertEqual([p.value for p in points], [1, 2])
+        self.assertEqual([p.instances for p in points], [2, 3])
+        self.assertTrue(all(p.apply_node_fields_s > 0 for p in points))
+        self.assertGreater(points[1].instance_bytes, 0)
+        self.assertFalse(math.isnan(growth_exponent(points)))
+
+
+class TestSharedTransfer(unittest.TestCase):
+    def test_transfer_times(self):
+        results = transfer_times(Part(depth=1, width=2), jobs=1, processes=1, number=1)
+        self.assertEqual(set(results), {"pickle", "shared"})
+        self.assertTrue(all(r["bytes"] > 0 and r["job_s"] > 0 for r in results.values()))
+
+
+class TestCompare(unittest.TestCase):
+    def test_regression_detected(self):
+        base = _results(construct=1.0, dataclass_construct=1.0)
+        current = _results(construct=1.5, dataclass_construct=3.0)
+        regressions, compared = compare_results(base, current, 0.2)
+        self.assertEqual([r.name for r in regressions], ["construct"])
+        self.assertEqual([r.name for r in compared], ["construct"])
+
+    def test_relative_and_overrides(self):
+        base = _results(construct=1.0, dataclass_construct=1.0)
+        current = _results(construct=1.5, dataclass_construct=3.0)
+        regressions, _ = compare_results(base, current, 0.2, relative=True)
+        self.assertEqual(regressions, [])
+        regressions, _ = compare_results(base, current, 0.2, overrides={"construct": 0.6})
+        self.assertEqual(regressions, [])
+
+    def test_quick_run(self):
+        metrics = run_suite(TreeSpec(depth=1, width=1), min_time=0.0005, repeat=1)
+        names = {m.name for m in metrics}
+        self.assertIn("bound_node_call", names)
+        self.assertIn("generate_html_page", names)
+        self.assertIn("tree_bytes_per_instance", names)
+        self.assertTrue(all(m.value > 0 for m in metrics if m.unit == "s"))
+
+
+if __name__ == "__main__":
+    unittest.main()
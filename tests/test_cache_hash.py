@@ -0,0 +1,98 @@
+"""
+Tests for cached hashes of frozen datatrees (cache_hash=True).
+"""
+
+import pickle
+import unittest
+
+from datatrees import datatree, dtfield, Node, InvalidCacheHashOptions
+
+
+@datatree(frozen=True)
+class Leaf:
+    a: int = 1
+    b: str = "b"
+
+
+@datatree(frozen=True, cache_hash=True, compact_pickle=True)
+class Key:
+    a: int = 1
+    leaf: Node[Leaf] = Node(Leaf)
+    made: Leaf = dtfield(self_default=lambda self: self.leaf())
+
+
+class CountingHash:
+    def __init__(self, value):
+        self.value = value
+        self.hashes = 0
+        self.eqs = 0
+
+    def __hash__(self):
+        self.hashes += 1
+        return hash(self.value)
+
+    def __eq__(self, other):
+        self.eqs += 1
+        return isinstance(other, CountingHash) and self.value == other.value
+
+
+@datatree(frozen=True, cache_hash=True)
+class Counted:
+    value: CountingHash = None
+
+
+class TestCacheHash(unittest.TestCase):
+    def test_hash_computed_once(self):
+        value = CountingHash(3)
+        counted = Counted(value)
+        self.assertEqual(hash(counted), hash(counted))
+        self.assertEqual(value.hashes, 1)
+        self.assertEqual({counted: 1}[counted], 1)
+        self.assertEqual(value.hashes, 1)
+
+    def test_equality(self):
+        self.assertEqual(Key(a=2, b="x"), Key(a=2, b="x"))
+        self.assertNotEqual(Key(a=2), Key(a=3))
+        self.assertEqual(hash(Key(a=2, b="x")), hash(Key(a=2, b="x")))
+        self.assertNotEqual(Key(), Leaf())
+
+    def test_eq_short_circuits_on_hash_mismatch(self):
+        first = Counted(CountingHash(1))
+        second = Counted(CountingHash(2))
+        hash(first)
+        hash(second)
+        self.assertNotEqual(first, second)
+        self.assertEqual(first.value.eqs + second.value.eqs, 0)
+
+    def test_eq_identity(self):
+        counted = Counted(CountingHash(1))
+        self.assertEqual(counted, counted)
+        self.assertEqual(counted.value.eqs, 0)
+
+    def test_dict_keys(self):
+        cache = {Key(a=i): i for i in range(10)}
+        self.assertEqual(cache[Key(a=7)], 7)
+
+    def test_pickle_drops_cached_hash(self):
+        key = Key(a=4, b="y")
+        hash(key)
+        restored = pickle.loads(pickle.dumps(key))
+        self.assertNotIn("__datatree_hash__", restored.__dict__)
+        self.assertEqual(restored, key)
+
+        counted = Counted(CountingHash(5))
+        hash(counted)
+        restored = pickle.loads(pickle.dumps(counted))
+        self.assertNotIn("__datatree_hash__", restored.__dict__)
+        self.assertEqual(restored.value.value, 5)
+
+    def test_requires_frozen(self):
+        with self.assertRaises(InvalidCacheHashOptions):
+
+            @datatree(cache_hash=True)
+            class Mutable:
+                a: int = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Tests for datatrees.diff().
+"""
+
+import unittest
+
+from datatrees import datatree, dtfield, diff, replace, Node, FieldChange, NodeChange
+
+
+CALLS = []
+
+
+def make_hole(radius: float = 1.0, depth: float = 2.0):
+    CALLS.append((radius, depth))
+    return (radius, depth)
+
+
+@datatree
+class Hole:
+    radius: float = 1.5
+    depth: int = 4
+
+
+@datatree
+class Plate:
+    width: float = 40.0
+    hole: Node[Hole] = Node(Hole, prefix="hole_")
+    made: Node[make_hole] = Node(make_hole, {"radius": "made_r"})
+    holes: list = dtfield(self_default=lambda self: [self.hole() for _ in range(2)])
+
+
+@datatree
+class Assembly:
+    thickness: float = 2.0
+    plate: Plate = dtfield(default_factory=Plate)
+    spares: dict = dtfield(default_factory=dict)
+
+
+class Counted:
+    """A value counting equality comparisons."""
+
+    compared = 0
+
+    def __eq__(self, other):
+        Counted.compared += 1
+        return self is other
+
+    __hash__ = object.__hash__
+
+
+@datatree(frozen=True)
+class Frozen:
+    value: object = None
+    child: object = None
+
+
+@datatree(frozen=True)
+class Spec:
+    x: int = 1
+
+
+def make_part(spec: Spec = Spec()):
+    return spec.x
+
+
+@datatree
+class Root:
+    spec: Spec = Spec()
+    part: Node[make_part] = Node(make_part)
+    specs: tuple = (Spec(), Spec())
+    parts: Node[make_part] = Node(make_part, {"spec": "specs"})
+
+
+class TestDiff(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_equal(self):
+        d = diff(Assembly(), Assembly())
+        self.assertFalse(d)
+        self.assertEqual(d.fields, ())
+
+    def test_field_and_nodes(self):
+        d = diff(Plate(), Plate(hole_radius=2.0, made_r=3.0))
+        self.assertEqual(
+            d.fields[:2],
+            (FieldChange((), "hole_radius", 1.5, 2.0), FieldChange((), "made_r", 1.0, 3.0)),
+        )
+        self.assertEqual(
+            d.nodes,
+            (
+                NodeChange((), "hole", ("hole_radius",), ("radius",)),
+                NodeChange((), "made", ("made_r",), ("radius",)),
+            ),
+        )
+        # The self_default values are compared element by element.
+        self.assertEqual(
+            [(c.path, c.name) for c in d.fields[2:]],
+            [(("holes", 0), "radius"), (("holes", 1), "radius")],
+        )
+        self.assertEqual(d.node_paths, (("hole",), ("made",)))
+        self.assertEqual(CALLS, [])
+
+    def test_nested_paths(self):
+        a = Assembly(spares={"x": Hole()})
+        b = Assembly(plate=Plate(width=10.0), spares={"x": Hole(depth=5)})
+        d = diff(a, b)
+        self.assertEqual(
+            d.fields,
+            (FieldChange(("plate",), "width", 40.0, 10.0), FieldChange(("spares", "x"), "depth", 4, 5)),
+        )
+        self.assertEqual(d.nodes, ())
+
+    def test_shape_change(self):
+        d = diff(Assembly(spares={"x": Hole()}), Assembly(spares={"y": Hole()}))
+        self.assertEqual([c.name for c in d.fields], ["spares"])
+
+    def test_shared_skipped(self):
+        shared = Frozen(value=Counted())
+        a = Frozen(value=1, child=shared)
+        b = replace(a, value=2)
+        Counted.compared = 0
+        d = diff(a, b)
+        self.assertEqual(d.fields, (FieldChange((), "value", 1, 2),))
+        self.assertEqual(Counted.compared, 0)
+
+    def test_deep(self):
+        def chain(n, leaf):
+            node = Frozen(value=leaf)
+            for _ in range(n):
+                node = Frozen(child=node)
+            return node
+
+        d = diff(chain(3000, 1), chain(3000, 2))
+        self.assertEqual(len(d.fields), 1)
+        self.assertEqual(len(d.fields[0].path), 3000)
+
+    def test_nested_change_reports_node(self):
+        d = diff(Root(), Root(spec=Spec(x=5)))
+        self.assertEqual(d.fields, (FieldChange(("spec",), "x", 1, 5),))
+        self.assertEqual(d.nodes, (NodeChange((), "part", ("spec",), ("spec",)),))
+
+        d = diff(Root(), Root(specs=(Spec(), Spec(x=2))))
+        self.assertEqual(d.fields, (FieldChange(("specs", 1), "x", 1, 2),))
+        self.assertEqual(d.nodes, (NodeChange((), "parts", ("specs",), ("spec",)),))
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            diff(Plate(), Assembly())
+        with self.assertRaises(TypeError):
+            diff(1, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
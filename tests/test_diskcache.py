@@ -0,0 +1,171 @@
+"""
+Tests for the persistent DiskCache used with Node(..., disk_cache=store).
+"""
+
+import os
+import pickle
+import tempfile
+import unittest
+
+from datatrees import datatree, dtfield, Node, DiskCache, InvalidDiskCacheOptions
+from datatrees.diskcache import code_fingerprint
+
+
+CALLS: list[tuple] = []
+
+
+def make_mesh(size: float = 1, detail: int = 3) -> tuple:
+    CALLS.append((size, detail))
+    return (size,) * detail
+
+
+def other_mesh(size: float = 1, detail: int = 3) -> tuple:
+    return (size + 1,) * detail
+
+
+@datatree(compact_pickle=True)
+class Shape:
+    size: float = 1
+    mesh: Node[make_mesh] = Node(make_mesh)
+    made: tuple = dtfield(self_default=lambda self: self.mesh())
+
+
+@datatree
+class UnpicklableShape:
+    size: float = 1
+    mesh: Node[make_mesh] = Node(make_mesh)
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "cache", "store.sqlite")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def make_class(self, store):
+        @datatree
+        class Part:
+            size: float = 2
+            mesh: Node[make_mesh] = Node(make_mesh, disk_cache=store)
+
+        return Part
+
+    def test_cached_across_instances_and_stores(self):
+        Part = self.make_class(DiskCache(self.path))
+        self.assertEqual(Part().mesh(), (2, 2, 2))
+        self.assertEqual(Part().mesh(), (2, 2, 2))
+        self.assertEqual(CALLS, [(2, 3)])
+        self.assertEqual(Part(size=3).mesh(detail=1), (3,))
+        self.assertEqual(len(CALLS), 2)
+
+        # A new store on the same file (e.g. after a restart) finds the results.
+        Part = self.make_class(DiskCache(self.path))
+        self.assertEqual(Part().mesh(), (2, 2, 2))
+        self.assertEqual(len(CALLS), 2)
+
+    def test_class_target_round_trip(self):
+        def make_class(store):
+            @datatree
+            class Part:
+                size: float = 2
+                shape: Node[Shape] = Node(Shape, "size", disk_cache=store)
+
+            return Part
+
+        Part = make_class(DiskCache(self.path))
+        shape = Part().shape()
+        self.assertEqual(shape.made, (2, 2, 2))
+        self.assertEqual(len(CALLS), 1)
+
+        # Stored compact pickled, the self_default and BoundNode are recreated.
+        store = DiskCache(self.path)
+        self.assertEqual(len(store), 1)
+        restored = make_class(store)().shape()
+        self.assertEqual(restored, shape)
+        self.assertEqual(restored.mesh(detail=1), (2,))
+
+    def test_class_target_requires_compact_pickle(self):
+        with self.assertRaises(InvalidDiskCacheOptions):
+            Node(UnpicklableShape, disk_cache=DiskCache(self.path))
+
+    def test_keys_include_code(self):
+        store = DiskCache(self.path)
+        self.assertNotEqual(
+            store.make_key(make_mesh, {"size": 1}), store.make_key(other_mesh, {"size": 1})
+        )
+        self.assertNotEqual(code_fingerprint(make_mesh), code_fingerprint(other_mesh))
+        self.assertEqual(
+            store.make_key(make_mesh, {"size": 1, "detail": 2}),
+            store.make_key(make_mesh, {"detail": 2, "size": 1}),
+        )
+
+    def test_class_factories(self):
+        @datatree
+        class Leaf:
+            a: int = 1
+
+            def area(self):
+                return self.a
+
+        store = DiskCache(self.path)
+        fingerprint = code_fingerprint(Leaf)
+        self.assertEqual(fingerprint, code_fingerprint(Leaf))
+        self.assertIsNone(store.make_key(Leaf, {"a": lambda: 1}))
+
+    def test_class_fingerprint_includes_self_defaults_and_nodes(self):
+        def make_class(compute_volume, make):
+            @datatree
+            class Leaf:
+                a: int = 1
+                volume: int = dtfield(self_default=compute_volume)
+
+            @datatree
+            class Part:
+                leaf: Node[Leaf] = Node(Leaf)
+                mesh: Node[make] = Node(make)
+
+            return Part
+
+        fingerprint = code_fingerprint(make_class(lambda self: self.a, make_mesh))
+        self.assertEqual(fingerprint, code_fingerprint(make_class(lambda self: self.a, make_mesh)))
+        self.assertNotEqual(
+            fingerprint, code_fingerprint(make_class(lambda self: self.a * 2, make_mesh))
+        )
+        self.assertNotEqual(
+            fingerprint, code_fingerprint(make_class(lambda self: self.a, other_mesh))
+        )
+
+    def test_datatree_arguments_keyed_by_fingerprint(self):
+        @datatree(frozen=True)
+        class Params:
+            a: int = 1
+
+        store = DiskCache(self.path)
+        key = store.make_key(max, {"params": Params(2)})
+        self.assertIsNotNone(key)
+        self.assertEqual(key, store.make_key(max, {"params": Params(2)}))
+        self.assertNotEqual(key, store.make_key(max, {"params": Params(3)}))
+
+    def test_eviction(self):
+        store = DiskCache(self.path, max_bytes=2000)
+        for i in range(10):
+            store.put(f"key{i}", b"x" * 500)
+        self.assertLessEqual(store.total_bytes(), 2000)
+        self.assertIsNone(store.get("key0"))
+        self.assertEqual(store.get("key9"), b"x" * 500)
+
+    def test_pickle_store(self):
+        store = DiskCache(self.path)
+        store.put("a", 1)
+        restored = pickle.loads(pickle.dumps(store))
+        self.assertEqual(restored.get("a"), 1)
+        self.assertEqual(len(restored), 1)
+        restored.clear()
+        self.assertEqual(len(store), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
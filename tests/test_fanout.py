@@ -0,0 +1,120 @@
+"""
+Tests for NodeArray and NodeMap fields.
+"""
+
+import pickle
+import unittest
+
+from datatrees import (
+    BoundNodeArray,
+    BoundNodeMap,
+    datatree,
+    dtargs,
+    dtfield,
+    get_injected_fields,
+    NodeArray,
+    NodeMap,
+    override,
+    rebuild,
+    sweep,
+    trace,
+    walk,
+)
+
+
+@datatree(frozen=True)
+class Hole:
+    radius: float = 1.5
+    depth: float = 4
+    position: tuple = (0, 0)
+
+
+@datatree(frozen=True, compact_pickle=True)
+class Plate:
+    hole_radius: float = 2
+    positions: tuple = ((0, 0), (10, 0), (20, 0))
+    holes: NodeArray[Hole] = NodeArray(
+        Hole, prefix="hole_", over="positions", param="position"
+    )
+    hole_count: int = dtfield(self_default=lambda self: len(self.holes))
+
+
+@datatree
+class Panels:
+    sizes: dict = dtfield(default_factory=lambda: {"left": {"radius": 1}, "right": {"depth": 9}})
+    panel: NodeMap[Hole] = NodeMap(Hole, over="sizes")
+
+
+@datatree
+class Overridden:
+    override: object = None
+    positions: tuple = ((1, 1),)
+    holes: NodeArray[Hole] = NodeArray(Hole, over="positions", param="position")
+
+
+class TestNodeArray(unittest.TestCase):
+    def test_sequence(self):
+        plate = Plate()
+        self.assertIsInstance(plate.holes, BoundNodeArray)
+        self.assertEqual(len(plate.holes), 3)
+        self.assertEqual(plate.holes[1], Hole(2, 4, (10, 0)))
+        self.assertEqual(plate.holes[-1].position, (20, 0))
+        self.assertEqual([h.position for h in plate.holes], [(0, 0), (10, 0), (20, 0)])
+        self.assertEqual(plate.holes[1:], [plate.holes[1], plate.holes[2]])
+        self.assertEqual(plate.hole_count, 3)
+        with self.assertRaises(IndexError):
+            plate.holes[3]
+
+    def test_children_created_once(self):
+        plate = Plate()
+        self.assertIs(plate.holes[0], plate.holes[0])
+        with trace() as t:
+            list(plate.holes)
+            list(plate.holes)
+        self.assertEqual(len(t.records), 2)
+
+    def test_param_not_injected(self):
+        self.assertIn("hole_depth", get_injected_fields(Plate).injections)
+        self.assertNotIn("hole_position", Plate.__dataclass_fields__)
+
+    def test_call_creates_single_child(self):
+        self.assertEqual(Plate(hole_depth=2).holes(position=(5, 5)), Hole(2, 2, (5, 5)))
+
+    def test_override(self):
+        holes = Overridden(override=override(holes=dtargs(radius=7))).holes
+        self.assertEqual(holes[0], Hole(7, 4, (1, 1)))
+
+    def test_rebuild_depends_on_over(self):
+        plate = rebuild(Plate(), positions=((1, 2),))
+        self.assertEqual(plate.hole_count, 1)
+        self.assertEqual(plate.holes[0].position, (1, 2))
+
+    def test_pickle_and_equality(self):
+        plate = Plate(hole_radius=3)
+        restored = pickle.loads(pickle.dumps(plate))
+        self.assertEqual(restored, plate)
+        self.assertEqual(list(restored.holes), list(plate.holes))
+
+    def test_walk_materialize(self):
+        entries = {name: value for _, name, value in walk(Plate(), materialize=True)}
+        self.assertEqual(entries["holes"], list(Plate().holes))
+
+    def test_sweep(self):
+        results = sweep(Plate, grid={"hole_radius": [1, 2]}, evaluate=lambda p: p.holes[2].radius)
+        self.assertEqual([r.value for r in results], [1, 2])
+
+
+class TestNodeMap(unittest.TestCase):
+    def test_mapping(self):
+        panels = Panels()
+        self.assertIsInstance(panels.panel, BoundNodeMap)
+        self.assertEqual(list(panels.panel), ["left", "right"])
+        self.assertEqual(panels.panel["left"], Hole(radius=1))
+        self.assertEqual(panels.panel["right"], Hole(depth=9))
+        self.assertIn("left", panels.panel)
+        self.assertNotIn("top", panels.panel)
+        self.assertEqual(dict(panels.panel.items())["left"].radius, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Tests for the argument-less BoundNode call fast path.
+"""
+
+import unittest
+
+from datatrees import datatree, dtargs, override, Node, trace
+
+
+@datatree
+class Leaf:
+    a: float = 1
+    b: float = 2
+
+
+@datatree
+class Mid:
+    a: float = 10
+    leaf_b: float = 20
+    leaf: Node[Leaf] = Node(Leaf, prefix="leaf_", expose_all=True)
+
+
+@datatree
+class Root:
+    a: float = 100
+    leaf_b: float = 200
+    mid: Node[Mid] = Node(Mid)
+    override: object = None
+
+
+class TestFastCall(unittest.TestCase):
+    def test_same_as_generic_path(self):
+        mid = Mid(leaf_a=3, leaf_b=4)
+        self.assertEqual(mid.leaf(), Leaf(3, 4))
+        self.assertEqual(mid.leaf(), mid.leaf.call_with(Leaf))
+        self.assertEqual(mid.leaf(b=5), Leaf(3, 5))
+
+    def test_binder_generated_once(self):
+        node = Mid.__datatree_nodes__["leaf"]
+        Mid().leaf()
+        binder = node._get_binder()
+        self.assertEqual(binder(Mid(leaf_a=7)), {"a": 7, "b": 20})
+        Mid().leaf()
+        self.assertIs(node._get_binder(), binder)
+
+    def test_override_uses_generic_path(self):
+        root = Root(override=override(mid=dtargs(a=5)))
+        self.assertEqual(root.mid(), Mid(5, 200))
+        self.assertEqual(Root().mid(), Mid(100, 200))
+
+    def test_traced(self):
+        with trace() as t:
+            Mid().leaf()
+        self.assertEqual(len(t.records), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Tests for stable fingerprints of datatree instances.
+"""
+
+import enum
+import os
+import subprocess
+import sys
+import unittest
+
+from datatrees import datatree, dtfield, Node, fingerprint, fingerprint_value
+
+
+class Material(enum.Enum):
+    STEEL = 1
+    WOOD = 2
+
+
+@datatree(frozen=True)
+class Leaf:
+    a: int = 1
+    name: str = "leaf"
+
+
+@datatree(frozen=True)
+class Branch:
+    a: int = 10
+    material: Material = Material.STEEL
+    tags: frozenset = frozenset()
+    child: Leaf = Leaf()
+    leaf: Node[Leaf] = Node(Leaf)
+    made: Leaf = dtfield(self_default=lambda self: self.leaf())
+
+
+@datatree
+class Mutable:
+    values: list = dtfield(default_factory=list)
+
+
+def _subprocess_fingerprint(seed: str) -> str:
+    code = (
+        "from tests.test_fingerprints import Branch, Leaf\n"
+        "from datatrees import fingerprint\n"
+        "print(fingerprint(Branch(a=3, tags=frozenset({'x', 'y', 'z'}), child=Leaf(2, 'b'))))"
+    )
+    env = dict(os.environ, PYTHONHASHSEED=seed)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join([os.path.join(root, "src"), root])
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_stable_across_processes(self):
+        expected = fingerprint(Branch(a=3, tags=frozenset({"x", "y", "z"}), child=Leaf(2, "b")))
+        self.assertEqual(_subprocess_fingerprint("1"), expected)
+        self.assertEqual(_subprocess_fingerprint("2"), expected)
+
+    def test_values(self):
+        self.assertEqual(fingerprint(Branch(a=3)), fingerprint(Branch(a=3)))
+        self.assertNotEqual(fingerprint(Branch(a=3)), fingerprint(Branch(a=4)))
+        self.assertNotEqual(fingerprint(Branch(child=Leaf(2))), fingerprint(Branch()))
+        self.assertNotEqual(
+            fingerprint(Branch(material=Material.WOOD)), fingerprint(Branch())
+        )
+        self.assertNotEqual(fingerprint_value(1), fingerprint_value(1.0))
+        self.assertNotEqual(fingerprint_value(1), fingerprint_value(True))
+        self.assertNotEqual(fingerprint_value(["a", "b"]), fingerprint_value(["ab"]))
+        self.assertEqual(fingerprint_value({"a": 1, "b": 2}), fingerprint_value({"b": 2, "a": 1}))
+
+    def test_field_layout_included(self):
+        original = fingerprint(Leaf(1, "x"))
+
+        @datatree(frozen=True)
+        class Leaf2:
+            a: int = 1
+            name: str = "leaf"
+            extra: int = 0
+
+        Leaf2.__qualname__ = Leaf.__qualname__
+        Leaf2.__module__ = Leaf.__module__
+        self.assertNotEqual(fingerprint(Leaf2(1, "x")), original)
+
+    def test_cached_for_frozen(self):
+        branch = Branch(a=5)
+        digest = fingerprint(branch)
+        self.assertIn("__datatree_fingerprint__", branch.__dict__)
+        self.assertEqual(fingerprint(branch), digest)
+
+        mutable = Mutable([1])
+        first = fingerprint(mutable)
+        mutable.values.append(2)
+        self.assertNotEqual(fingerprint(mutable), first)
+
+    def test_unsupported_values(self):
+        with self.assertRaises(TypeError):
+            fingerprint(Mutable([object()]))
+        with self.assertRaises(TypeError):
+            fingerprint_value(lambda: 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests for datatrees.sizeof().
+"""
+
+from dataclasses import dataclass
+import unittest
+
+from datatrees import datatree, dtfield, Node, sizeof
+
+
+@datatree
+class Leaf:
+    a: float = 1.5
+    b: float = 2.5
+
+
+@datatree
+class Branch:
+    c: float = 3.5
+    leaf: Node[Leaf] = Node(Leaf)
+    leaves: list = dtfield(self_default=lambda self: [self.leaf() for _ in range(3)])
+
+
+@datatree
+class Holder:
+    leaf: Node[Leaf] = dtfield(Node(Leaf), init=True)
+
+
+@dataclass
+class Plain:
+    a: float = 1.5
+    b: float = 2.5
+
+
+class TestSizeof(unittest.TestCase):
+    def test_breakdown(self):
+        fp = sizeof(Branch(a=10.5))
+        self.assertEqual(fp.instances, 4)
+        self.assertGreater(fp.fields, 0)
+        self.assertGreater(fp.injected_fields, 0)
+        self.assertGreater(fp.bound_nodes, 0)
+        self.assertEqual(fp.chained_bound_nodes, 0)
+        self.assertGreater(fp.self_default_results, 0)
+        self.assertEqual(fp.total, fp.instance + fp.data + fp.bookkeeping)
+        # Nested instances are included in the field holding them.
+        self.assertLess(sum(fp.per_field.values()), fp.total)
+        self.assertGreater(sum(fp.per_field.values()), fp.total - fp.instance)
+        self.assertGreater(fp.per_field["leaves"], fp.self_default_results)
+        self.assertEqual(set(fp.per_field), {"a", "b", "c", "leaf", "leaves"})
+
+    def test_shallow(self):
+        deep = sizeof(Branch())
+        shallow = sizeof(Branch(), deep=False)
+        self.assertEqual(shallow.instances, 1)
+        self.assertLess(shallow.total, deep.total)
+
+    def test_chained_bound_nodes(self):
+        branch = Branch()
+        fp = sizeof(Holder(leaf=branch.leaf))
+        self.assertEqual(fp.bound_nodes, 0)
+        self.assertGreater(fp.chained_bound_nodes, 0)
+
+    def test_plain_dataclass(self):
+        fp = sizeof(Plain())
+        self.assertEqual(fp.bookkeeping, 0)
+        self.assertEqual(fp.injected_fields, 0)
+        self.assertGreater(fp.fields, 0)
+
+    def test_shared_values_counted_once(self):
+        shared = [1.0] * 1000
+        fp = sizeof(Plain(a=shared, b=shared))
+        self.assertEqual(fp.per_field["b"], 0)
+
+    def test_table(self):
+        table = sizeof(Branch()).table()
+        self.assertIn("chained_bound_nodes", table)
+        self.assertIn("total", table)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Tests for interned (hash-consed) datatree instances.
+"""
+
+import copy
+from dataclasses import InitVar
+import gc
+import pickle
+import unittest
+
+from datatrees import datatree, dtfield, Node
+from datatrees.datatrees import InvalidInternOptions
+
+
+CONSTRUCTED: list[str] = []
+
+
+@datatree(frozen=True, intern=True)
+class Fastener:
+    diameter: float = 3
+    length: float = 10
+    tags: tuple = ()
+    count: int = dtfield(self_default=lambda self: CONSTRUCTED.append("count") or 1)
+
+
+@datatree(frozen=True)
+class Bracket:
+    diameter: float = 3
+    fastener: Node[Fastener] = Node(Fastener, "diameter")
+    fasteners: tuple = dtfield(
+        self_default=lambda self: tuple(self.fastener(length=10 + i % 2) for i in range(100))
+    )
+
+
+class TestIntern(unittest.TestCase):
+    def setUp(self):
+        CONSTRUCTED.clear()
+
+    def test_same_parameters_same_instance(self):
+        a = Fastener(3, length=12)
+        b = Fastener(diameter=3, length=12)
+        self.assertIs(a, b)
+        self.assertIsNot(a, Fastener(4, 12))
+        self.assertEqual(CONSTRUCTED, ["count", "count"])
+
+    def test_defaults_are_part_of_key(self):
+        self.assertIs(Fastener(), Fastener(3))
+        self.assertIs(Fastener(), Fastener(3, 10, ()))
+
+    def test_bound_node_calls(self):
+        bracket = Bracket()
+        self.assertEqual(len(set(map(id, bracket.fasteners))), 2)
+        self.assertEqual(len(CONSTRUCTED), 2)
+        self.assertIs(bracket.fasteners[0], Fastener(3, 10))
+
+    def test_weak_table(self):
+        Fastener(diameter=99)
+        gc.collect()
+        self.assertEqual(CONSTRUCTED, ["count"])
+        Fastener(diameter=99)
+        self.assertEqual(CONSTRUCTED, ["count", "count"])
+
+    def test_unhashable_parameters(self):
+        a = Fastener(tags=[1])
+        b = Fastener(tags=[1])
+        self.assertIsNot(a, b)
+        self.assertEqual(a, b)
+
+    def test_pickle_and_copy_intern(self):
+        a = Fastener(5)
+        self.assertIs(pickle.loads(pickle.dumps(a)), a)
+        self.assertIs(copy.deepcopy(a), a)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(TypeError):
+            Fastener(nonexistent=1)
+
+    def test_requires_frozen(self):
+        with self.assertRaises(InvalidInternOptions):
+
+            @datatree(intern=True)
+            class NotFrozen:
+                a: int = 1
+
+    def test_init_var_rejected(self):
+        with self.assertRaises(InvalidInternOptions):
+
+            @datatree(frozen=True, intern=True)
+            class WithInitVar:
+                scale: InitVar[float] = 1.0
+                a: int = 1
+
+    def test_subclass_not_interned(self):
+        @datatree(frozen=True)
+        class Sub(Fastener):
+            extra: int = 0
+
+        self.assertIsNot(Sub(), Sub())
+        self.assertEqual(Sub(), Sub())
+
+
+if __name__ == "__main__":
+    unittest.main()
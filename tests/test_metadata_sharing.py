@@ -0,0 +1,77 @@
+"""
+Tests for the sharing of class level metadata between decorated classes.
+"""
+
+import unittest
+
+from datatrees import datatree, dtfield, field_docs, Node
+
+
+@datatree
+class Hole:
+    radius: float = dtfield(1.5, doc="The hole radius")
+    depth: float = 4
+
+
+def make_pin(length: float = 3, width: float = 1):
+    return (length, width)
+
+
+@datatree
+class PlateA:
+    hole: Node[Hole] = Node(Hole)
+    big_hole: Node[Hole] = Node(Hole, prefix="big_")
+    pin: Node = Node(make_pin)
+
+
+@datatree
+class PlateB:
+    hole: Node[Hole] = Node(Hole, node_doc="Mounting hole")
+    pin: Node = Node(make_pin, prefix="pin_")
+
+
+def node(clz, name):
+    return clz.__datatree_nodes__[name]
+
+
+class TestMetadataSharing(unittest.TestCase):
+    def test_signatures_shared(self):
+        self.assertIs(node(PlateA, "hole").init_signature, node(PlateB, "hole").init_signature)
+        self.assertIs(node(PlateA, "pin").init_signature, node(PlateB, "pin").init_signature)
+
+    def test_annotation_details_shared(self):
+        a = node(PlateA, "hole").expose_rev_map["radius"][0]
+        b = node(PlateA, "big_hole").expose_rev_map["big_radius"][0]
+        self.assertIs(a, b)
+        pin_a = node(PlateA, "pin").expose_rev_map["length"][0]
+        pin_b = node(PlateB, "pin").expose_rev_map["pin_length"][0]
+        self.assertIs(pin_a, pin_b)
+        self.assertFalse(hasattr(a, "__dict__"))
+
+    def test_metadata_shared(self):
+        a = PlateA.__dataclass_fields__["radius"].metadata
+        b = PlateA.__dataclass_fields__["big_radius"].metadata
+        self.assertEqual(a, b)
+        self.assertIs(a["dt_docs"], Hole.__dataclass_fields__["radius"].metadata["dt_docs"])
+
+    def test_docs(self):
+        self.assertEqual(field_docs(PlateA, "radius"), "The hole radius")
+        self.assertEqual(field_docs(PlateA, "big_radius"), "The hole radius")
+        self.assertEqual(field_docs(PlateB, "radius"), "Mounting hole: The hole radius")
+        self.assertIsNone(field_docs(PlateA, "depth"))
+
+    def test_mapped_names_interned(self):
+        names = [n for n in PlateA.__dataclass_fields__ if n == "big_radius"]
+        self.assertIs(names[0], node(PlateA, "big_hole").expose_map["radius"])
+
+    def test_deep_injection(self):
+        # The docs of injected fields are not wrapped again at each level.
+        clz = Hole
+        for i in range(1200):
+            clz = datatree(type(f"Level{i}", (), {"__annotations__": {"child": Node}, "child": Node(clz)}))
+        self.assertEqual(field_docs(clz, "radius"), "The hole radius")
+        self.assertEqual(clz().child().child().radius, 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Tests for the class level Node target graph.
+"""
+
+import unittest
+
+from datatrees import datatree, dtfield, Node, node_graph, NodeGraphCycle
+
+
+@datatree
+class Hole:
+    radius: float = 1.5
+
+
+def make_pin(length: float = 3):
+    return ("pin", length)
+
+
+@datatree
+class Plate:
+    width: float = 40
+    hole: Node[Hole] = Node(Hole, prefix="hole_")
+    big_hole: Node[Hole] = Node(Hole, prefix="big_hole_")
+    pin: Node = Node(make_pin)
+
+
+@datatree
+class Assembly:
+    plate: Node[Plate] = Node(Plate)
+    hole: Node[Hole] = Node(Hole)
+    parts: list = dtfield(self_default=lambda self: [self.plate()])
+
+
+@datatree
+class Loop:
+    a: int = 1
+    next: Node = dtfield(Node(lambda a: None), init=True)
+
+
+class TestNodeGraph(unittest.TestCase):
+    def test_edges_and_children(self):
+        graph = node_graph(Assembly)
+        self.assertEqual(graph.edges[Assembly], (("plate", Plate), ("hole", Hole)))
+        self.assertEqual(graph.children[Plate], (Hole, make_pin))
+        self.assertEqual(graph.edges[Hole], ())
+        self.assertEqual(graph.edges[make_pin], ())
+
+    def test_depth_and_fan_out(self):
+        graph = node_graph(Assembly)
+        self.assertEqual(graph.depth, 2)
+        self.assertEqual(graph.heights[Plate], 1)
+        self.assertEqual(graph.heights[Hole], 0)
+        self.assertEqual(graph.fan_out[Plate], 3)
+        self.assertEqual(graph.fan_out[Assembly], 2)
+
+    def test_build_order(self):
+        order = node_graph(Assembly).build_order
+        self.assertEqual(order, (Hole, make_pin, Plate, Assembly))
+        for vertex, children in node_graph(Assembly).children.items():
+            for child in children:
+                self.assertLess(order.index(child), order.index(vertex))
+
+    def test_cached(self):
+        self.assertIs(node_graph(Assembly), node_graph(Assembly))
+        self.assertIs(node_graph(Assembly).build_order, node_graph(Assembly).build_order)
+
+    def test_cycle(self):
+        @datatree
+        class A:
+            x: int = 1
+
+        @datatree
+        class B:
+            a: Node[A] = Node(A)
+
+        # A cycle can only be created after decoration.
+        A.__datatree_nodes__ = {"b": Node(B)}
+        try:
+            graph = node_graph(B)
+            self.assertEqual(graph.cycle, (B, A, B))
+            with self.assertRaises(NodeGraphCycle):
+                graph.build_order
+        finally:
+            del A.__datatree_nodes__
+
+    def test_deep_hierarchy(self):
+        # A leaf without parameters so no fields are injected through the levels.
+        leaf = lambda: None
+        clz = leaf
+        for i in range(1500):
+            clz = datatree(type(f"Level{i}", (), {"__annotations__": {"child": Node}, "child": Node(clz)}))
+        graph = node_graph(clz)
+        self.assertEqual(graph.depth, 1500)
+        self.assertEqual(graph.build_order[0], leaf)
+
+    def test_not_datatree(self):
+        with self.assertRaises(TypeError):
+            node_graph(int)
+        self.assertEqual(node_graph(Loop).depth, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Tests for compact pickling of datatree instances (compact_pickle=True).
+"""
+
+import copy
+from dataclasses import InitVar
+import pickle
+import unittest
+
+from datatrees import datatree, dtfield, Node, BoundNode, InvalidCompactPickleOptions
+
+
+@datatree(compact_pickle=True)
+class Leaf:
+    a: int = 1
+    b: int = 2
+
+
+@datatree(compact_pickle=True)
+class Branch:
+    a: int = 10
+    leaf: Node[Leaf] = Node(Leaf)
+    made: Leaf = dtfield(self_default=lambda self: self.leaf())
+
+
+@datatree(compact_pickle=True)
+class Passthrough:
+    a: int = 20
+    leaf: Node[Leaf] = dtfield(Node(Leaf), init=True)
+
+
+class TestCompactPickle(unittest.TestCase):
+    def test_round_trip(self):
+        branch = Branch(a=5, b=6)
+        restored = pickle.loads(pickle.dumps(branch))
+        self.assertEqual(restored, branch)
+        self.assertEqual(restored.made, Leaf(5, 6))
+        self.assertIsInstance(restored.leaf, BoundNode)
+        self.assertIs(restored.leaf.parent, restored)
+        self.assertEqual(restored.leaf(b=7), Leaf(5, 7))
+
+    def test_payload_excludes_bound_nodes(self):
+        branch = Branch(a=5, b=6)
+        payload = pickle.dumps(branch)
+        self.assertNotIn(b"BoundNode", payload)
+        self.assertNotIn(b"AnnotationsAccessor", payload)
+        self.assertLess(len(payload), 200)
+
+    def test_bound_node_pickles_by_reference(self):
+        branch = Branch(a=3)
+        restored = pickle.loads(pickle.dumps(branch.leaf))
+        self.assertIsInstance(restored, BoundNode)
+        self.assertEqual(restored.parent, branch)
+        self.assertEqual(restored(), Leaf(3, 2))
+
+    def test_chained_bound_node(self):
+        branch = Branch(a=3, b=4)
+        passthrough = Passthrough(a=1, leaf=branch.leaf)
+        restored = pickle.loads(pickle.dumps(passthrough))
+        self.assertEqual(restored.leaf(), passthrough.leaf())
+        self.assertEqual(restored.leaf.chained_node.parent, branch)
+
+    def test_default_node_not_pickled(self):
+        passthrough = Passthrough(a=1)
+        restored = pickle.loads(pickle.dumps(passthrough))
+        self.assertEqual(restored.leaf(), Leaf(1, 2))
+        self.assertIsNone(restored.leaf.chained_node)
+
+    def test_deepcopy(self):
+        branch = Branch(a=5)
+        copied = copy.deepcopy(branch)
+        self.assertEqual(copied, branch)
+        self.assertIsNot(copied.made, branch.made)
+        self.assertIs(copied.leaf.parent, copied)
+
+    def test_init_var_rejected(self):
+        with self.assertRaises(InvalidCompactPickleOptions):
+
+            @datatree(compact_pickle=True)
+            class WithInitVar:
+                scale: InitVar[float]
+                a: int = 1
+
+        # Also when the InitVar is added by a subclass inheriting the compact __reduce__.
+        with self.assertRaises(InvalidCompactPickleOptions):
+
+            @datatree
+            class Derived(Leaf):
+                scale: InitVar[float] = 1.0
+
+
+if __name__ == "__main__":
+    unittest.main()
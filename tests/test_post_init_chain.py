@@ -0,0 +1,121 @@
+"""
+Tests for the generated post-init chain (direct function references, no-op skipping).
+"""
+
+from dataclasses import InitVar
+import unittest
+
+from datatrees import datatree, dtfield, Node
+
+
+CALLS = []
+
+
+@datatree(chain_post_init=True)
+class A:
+    a: int = 1
+
+    def __post_init__(self):
+        CALLS.append(("A", self.a))
+
+
+@datatree(chain_post_init=True)
+class B(A):
+    b: int = 2
+
+    def __post_init__(self):
+        CALLS.append(("B", self.b))
+
+
+@datatree(chain_post_init=True)
+class C(A):
+    c: int = 3
+
+    def __post_init__(self):
+        CALLS.append(("C", self.c))
+
+
+@datatree(chain_post_init=True)
+class D(B, C):
+    d: int = 4
+
+    def __post_init__(self):
+        CALLS.append(("D", self.d))
+
+
+@datatree(chain_post_init=True)
+class WithInitVar:
+    scale: InitVar[int] = 2
+    v: int = 1
+
+    def __post_init__(self, scale):
+        CALLS.append(("WithInitVar", self.v * scale))
+
+
+@datatree(chain_post_init=True)
+class DerivedInitVar(WithInitVar):
+    offset: InitVar[int] = 10
+
+    def __post_init__(self, scale, offset):
+        CALLS.append(("DerivedInitVar", self.v * scale + offset))
+
+
+@datatree(chain_post_init=True)
+class NoOp(A):
+    """A class with an empty post-init."""
+
+    def __post_init__(self):
+        """Nothing to do."""
+
+
+@datatree
+class Leaf:
+    x: int = 1
+
+
+@datatree
+class NoOpWithNode:
+    leaf: Node[Leaf] = Node(Leaf)
+    made: Leaf = dtfield(self_default=lambda self: self.leaf())
+
+    def __post_init__(self):
+        pass
+
+
+class TestPostInitChain(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_diamond_order(self):
+        D()
+        self.assertEqual(CALLS, [("A", 1), ("C", 3), ("B", 2), ("D", 4)])
+
+    def test_initvar_forwarding(self):
+        DerivedInitVar(scale=3, v=5, offset=1)
+        self.assertEqual(CALLS, [("WithInitVar", 15), ("DerivedInitVar", 16)])
+
+    def test_no_mro_lookup(self):
+        code = D.__post_init__.__code__
+        self.assertNotIn("mro", code.co_names + code.co_varnames)
+
+    def test_resolved_at_decoration(self):
+        # The chain calls the functions found when the class was decorated.
+        original = A.__original_post_init__
+        try:
+            A.__original_post_init__ = lambda self: CALLS.append(("patched",))
+            B()
+        finally:
+            A.__original_post_init__ = original
+        self.assertEqual(CALLS, [("A", 1), ("B", 2)])
+
+    def test_no_op_skipped(self):
+        NoOp()
+        self.assertEqual(CALLS, [("A", 1)])
+        self.assertNotIn("_pi_0", NoOp.__post_init__.__code__.co_names)
+
+    def test_no_op_still_binds_nodes(self):
+        self.assertEqual(NoOpWithNode().made, Leaf())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Tests for incremental re-evaluation of datatree instances with rebuild().
+"""
+
+import types
+import unittest
+
+from datatrees import datatree, dtfield, Node, rebuild
+
+
+CALLS: list[str] = []
+
+# A module holding a helper, self_defaults calling it may read any field.
+helpers = types.ModuleType("helpers")
+helpers.area = lambda part: part.width * part.height
+
+
+@datatree
+class Hole:
+    radius: float = 1
+    depth: float = 2
+
+
+@datatree
+class Bracket:
+    width: float = 10
+    height: float = 5
+    radius: float = 1
+    hole: Node[Hole] = Node(Hole, "radius", {"depth": "width"})
+
+    def _count(self, name: str, value):
+        CALLS.append(name)
+        return value
+
+    # CALLS is passed as a default, loading attributes of globals makes the reads
+    # of a self_default untracked.
+    area: float = dtfield(
+        self_default=lambda self, calls=CALLS: calls.append("area") or self.width * self.height
+    )
+    made_hole: Hole = dtfield(
+        self_default=lambda self, calls=CALLS: calls.append("made_hole") or self.hole()
+    )
+    doubled_area: float = dtfield(
+        self_default=lambda self, calls=CALLS: calls.append("doubled_area") or self.area * 2
+    )
+    by_method: float = dtfield(self_default=lambda self: self._count("by_method", self.height))
+
+
+class TestRebuild(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_reuses_unaffected(self):
+        old = Bracket()
+        CALLS.clear()
+        new = rebuild(old, radius=3)
+        self.assertEqual(new.radius, 3)
+        self.assertEqual(new.made_hole, Hole(3, 10))
+        self.assertIs(new.area, old.area)
+        self.assertEqual(sorted(CALLS), ["by_method", "made_hole"])
+        self.assertIs(new.hole.parent, new)
+
+    def test_transitive_dependencies(self):
+        old = Bracket()
+        CALLS.clear()
+        new = rebuild(old, height=6)
+        self.assertEqual(new.area, 60)
+        self.assertEqual(new.doubled_area, 120)
+        self.assertIs(new.made_hole, old.made_hole)
+        self.assertEqual(sorted(CALLS), ["area", "by_method", "doubled_area"])
+
+    def test_matches_full_construction(self):
+        old = Bracket()
+        self.assertEqual(rebuild(old, width=7, radius=2), Bracket(width=7, radius=2))
+
+    def test_unchanged_value_reuses_everything(self):
+        old = Bracket()
+        CALLS.clear()
+        rebuild(old, width=10)
+        self.assertEqual(CALLS, [])
+
+    def test_invalid_fields(self):
+        old = Bracket()
+        with self.assertRaises(ValueError):
+            rebuild(old, area=3)
+        with self.assertRaises(TypeError):
+            rebuild(old, nonexistent=3)
+
+    def test_nested_instances_not_affected(self):
+        @datatree
+        class Outer:
+            width: float = 3
+            bracket: Node[Bracket] = Node(Bracket, "width")
+            made: Bracket = dtfield(self_default=lambda self: self.bracket())
+            other: float = dtfield(
+                self_default=lambda self, calls=CALLS: calls.append("other") or 1
+            )
+
+        old = Outer()
+        CALLS.clear()
+        new = rebuild(old, width=4)
+        self.assertEqual(new.made.width, 4)
+        self.assertEqual(new.made.area, 20)
+        self.assertIs(new.other, old.other)
+        self.assertNotIn("other", CALLS)
+
+    def test_helper_function_undeterminable(self):
+        def scaled(s):
+            return s.x * 2
+
+        @datatree
+        class A:
+            x: int = 1
+            y: int = dtfield(self_default=lambda self: helper(self))
+            z: int = dtfield(self_default=lambda self: scaled(self))
+
+        self.assertEqual(rebuild(A(), x=5), A(x=5))
+        self.assertEqual(rebuild(A(), x=5).y, 10)
+        self.assertEqual(rebuild(A(), x=5).z, 10)
+
+    def test_module_helper_undeterminable(self):
+        @datatree
+        class Part:
+            width: float = 1
+            height: float = 2
+            area: float = dtfield(self_default=lambda self: helpers.area(self))
+
+        self.assertEqual(rebuild(Part(), width=10).area, 20)
+
+    def test_getattr_undeterminable(self):
+        @datatree
+        class Part:
+            width: float = 1
+            doubled: float = dtfield(self_default=lambda self: getattr(self, "width") * 2)
+            named: float = dtfield(self_default=lambda self: vars(self)["width"] + 1)
+
+        part = rebuild(Part(), width=10)
+        self.assertEqual((part.doubled, part.named), (20, 11))
+
+    def test_value_type_change(self):
+        @datatree
+        class Typed:
+            v: object = 1
+            kind: str = dtfield(self_default=lambda self: type(self.v).__name__)
+
+        old = Typed()
+        self.assertEqual(rebuild(old, v=1.0).kind, "float")
+        self.assertEqual(rebuild(old, v=True).kind, "bool")
+        self.assertIs(rebuild(old, v=1).kind, old.kind)
+
+
+def helper(s):
+    return s.x * 2
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Tests for replacing fields of datatree instances without chaining BoundNodes.
+"""
+
+import dataclasses
+import types
+import unittest
+from dataclasses import InitVar
+
+import datatrees
+from datatrees import datatree, dtfield, Node
+
+
+@datatree
+class Leaf:
+    a: int = 1
+    b: int = 2
+
+
+@datatree
+class Model:
+    a: int = 1
+    leaf: Node[Leaf] = dtfield(Node(Leaf), init=True)
+    shared: tuple = dtfield(self_default=lambda self: tuple(range(100)))
+    made: Leaf = dtfield(self_default=lambda self: self.leaf())
+
+
+helpers = types.ModuleType("helpers")
+helpers.total = lambda obj: obj.a + obj.leaf().b
+
+
+def chain_depth(bound_node) -> int:
+    depth = 0
+    while bound_node.chained_node is not None:
+        bound_node = bound_node.chained_node
+        depth += 1
+    return depth
+
+
+class TestReplace(unittest.TestCase):
+    def test_replace(self):
+        model = Model(a=2)
+        replaced = datatrees.replace(model, a=3)
+        self.assertEqual(replaced.made, Leaf(3, 2))
+        self.assertIs(replaced.shared, model.shared)
+        self.assertIs(replaced.leaf.parent, replaced)
+
+    def test_successive_replaces_stay_flat(self):
+        model = Model()
+        for i in range(1000):
+            model = datatrees.replace(model, a=i)
+        self.assertEqual(chain_depth(model.leaf), 0)
+        self.assertEqual(model.made, Leaf(999, 2))
+
+    def test_dataclasses_replace_stays_flat(self):
+        model = Model()
+        for i in range(100):
+            model = dataclasses.replace(model, a=i)
+        self.assertEqual(chain_depth(model.leaf), 0)
+        self.assertEqual(model.leaf(), Leaf(99, 2))
+
+    def test_chained_node_kept_flat(self):
+        @datatree
+        class Parent:
+            a: int = 7
+            leaf: Node[Leaf] = Node(Leaf)
+
+        model = Model(leaf=Parent().leaf)
+        self.assertEqual(chain_depth(model.leaf), 1)
+        for i in range(10):
+            model = datatrees.replace(model, a=i)
+        self.assertEqual(chain_depth(model.leaf), 1)
+        self.assertEqual(model.leaf(), Leaf(9, 2))
+
+    def test_initvar_required(self):
+        @datatree
+        class WithInitVar:
+            scale: InitVar[int]
+            value: int = 1
+
+            def __post_init__(self, scale):
+                self.value *= scale
+
+        obj = WithInitVar(2)
+        with self.assertRaises(ValueError):
+            datatrees.replace(obj, value=3)
+        self.assertEqual(datatrees.replace(obj, scale=3, value=3).value, 9)
+
+    def test_module_helper(self):
+        @datatree
+        class WithHelper:
+            a: int = 1
+            leaf: Node[Leaf] = Node(Leaf)
+            total: int = dtfield(self_default=lambda self: helpers.total(self))
+
+        replaced = datatrees.replace(WithHelper(), a=5)
+        self.assertEqual(replaced.total, 7)
+        self.assertEqual(replaced.total, dataclasses.replace(WithHelper(), a=5).total)
+
+    def test_init_false_field(self):
+        with self.assertRaises(ValueError):
+            datatrees.replace(Model(), made=Leaf())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+Tests for dependency aware concurrent self_default evaluation (self_default_executor).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import types
+import unittest
+
+from datatrees import datatree, dtfield, rebuild, Node
+from datatrees.datatrees import _self_default_waves
+
+
+EXECUTOR = ThreadPoolExecutor(4)
+CALLS = []
+
+
+def _meet(barrier: threading.Barrier, value):
+    # Only passes when the parties run concurrently.
+    barrier.wait(timeout=5)
+    return value
+
+
+BARRIER = threading.Barrier(2)
+
+
+@datatree(self_default_executor=EXECUTOR)
+class Mesh:
+    size: float = 2.0
+    bounds: tuple = dtfield(
+        self_default=lambda self: _meet(BARRIER, (0, self.size)), depends_on=("size",)
+    )
+    normals: tuple = dtfield(
+        self_default=lambda self: _meet(BARRIER, (self.size, 1)), depends_on=("size",)
+    )
+    summary: str = dtfield(self_default=lambda self: f"{self.bounds} {self.normals}")
+
+
+def scaled(factor: float = 1.0, size: float = 1.0):
+    return factor * size
+
+
+@datatree(self_default_executor=EXECUTOR)
+class ThroughNode:
+    size: float = 2.0
+    factor: float = dtfield(self_default=lambda self: self.size * 2)
+    other: float = dtfield(self_default=lambda self: self.size * 3)
+    scale: Node[scaled] = Node(scaled, "factor", "size")
+    area: float = dtfield(self_default=lambda self: self.scale())
+
+
+def record(name, value):
+    CALLS.append(name)
+    return value
+
+
+@datatree(self_default_executor=EXECUTOR)
+class Explicit:
+    size: float = 1.0
+    label: str = "x"
+    first: float = dtfield(
+        self_default=lambda self: record("first", self.compute()), depends_on=("size",)
+    )
+    second: float = dtfield(
+        self_default=lambda self: record("second", self.size + 1), depends_on=("size",)
+    )
+    third: float = dtfield(self_default=lambda self: record("third", self.compute()))
+
+    def compute(self):
+        return self.size * 10
+
+
+@datatree(self_default_executor=ThreadPoolExecutor(1))
+class Inner:
+    v: int = 1
+    a: int = dtfield(self_default=lambda self: self.v + 1)
+    b: int = dtfield(self_default=lambda self: self.v + 2)
+
+
+@datatree(self_default_executor=Inner.__datatree_self_default_executor__)
+class Outer:
+    x: Inner = dtfield(self_default=lambda self: Inner(v=1))
+    y: Inner = dtfield(self_default=lambda self: Inner(v=2))
+
+
+def total(obj):
+    return obj.a + 1
+
+
+@datatree(self_default_executor=EXECUTOR)
+class ThroughHelper:
+    v: int = 1
+    a: int = dtfield(self_default=lambda self: self.v + 1)
+    b: int = dtfield(self_default=lambda self: total(self))
+
+
+helpers2 = types.ModuleType("helpers2")
+helpers2.double_base = lambda obj: obj.base * 2
+
+
+@datatree(self_default_executor=EXECUTOR)
+class ThroughModule:
+    v: int = 1
+    base: int = dtfield(self_default=lambda self: self.v + 1)
+    doubled: int = dtfield(self_default=lambda self: helpers2.double_base(self))
+    by_name: int = dtfield(self_default=lambda self: getattr(self, "base") * 3)
+
+
+def fail(self):
+    raise RuntimeError("failed")
+
+
+@datatree(self_default_executor=EXECUTOR)
+class Failing:
+    a: int = dtfield(self_default=fail)
+    b: int = dtfield(self_default=lambda self: 1)
+
+
+class TestSelfDefaultWaves(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_concurrent_wave(self):
+        mesh = Mesh()
+        self.assertEqual(mesh.summary, "(0, 2.0) (2.0, 1)")
+        self.assertEqual(_self_default_waves(Mesh, ("bounds", "normals", "summary")), ((0, 1), (2,)))
+
+    def test_through_node(self):
+        self.assertEqual(ThroughNode().area, 8.0)
+        # area calls scale which reads factor.
+        waves = _self_default_waves(ThroughNode, ("factor", "other", "area"))
+        self.assertEqual(waves, ((0, 1), (2,)))
+
+    def test_explicit_and_undetermined(self):
+        self.assertEqual(Explicit().third, 10.0)
+        # third calls a method so may read any field, it's evaluated after the others.
+        waves = _self_default_waves(Explicit, ("first", "second", "third"))
+        self.assertEqual(waves, ((0, 1), (2,)))
+        self.assertEqual(CALLS[-1], "third")
+
+    def test_explicit_used_by_rebuild(self):
+        explicit = Explicit()
+        CALLS.clear()
+        rebuild(explicit, label="y")
+        # first is declared to depend on size only, third may read label.
+        self.assertEqual(CALLS, ["third"])
+
+    def test_helper_gets_own_wave(self):
+        # b passes self to a helper reading a, its reads can't be determined.
+        self.assertEqual(ThroughHelper().b, 3)
+        self.assertEqual(_self_default_waves(ThroughHelper, ("a", "b")), ((0,), (1,)))
+
+    def test_module_helper_and_getattr_get_own_waves(self):
+        self.assertEqual(
+            _self_default_waves(ThroughModule, ("base", "doubled", "by_name")), ((0,), (1,), (2,))
+        )
+        for _ in range(20):
+            obj = ThroughModule()
+            self.assertEqual((obj.doubled, obj.by_name), (4, 6))
+
+    def test_nested_in_worker(self):
+        # The single worker evaluating Outer's fields must not wait for itself.
+        outer = Outer()
+        self.assertEqual((outer.x.b, outer.y.a), (3, 3))
+
+    def test_error(self):
+        with self.assertRaises(RuntimeError):
+            Failing()
+
+    def test_depends_on_requires_self_default(self):
+        with self.assertRaises(ValueError):
+            dtfield(default=1, depends_on=("a",))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Tests for the generated to_dict and from_dict converters.
+"""
+
+import json
+import unittest
+from typing import Optional
+
+from datatrees import datatree, dtfield, Node, to_dict, from_dict
+
+
+@datatree
+class Hole:
+    radius: float = 1
+    depth: float = 2
+
+
+@datatree(provide_override_field=True)
+class Plate:
+    width: float = 10
+    name: str = "plate"
+    main_hole: Hole = dtfield(default_factory=Hole)
+    spare: Optional[Hole] = None
+    holes: list[Hole] = dtfield(default_factory=list)
+    tags: tuple = ()
+    hole: Node[Hole] = Node(Hole, "radius")
+    area: float = dtfield(self_default=lambda self: self.width**2)
+
+
+class TestSerialization(unittest.TestCase):
+    def test_to_dict_init_only(self):
+        plate = Plate(width=3, holes=[Hole(2), Hole(3)], tags=(1, 2))
+        data = to_dict(plate)
+        self.assertEqual(
+            data,
+            {
+                "width": 3,
+                "name": "plate",
+                "main_hole": {"radius": 1, "depth": 2},
+                "spare": None,
+                "holes": [{"radius": 2, "depth": 2}, {"radius": 3, "depth": 2}],
+                "tags": [1, 2],
+                "radius": 1,
+            },
+        )
+        json.dumps(data)
+
+    def test_to_dict_all_fields(self):
+        data = to_dict(Plate(width=3), init_only=False)
+        self.assertEqual(data["area"], 9)
+        self.assertNotIn("hole", data)
+        self.assertNotIn("override", data)
+
+    def test_round_trip(self):
+        plate = Plate(width=3, spare=Hole(5), holes=[Hole(2)], radius=4)
+        restored = from_dict(Plate, to_dict(plate))
+        self.assertEqual(restored.spare, Hole(5))
+        self.assertEqual(restored.holes, [Hole(2)])
+        self.assertEqual(restored.hole(), Hole(4))
+        self.assertEqual(restored.area, 9)
+        self.assertEqual(to_dict(restored), to_dict(plate))
+
+    def test_from_dict_partial_and_extra(self):
+        plate = from_dict(Plate, {"width": 2, "area": 100, "main_hole": {"depth": 7}})
+        self.assertEqual(plate.width, 2)
+        self.assertEqual(plate.area, 4)
+        self.assertEqual(plate.main_hole, Hole(1, 7))
+        self.assertEqual(plate.holes, [])
+
+    def test_container_round_trip(self):
+        @datatree
+        class Containers:
+            plain: tuple = ()
+            pair: tuple[int, Hole] = (0, Hole())
+            sizes: tuple[int, ...] = ()
+            names: frozenset = frozenset()
+            ids: set[int] = dtfield(default_factory=set)
+            by_name: dict[str, Hole] = dtfield(default_factory=dict)
+            optional: dict[str, Optional[Hole]] = dtfield(default_factory=dict)
+
+        value = Containers(
+            plain=(1, "a"),
+            pair=(2, Hole(3)),
+            sizes=(4, 5),
+            names=frozenset(("a", "b")),
+            ids={6},
+            by_name={"x": Hole(5, 6)},
+            optional={"y": Hole(7), "z": None},
+        )
+        data = json.loads(json.dumps(to_dict(value)))
+        restored = from_dict(Containers, data)
+        self.assertEqual(restored, value)
+        for name in ("plain", "pair", "sizes", "names", "ids"):
+            self.assertIs(type(getattr(restored, name)), type(getattr(value, name)))
+
+    def test_nested_datatree_value_in_untyped_field(self):
+        @datatree
+        class Holder:
+            value: object = None
+
+        self.assertEqual(to_dict(Holder(Hole(3))), {"value": {"radius": 3, "depth": 2}})
+
+
+if __name__ == "__main__":
+    unittest.main()
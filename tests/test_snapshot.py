@@ -0,0 +1,199 @@
+"""
+Tests for datatrees.snapshot().
+"""
+
+import multiprocessing
+import os
+import tempfile
+import unittest
+
+from datatrees import datatree, dtfield, Node, NodeArray, snapshot, Snapshot
+
+
+CALLS = []
+
+
+@datatree
+class Hole:
+    radius: float = 1.5
+    depth: int = 4
+    through: bool = False
+
+
+@datatree
+class Plate:
+    width: float = 40.0
+    label: str = "plate"
+    tags: tuple = ("a", ("b", 1))
+    hole: Node[Hole] = Node(Hole, prefix="hole_")
+    holes: list = dtfield(self_default=lambda self: [self.hole() for _ in range(3)])
+
+
+def make_hole(radius: float = 2.0) -> Hole:
+    CALLS.append(radius)
+    return Hole(radius=radius)
+
+
+@datatree
+class Assembly:
+    plate: Plate = dtfield(default_factory=Plate)
+    spare: Hole | None = None
+    positions: tuple = (1, 2)
+    extra: Node[Hole] = Node(make_hole, prefix="extra_")
+    array: NodeArray[Hole] = NodeArray(Hole, over="positions", param="depth")
+    by_name: dict = dtfield(self_default=lambda self: {"left": self.plate.holes[0], 3: None})
+
+
+def sum_radius(name: str) -> float:
+    with Snapshot.attach(name) as snap:
+        return sum(snap.tables[f"{__name__}.Hole"].column("radius")) + snap.root.extra.radius
+
+
+def pos(index, width=1.0):
+    return index * width
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_columns(self):
+        snap = snapshot(Plate(width=10.0))
+        holes = snap.tables[f"{__name__}.Hole"]
+        self.assertEqual(len(holes), 3)
+        self.assertEqual(holes.column("radius").tolist(), [1.5] * 3)
+        self.assertEqual(holes.column("depth").format, "q")
+        self.assertEqual(holes.column("through").format, "b")
+        self.assertEqual(snap.root.width, 10.0)
+        self.assertEqual(snap.root.label, "plate")
+        self.assertEqual(snap.root.tags, ("a", ("b", 1)))
+
+    def test_references(self):
+        snap = snapshot(Assembly())
+        root = snap.root
+        self.assertEqual(root.plate.holes[1].radius, 1.5)
+        self.assertIsNone(root.spare)
+        # The same instance is stored once.
+        self.assertEqual(root.by_name, {"left": root.plate.holes[0], 3: None})
+
+    def test_materialize(self):
+        snap = snapshot(Assembly(), materialize=True)
+        self.assertEqual(CALLS, [2.0])
+        self.assertEqual(snap.root.extra.radius, 2.0)
+        self.assertEqual([h.depth for h in snap.root.array], [1, 2])
+
+    def test_materialize_names(self):
+        snap = snapshot(Assembly(), materialize=("array",))
+        self.assertEqual(CALLS, [])
+        self.assertEqual(len(snap.root.array), 2)
+        with self.assertRaises(AttributeError):
+            snap.root.extra
+
+        snap = snapshot(Assembly())
+        self.assertEqual(CALLS, [])
+        self.assertNotIn("array", snap.root._asdict())
+        self.assertNotIn("hole", snap.root.plate._asdict())
+
+    def test_required_arguments(self):
+        @datatree
+        class Row:
+            width: float = 2.0
+            pos: Node[pos] = Node(pos, "width")
+            positions: tuple = dtfield(self_default=lambda self: (self.pos(1), self.pos(2)))
+
+        snap = snapshot(Row(), materialize=True)
+        self.assertEqual(snap.root.positions, (2.0, 4.0))
+        self.assertNotIn("pos", snap.root._asdict())
+
+    def test_read_only(self):
+        snap = snapshot(Plate())
+        with self.assertRaises(AttributeError):
+            snap.root.width = 1.0
+        with self.assertRaises(TypeError):
+            snap.tables[f"{__name__}.Hole"].column("radius")[0] = 1.0
+
+    def test_buffer_round_trip(self):
+        snap = snapshot(Assembly())
+        data = snap.to_bytes()
+        self.assertEqual(len(data), snap.nbytes)
+        self.assertEqual(len(data) % 8, 0)
+        copy = Snapshot.from_buffer(data)
+        self.assertEqual(repr(copy.root), repr(snap.root))
+        # Numeric columns view the buffer.
+        column = copy.tables[f"{__name__}.Hole"].column("radius")
+        self.assertIs(column.obj, data)
+
+    def test_save_load(self):
+        snap = snapshot(Assembly())
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "assembly.dtsnap")
+            snap.save(path)
+            loaded = Snapshot.load(path)
+            self.assertEqual(repr(loaded.root), repr(snap.root))
+            self.assertEqual(loaded.root.plate.holes[2].depth, 4)
+            del loaded
+
+    def test_shared_memory(self):
+        snap = snapshot(Assembly())
+        shm = snap.to_shared_memory()
+        try:
+            attached = Snapshot.attach(shm.name)
+            self.assertEqual(repr(attached.root), repr(snap.root))
+            root = attached.root
+            attached.close()
+            with self.assertRaises(ValueError):
+                root.plate
+            # The block can be closed once the attached views are released.
+            shm.close()
+        finally:
+            shm.unlink()
+
+    def test_shared_memory_worker(self):
+        snap = snapshot(Assembly(), materialize=True)
+        shm = snap.to_shared_memory()
+        try:
+            with multiprocessing.Pool(2) as pool:
+                results = pool.map(sum_radius, [shm.name] * 2)
+            # Six holes of radius 1.5, the extra hole (2.0) and the extra radius again.
+            self.assertEqual(results, [1.5 * 6 + 2.0 + 2.0] * 2)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def test_mixed_column(self):
+        @datatree
+        class Mixed:
+            v: object = 1
+
+        @datatree
+        class Outer:
+            items: list = dtfield(default_factory=lambda: [Mixed(v=1), Mixed(v=1.5), Mixed(v=2**70)])
+
+        table = snapshot(Outer()).tables[f"{__name__}.{Mixed.__qualname__}"]
+        self.assertEqual(table.column("v"), [1, 1.5, 2**70])
+
+    def test_deep(self):
+        @datatree
+        class Link:
+            next: object = None
+
+        head = None
+        for _ in range(3000):
+            head = Link(next=head)
+        snap = snapshot(head)
+        record, count = snap.root, 0
+        while record is not None:
+            record, count = record.next, count + 1
+        self.assertEqual(count, 3000)
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            snapshot(1)
+        with self.assertRaises(TypeError):
+            snapshot(Plate(label=object()))
+        with self.assertRaises(ValueError):
+            Snapshot.from_buffer(b"\0" * 16)
+
+
+if __name__ == "__main__":
+    unittest.main()
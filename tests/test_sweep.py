@@ -0,0 +1,121 @@
+"""
+Tests for parameter sweeps with shared subtree results.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import unittest
+
+from datatrees import datatree, dtfield, Node, sweep, SweepResult
+
+
+CALLS: list[str] = []
+
+
+@datatree(frozen=True)
+class Hole:
+    radius: float = 1
+
+    def __post_init__(self):
+        CALLS.append("hole")
+
+
+@datatree(frozen=True)
+class Panel:
+    width: float = 10
+    thickness: float = 1
+
+    def __post_init__(self):
+        CALLS.append("panel")
+
+
+@datatree(frozen=True)
+class Box:
+    width: float = 10
+    thickness: float = 1
+    radius: float = 1
+    panel: Node[Panel] = Node(Panel, "width", "thickness")
+    hole: Node[Hole] = Node(Hole, "radius")
+    panels: tuple = dtfield(self_default=lambda self: (self.panel(), self.panel()))
+    holes: tuple = dtfield(self_default=lambda self: tuple(self.hole() for _ in range(3)))
+
+
+def volume(box: Box) -> float:
+    return box.width * box.thickness * len(box.holes) * box.radius
+
+
+def typed(v: object = 0):
+    return ("f", v, type(v).__name__)
+
+
+@datatree
+class Typed:
+    v: object = 0
+    node: Node[typed] = Node(typed, "v")
+    made: tuple = dtfield(self_default=lambda self: self.node())
+
+
+class TestSweep(unittest.TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_grid(self):
+        results = sweep(Box, {"thickness": 2}, grid={"width": [1, 2], "radius": [3, 4, 5]})
+        self.assertEqual(len(results), 6)
+        self.assertIsInstance(results[0], SweepResult)
+        self.assertEqual(results[0].params, {"thickness": 2, "width": 1, "radius": 3})
+        self.assertEqual(results[5].params, {"thickness": 2, "width": 2, "radius": 5})
+        for result in results:
+            self.assertEqual(result.value, Box(**result.params))
+
+    def test_shared_subtrees(self):
+        results = sweep(Box, grid={"radius": [1, 2, 3, 4]})
+        # Panels don't depend on radius so they are built once and shared.
+        self.assertEqual(CALLS.count("panel"), 1)
+        self.assertIs(results[0].value.panels, results[3].value.panels)
+        # Each distinct radius builds one hole.
+        self.assertEqual(CALLS.count("hole"), 4)
+
+    def test_variants_and_evaluate(self):
+        results = sweep(Box, variants=[{"width": 1}, {"width": 2}], evaluate=volume)
+        self.assertEqual([r.value for r in results], [3, 6])
+
+    def test_heterogeneous_variants(self):
+        variants = [{"radius": 3}, {"width": 2}, {"radius": 4}]
+        results = sweep(Box, {"thickness": 2}, variants=variants)
+        for result in results:
+            self.assertEqual(result.value, Box(**result.params))
+        self.assertEqual(results[1].value.radius, 1)
+
+    def test_memo_not_active_after_sweep(self):
+        sweep(Box, grid={"radius": [1]})
+        CALLS.clear()
+        box = Box()
+        box.hole()
+        self.assertEqual(CALLS.count("hole"), 4)
+
+    def test_executors(self):
+        expected = [volume(Box(width=w, radius=r)) for w in (1, 2, 3) for r in (1, 2)]
+        for executor_type in (ThreadPoolExecutor, ProcessPoolExecutor):
+            with executor_type(max_workers=2) as executor:
+                results = sweep(
+                    Box,
+                    grid={"width": [1, 2, 3], "radius": [1, 2]},
+                    executor=executor,
+                    evaluate=volume,
+                    chunksize=2,
+                )
+            self.assertEqual([r.value for r in results], expected)
+
+    def test_equal_values_of_different_types(self):
+        results = sweep(Typed, grid={"v": [1, True, 1.0]}, evaluate=lambda t: t.made)
+        self.assertEqual(
+            [r.value for r in results], [("f", 1, "int"), ("f", True, "bool"), ("f", 1.0, "float")]
+        )
+
+    def test_requires_grid_or_variants(self):
+        with self.assertRaises(ValueError):
+            sweep(Box)
+
+
+if __name__ == "__main__":
+    unittest.main()
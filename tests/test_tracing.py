@@ -0,0 +1,100 @@
+"""
+Tests for tracing BoundNode calls and self_default evaluations.
+"""
+
+import os
+import tempfile
+import unittest
+
+import datatrees
+from datatrees import datatree, dtfield, Node
+
+
+@datatree
+class Leaf:
+    a: int = 1
+    b: int = 2
+
+
+def make_leaves(a: int = 1, count: int = 2) -> tuple:
+    return tuple(Leaf(a) for _ in range(count))
+
+
+@datatree
+class Branch:
+    a: int = 3
+    leaf: Node[Leaf] = Node(Leaf, "a")
+    leaves: Node[make_leaves] = Node(make_leaves, "a")
+    made: Leaf = dtfield(self_default=lambda self: self.leaf())
+
+
+@datatree
+class Root:
+    a: int = 5
+    branch: Node[Branch] = Node(Branch, "a")
+    made: Branch = dtfield(self_default=lambda self: self.branch())
+
+
+class TestTracing(unittest.TestCase):
+    def test_records(self):
+        with datatrees.trace() as t:
+            root = Root()
+            root.made.leaves(count=3)
+
+        paths = [r.path for r in t.records]
+        self.assertIn(("Root.made", "Root.branch", "Branch.made", "Branch.leaf"), paths)
+        self.assertIn(("Branch.leaves",), paths)
+        leaf_record = next(r for r in t.records if r.path[-1] == "Branch.leaf")
+        self.assertEqual(leaf_record.target, "Leaf")
+        self.assertEqual(leaf_record.arg_count, 1)
+        self.assertFalse(leaf_record.is_self_default)
+        made = next(r for r in t.records if r.path == ("Root.made",))
+        self.assertTrue(made.is_self_default)
+        self.assertGreaterEqual(made.wall_time, made.self_time)
+        self.assertLessEqual(sum(r.self_time for r in t.records), made.wall_time + 1e-3)
+        leaves_record = next(r for r in t.records if r.path == ("Branch.leaves",))
+        self.assertEqual(leaves_record.arg_count, 2)
+
+    def test_disabled_after_exit(self):
+        with datatrees.trace() as t:
+            Root()
+        count = len(t.records)
+        Root()
+        self.assertEqual(len(t.records), count)
+        self.assertIsNone(datatrees.datatrees._TRACER)
+
+    def test_folded_and_summary(self):
+        with datatrees.trace() as t:
+            Root()
+        folded = t.folded()
+        self.assertIn("Root.made;Root.branch;Branch.made;Branch.leaf ", folded)
+        targets = {s.target: s for s in t.summary()}
+        self.assertEqual(targets["Leaf"].calls, 1)
+        self.assertEqual(targets["Branch"].calls, 2)  # The node call and its self_default.
+        self.assertIn("Leaf", t.summary_table())
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "out.folded")
+            t.write_folded(path)
+            with open(path) as f:
+                self.assertEqual(f.read().strip(), folded)
+
+    def test_exception_restores_state(self):
+        def boom(a: int = 1):
+            raise ValueError()
+
+        @datatree
+        class Bad:
+            a: int = 1
+            node: Node[boom] = Node(boom)
+
+        with datatrees.trace() as t:
+            with self.assertRaises(ValueError):
+                Bad().node()
+            Root()
+        self.assertEqual(t.records[0].path, ("Bad.node",))
+        self.assertIn(("Root.made",), [r.path for r in t.records])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Tests for the non-recursive tree walker.
+"""
+
+import sys
+import unittest
+
+from datatrees import datatree, dtfield, Node, BoundNode, walk
+
+
+@datatree
+class Hole:
+    radius: float = 1.5
+
+
+@datatree
+class Plate:
+    width: float = 40
+    hole: Node[Hole] = Node(Hole, prefix="hole_")
+    holes: list = dtfield(self_default=lambda self: [self.hole() for _ in range(2)])
+
+
+@datatree
+class Assembly:
+    plate: Node[Plate] = Node(Plate)
+    top: Plate = dtfield(self_default=lambda self: self.plate())
+    parts: dict = dtfield(self_default=lambda self: {"a": self.top, "b": self.plate(width=5)})
+
+
+@datatree
+class Chain:
+    n: int = 0
+    child: Node["Chain"] = dtfield(Node(lambda n: None), init=True)
+
+
+def names(entries):
+    return [(path, name) for path, name, _ in entries]
+
+
+def offset(index, step=1):
+    return index * step
+
+
+class TestWalk(unittest.TestCase):
+    def test_dfs(self):
+        self.assertEqual(
+            names(walk(Assembly())),
+            [
+                ((), "plate"),
+                ((), "top"),
+                (("top",), "hole"),
+                (("top",), "holes"),
+                ((), "parts"),
+                (("parts", "b"), "hole"),
+                (("parts", "b"), "holes"),
+            ],
+        )
+
+    def test_bfs(self):
+        entries = names(walk(Assembly(), order="bfs"))
+        self.assertEqual(entries[:3], [((), "plate"), ((), "top"), ((), "parts")])
+        self.assertEqual(
+            entries[3:],
+            [(("top",), "hole"), (("top",), "holes"), (("parts", "b"), "hole"), (("parts", "b"), "holes")],
+        )
+        # The shared top plate is walked once, at its first path.
+        self.assertNotIn((("parts", "a"), "hole"), entries)
+
+    def test_values(self):
+        entries = list(walk(Plate()))
+        self.assertIsInstance(entries[0][2], BoundNode)
+        self.assertEqual(entries[1][2], [Hole(), Hole()])
+
+    def test_materialize(self):
+        entries = list(walk(Plate(), materialize=True))
+        self.assertEqual(entries[0], ((), "hole", Hole()))
+        # Materialized results are walked too.
+        self.assertEqual(
+            names(walk(Assembly(), materialize=True))[:3],
+            [((), "plate"), (("plate",), "hole"), (("plate",), "holes")],
+        )
+
+    def test_materialize_required_arguments(self):
+        @datatree
+        class Row:
+            step: int = 2
+            offset: Node[offset] = Node(offset, "step")
+
+        ((path, name, value),) = walk(Row(), materialize=True)
+        self.assertIsInstance(value, BoundNode)
+
+    def test_prune(self):
+        calls = []
+
+        def prune(path, name, value):
+            calls.append(name)
+            return name == "holes"
+
+        self.assertEqual(names(walk(Plate(), prune=prune)), [((), "hole")])
+        self.assertEqual(calls, ["hole", "holes"])
+
+    def test_prune_before_materialize(self):
+        entries = list(walk(Plate(), materialize=True, prune=lambda p, n, v: n == "hole"))
+        self.assertEqual(names(entries), [((), "holes")])
+
+    def test_deeper_than_recursion_limit(self):
+        depth = sys.getrecursionlimit() * 2
+        chain = Chain(n=0)
+        for n in range(1, depth):
+            chain = Chain(n=n, child=chain)
+        for order in ("dfs", "bfs"):
+            entries = list(walk(chain, order=order))
+            self.assertEqual(len(entries), depth)
+            self.assertEqual(len(entries[-1][0]), depth - 1)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            list(walk(Plate(), order="post"))
+        with self.assertRaises(TypeError):
+            list(walk(object()))
+
+
+if __name__ == "__main__":
+    unittest.main()